@@ -10,7 +10,8 @@ from agents.registry import (
     get_agent,
     get_all_agents,
     register_agent,
-    set_default_model
+    set_default_model,
+    model_scope
 )
 
 # Import base classes
@@ -0,0 +1,169 @@
+# agents/async_llm.py
+"""
+Async execution of CrewAI tasks
+
+CrewAI's agent executor only calls LLMs synchronously, so running many
+tasks at once needs a thread per in-flight request. For the agents in this
+package, which have no tools, executing a task is a single LLM call: the
+prompt CrewAI would send, and the "Final Answer" of the reply. This module
+builds that prompt with CrewAI's own prompt templates and awaits the LLM
+client's async API instead, so one event loop can keep hundreds of requests
+in flight. Replies that aren't a plain final answer are handed to CrewAI's
+executor, as the sync path would.
+"""
+import asyncio
+from crewai.agents.parser import CrewAgentParser, AgentFinish, OutputParserException
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.utilities.converter import generate_model_description
+from crewai.utilities.prompts import Prompts
+from crewai.utilities.token_counter_callback import TokenCalcHandler
+
+def build_task_messages(agent, task, context=None):
+    """
+    Build the messages CrewAI sends for a task executed by a tool-less agent
+    
+    Args:
+        agent: CrewAI Agent
+        task: CrewAI Task
+        context: Optional context from earlier tasks
+    
+    Returns:
+        list: Chat messages
+    """
+    task_prompt = task.prompt()
+    
+    # Same output format instructions as Agent.execute_task
+    output_model = task.output_json or task.output_pydantic
+    if output_model:
+        task_prompt += "\n" + agent.i18n.slice("formatted_task_instructions").format(
+            output_format=generate_model_description(output_model)
+        )
+    
+    if context:
+        task_prompt = agent.i18n.slice("task_with_context").format(task=task_prompt, context=context)
+    
+    prompt = Prompts(
+        agent=agent,
+        tools=[],
+        i18n=agent.i18n,
+        use_system_prompt=agent.use_system_prompt,
+        system_template=agent.system_template,
+        prompt_template=agent.prompt_template,
+        response_template=agent.response_template
+    ).task_execution()
+    
+    def format_prompt(template):
+        return template.replace("{input}", task_prompt).replace("{tool_names}", "").replace("{tools}", "").rstrip()
+    
+    if "system" in prompt:
+        return [
+            {"role": "system", "content": format_prompt(prompt["system"])},
+            {"role": "user", "content": format_prompt(prompt["user"])}
+        ]
+    return [{"role": "user", "content": format_prompt(prompt["prompt"])}]
+
+async def acall_llm(llm, messages, callbacks=None, stop=None):
+    """
+    Call a CrewAI LLM through its client's async API
+    
+    LLMs with their own acall() (such as test doubles) are awaited directly;
+    others are called with litellm.acompletion and the same parameters
+    LLM.call would use.
+    
+    Args:
+        llm: CrewAI LLM
+        messages: Chat messages
+        callbacks: Optional LiteLLM callbacks, given the usage like LLM.call does
+        stop: Optional stop words added to the LLM's own
+    
+    Returns:
+        str: Response text
+    """
+    if hasattr(llm, "acall"):
+        return await llm.acall(messages, callbacks=callbacks, stop=stop)
+    
+    import litellm
+    
+    params = {
+        "model": llm.model,
+        "messages": llm._format_messages_for_provider(messages),
+        "timeout": llm.timeout,
+        "temperature": llm.temperature,
+        "top_p": llm.top_p,
+        "n": llm.n,
+        "stop": sorted(set((llm.stop or []) + (stop or []))) or None,
+        "max_tokens": llm.max_tokens or llm.max_completion_tokens,
+        "presence_penalty": llm.presence_penalty,
+        "frequency_penalty": llm.frequency_penalty,
+        "logit_bias": llm.logit_bias,
+        "response_format": llm.response_format,
+        "seed": llm.seed,
+        "logprobs": llm.logprobs,
+        "top_logprobs": llm.top_logprobs,
+        "api_base": llm.api_base,
+        "base_url": llm.base_url,
+        "api_version": llm.api_version,
+        "api_key": llm.api_key,
+        "stream": False,
+        "reasoning_effort": llm.reasoning_effort,
+        **llm.additional_params
+    }
+    params = {key: value for key, value in params.items() if value is not None}
+    
+    response = await litellm.acompletion(**params)
+    
+    usage = getattr(response, "usage", None)
+    if usage:
+        for callback in callbacks or []:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(kwargs=params, response_obj={"usage": usage}, start_time=0, end_time=0)
+    
+    return response.choices[0].message.content or ""
+
+async def aexecute_crewai_task(agent, task, context=None):
+    """
+    Execute a task with a tool-less CrewAI agent without blocking the event loop
+    
+    Token usage is added to the agent's token counter, as CrewAI's executor
+    would, and also returned so concurrent tasks sharing the agent can
+    account for their own usage.
+    
+    Args:
+        agent: CrewAI Agent
+        task: CrewAI Task
+        context: Optional context from earlier tasks
+    
+    Returns:
+        tuple: (result text, (prompt_tokens, completion_tokens))
+    """
+    messages = build_task_messages(agent, task, context)
+    stop = [agent.i18n.slice("observation")]
+    
+    usage = TokenProcess()
+    answer = await acall_llm(agent.llm, messages, callbacks=[TokenCalcHandler(usage)], stop=stop)
+    summary = usage.get_summary()
+    
+    agent._token_process.sum_prompt_tokens(summary.prompt_tokens)
+    agent._token_process.sum_completion_tokens(summary.completion_tokens)
+    agent._token_process.sum_successful_requests(summary.successful_requests)
+    
+    try:
+        parsed = CrewAgentParser(agent=agent).parse(answer)
+    except OutputParserException:
+        parsed = None
+    
+    if isinstance(parsed, AgentFinish):
+        return parsed.output, (summary.prompt_tokens, summary.completion_tokens)
+    
+    # Anything else needs CrewAI's executor loop; run it on a copy of the
+    # agent, since the agent keeps the executor of the task it is running
+    print(f"No final answer from {agent.role} agent, continuing with the CrewAI executor")
+    fallback_agent = agent.copy()
+    fallback_agent.crew = None
+    result = await asyncio.to_thread(fallback_agent.execute_task, task, context)
+    fallback_tokens = fallback_agent._token_process.get_summary()
+    
+    return result, (
+        summary.prompt_tokens + fallback_tokens.prompt_tokens,
+        summary.completion_tokens + fallback_tokens.completion_tokens
+    )
\ No newline at end of file
@@ -1,11 +1,21 @@
 # agents/base.py
+import asyncio
+import copy
+import time
 from crewai import Agent
-from langchain_openai import ChatOpenAI
-from utils.config import get_openai_api_key
+from agents.registry import registry
+from agents.routing import get_router
+from utils.instrumentation import span, get_agent_token_usage, record_agent_tokens
+from agents.async_llm import aexecute_crewai_task
+from utils.retry import get_retry_policy, classify_error, TaskExecutionError
+from utils.singleflight import get_single_flight, request_key
 
 class BaseAgent:
     """Base class for all Meeting analysis agents"""
     
+    # Set by the registry when the agent class is registered
+    agent_id = None
+    
     def __init__(self, role, goal, backstory, model="gpt-4o"):
         """
         Initialize a base agent
@@ -24,34 +34,39 @@ class BaseAgent:
         
     def _create_llm(self, model):
         """
-        Create a LangChain OpenAI LLM instance
+        Get the shared LLM for a model
         
         Args:
             model: OpenAI model to use
             
         Returns:
-            ChatOpenAI: LangChain OpenAI instance
+            RateLimitedLLM: CrewAI LLM, rate limited per request
         """
-        api_key = get_openai_api_key()
-        return ChatOpenAI(api_key=api_key, model=model)
+        return registry.get_llm(model)
         
     def create_agent(self):
         """
         Create a CrewAI agent
         
+        Every call builds a new agent around its own copy of the shared LLM:
+        a CrewAI agent keeps the executor, crew and tools handler of the task
+        it is running, and its executor sets the stop words on the LLM, so
+        neither may be shared between tasks or runs that can execute at the
+        same time. This covers tasks the crews' helpers (refinement,
+        research, translation) execute directly as well as crew kickoffs.
+        
         Returns:
             Agent: CrewAI agent
         """
-        agent = Agent(
-            role=self.role,
-            goal=self.goal,
-            backstory=self.backstory,
-            verbose=True,
-            allow_delegation=True,
-            llm=self.llm
-        )
+        config = {
+            "role": self.role,
+            "goal": self.goal,
+            "backstory": self.backstory,
+            "verbose": True,
+            "allow_delegation": True
+        }
         
-        return agent
+        return Agent(llm=copy.copy(self.llm), **config)
     
     def process_input(self, input_data):
         """
@@ -80,28 +95,252 @@ class BaseAgent:
             
         return content
         
-    def execute_task(self, task, max_iterations=1):
+    def execute_task(self, task, max_iterations=None):
         """
         Execute a task directly with this agent
         
+        Transient errors (rate limits, timeouts, server errors) are retried
+        with exponential backoff and jitter under the configured retry
+        policy; other errors, running out of attempts or passing the
+        policy's deadline end the task. A caller running the same task (same
+        agent, model and prompt) as one already in flight gets that run's
+        result, or its error.
+        
         Args:
             task: The task to execute
-            max_iterations: Maximum number of execution attempts
+            max_iterations: Maximum number of execution attempts (default: TASK_RETRY_ATTEMPTS)
             
         Returns:
             str: Task result
+            
+        Raises:
+            TaskExecutionError: If the task failed and won't be retried
+        """
+        # Prefer the agent the task was built for, which may be on a routed model
+        agent = task.agent or self.create_agent()
+        
+        # The same task in flight elsewhere (e.g. for another user opening
+        # the same Meeting) is awaited instead of run again
+        return get_single_flight("agent_task").do(
+            self._task_key(agent, task),
+            lambda: self._run_task(agent, task, max_iterations)
+        )
+    
+    def _run_task(self, agent, task, max_iterations):
+        """Run a task's attempts for execute_task"""
+        policy = get_retry_policy(max_iterations)
+        started = time.monotonic()
+        attempt = 0
+        
+        with span("agent", task.name or self.role, agent=self.role) as agent_span:
+            while True:
+                attempt += 1
+                tokens_before = get_agent_token_usage(agent)
+                
+                try:
+                    print(f"Executing task with {self.role} agent...")
+                    
+                    # Each LLM request takes the shared chat rate limiter itself
+                    # (see agents/rate_limited_llm.py)
+                    try:
+                        result = agent.execute_task(task)
+                    finally:
+                        record_agent_tokens(agent_span, agent, tokens_before)
+                    
+                    print(f"Task completed successfully with {self.role} agent")
+                    return result
+                except Exception as e:
+                    delay = self._handle_failure(e, task, policy, attempt, started, agent_span)
+                
+                # A retry after a rate limit also waits until the limiter's pause is over
+                time.sleep(delay)
+    
+    async def aexecute_task(self, task, max_iterations=None, context=None):
         """
-        agent = self.create_agent()
+        Execute a task directly with this agent without blocking the event loop
+        
+        The async counterpart of execute_task: the LLM request is awaited
+        through the client's async API instead of occupying a thread, and
+        an attempt still in flight at the retry policy's deadline is
+        cancelled.
         
-        try:
-            print(f"Executing task with {self.role} agent...")
+        Args:
+            task: The task to execute
+            max_iterations: Maximum number of execution attempts (default: TASK_RETRY_ATTEMPTS)
+            context: Optional context from earlier tasks
+            
+        Returns:
+            str: Task result
+            
+        Raises:
+            TaskExecutionError: If the task failed and won't be retried
+        """
+        agent = task.agent or self.create_agent()
+        
+        return await get_single_flight("agent_task").ado(
+            self._task_key(agent, task, context),
+            lambda: self._arun_task(agent, task, max_iterations, context)
+        )
+    
+    async def _arun_task(self, agent, task, max_iterations, context):
+        """Run a task's attempts for aexecute_task"""
+        policy = get_retry_policy(max_iterations)
+        started = time.monotonic()
+        attempt = 0
+        
+        with span("agent", task.name or self.role, agent=self.role) as agent_span:
+            while True:
+                attempt += 1
+                
+                try:
+                    print(f"Executing task with {self.role} agent...")
+                    
+                    result, tokens = await asyncio.wait_for(
+                        aexecute_crewai_task(agent, task, context),
+                        policy.remaining(started)
+                    )
+                    
+                    # Tasks sharing the agent run concurrently, so record this
+                    # task's own usage rather than the change in the agent's totals
+                    agent_span.record_tokens(tokens[0], tokens[1], model=getattr(agent.llm, "model", None))
+                    
+                    print(f"Task completed successfully with {self.role} agent")
+                    return result
+                except Exception as e:
+                    delay = self._handle_failure(e, task, policy, attempt, started, agent_span)
+                
+                await asyncio.sleep(delay)
+    
+    def _task_key(self, agent, task, context=None):
+        """
+        Get the single-flight key of a task: everything its result depends on
+        
+        Args:
+            agent: CrewAI agent that runs the task
+            task: The task
+            context: Optional context from earlier tasks
+            
+        Returns:
+            str: Request key
+        """
+        output_model = task.output_json or task.output_pydantic
+        return request_key(
+            self.role,
+            getattr(agent.llm, "model", self.model),
+            task.description,
+            task.expected_output,
+            output_model.__name__ if output_model else None,
+            context
+        )
+    
+    def _handle_failure(self, error, task, policy, attempt, started, agent_span):
+        """
+        Decide what to do after a failed attempt at a task
+        
+        Args:
+            error: Exception the attempt failed with
+            task: The task
+            policy: RetryPolicy
+            attempt: Number of attempts made so far
+            started: time.monotonic() when the first attempt started
+            agent_span: The task's span
+            
+        Returns:
+            float: Seconds to wait before the next attempt
+            
+        Raises:
+            TaskExecutionError: If the task won't be retried
+        """
+        category = classify_error(error)
+        print(f"Error in {self.role} agent ({category}): {str(error)}")
+        
+        delay = policy.next_delay(error, attempt, started)
+        if delay is None:
+            agent_span.error = str(error)
+            raise TaskExecutionError(
+                f"Task {task.name or 'task'} failed with {self.role} agent after {attempt} attempt(s): {str(error)}",
+                task_name=task.name,
+                agent_role=self.role,
+                category=category,
+                attempts=attempt
+            ) from error
+        
+        print(f"Retrying in {delay:.1f}s ({policy.max_attempts - attempt} attempts remaining)")
+        agent_span.record_retry()
+        return delay
+    
+    def execute_with_escalation(self, build_task, validate):
+        """
+        Execute a task, escalating to a larger model if the output is invalid
+        
+        The task is first built and run on the model tier the routing policy
+        selects. If validate rejects the result, the task is rebuilt for the
+        next tier in the policy's escalation order and run again, up to this
+        agent's own model (the one the task would use without routing).
+        
+        Args:
+            build_task: Callable taking an agent instance and returning a task
+            validate: Callable taking a result and returning True if it is usable
+            
+        Returns:
+            str: Task result (the last attempt's result if none validate)
+            
+        Raises:
+            TaskExecutionError: If a task failed and won't be retried
+        """
+        task = build_task(self)
+        result = self.execute_task(task)
+        current_model = getattr(getattr(task.agent, "llm", None), "model", self.model)
+        
+        while not validate(result):
+            next_model = get_router().escalate(current_model, ceiling=self.model)
+            if not next_model or not self.agent_id:
+                break
+            
+            print(f"Output from {self.role} agent failed validation on {current_model}, escalating to {next_model}")
+            
+            # Pin the larger model so routing doesn't send the rebuilt task back down
+            with registry.model_scope(agent_models={self.agent_id: next_model}):
+                agent = registry.get_agent(self.agent_id)
+                task = build_task(agent)
+            
             result = agent.execute_task(task)
-            print(f"Task completed successfully with {self.role} agent")
-            return result
-        except Exception as e:
-            print(f"Error in {self.role} agent: {str(e)}")
-            if max_iterations > 1:
-                print(f"Retrying... ({max_iterations-1} attempts remaining)")
-                return self.execute_task(task, max_iterations-1)
-            else:
-                return f"Error executing task with {self.role} agent: {str(e)}"
\ No newline at end of file
+            current_model = next_model
+        
+        return result
+    
+    async def aexecute_with_escalation(self, build_task, validate):
+        """
+        Execute a task without blocking the event loop, escalating to a larger model if the output is invalid
+        
+        The async counterpart of execute_with_escalation.
+        
+        Args:
+            build_task: Callable taking an agent instance and returning a task
+            validate: Callable taking a result and returning True if it is usable
+            
+        Returns:
+            str: Task result (the last attempt's result if none validate)
+            
+        Raises:
+            TaskExecutionError: If a task failed and won't be retried
+        """
+        task = build_task(self)
+        result = await self.aexecute_task(task)
+        current_model = getattr(getattr(task.agent, "llm", None), "model", self.model)
+        
+        while not validate(result):
+            next_model = get_router().escalate(current_model, ceiling=self.model)
+            if not next_model or not self.agent_id:
+                break
+            
+            print(f"Output from {self.role} agent failed validation on {current_model}, escalating to {next_model}")
+            
+            with registry.model_scope(agent_models={self.agent_id: next_model}):
+                agent = registry.get_agent(self.agent_id)
+                task = build_task(agent)
+            
+            result = await agent.aexecute_task(task)
+            current_model = next_model
+        
+        return result
\ No newline at end of file
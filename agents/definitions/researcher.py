@@ -119,22 +119,34 @@ class ResearcherAgent(BaseAgent):
         """
         from agents.tasks.research import ResearchTask
         
-        # Create and execute a topic extraction task
-        task = ResearchTask.create_topic_extraction_task(
-            agent=self,
-            summary_content=summary_content,
-            max_topics=max_topics
+        # Create and execute a topic extraction task, escalating if no topics come back
+        result = self.execute_with_escalation(
+            lambda agent: ResearchTask.create_topic_extraction_task(
+                agent=agent,
+                summary_content=summary_content,
+                max_topics=max_topics
+            ),
+            lambda result: len(parse_topic_list(str(result))) > 0
         )
         
-        result = self.execute_task(task)
-        
-        # Parse the result to extract topics
-        topics = []
-        for line in result.strip().split('\n'):
-            if line.strip().startswith('- ') or line.strip().startswith('* '):
-                topics.append(line.strip()[2:])  # Remove the bullet
-            elif ':' in line and len(line.split(':')[0]) < 30:
-                # Format may be "Topic: description"
-                topics.append(line.split(':')[0].strip())
-        
-        return topics[:max_topics]
\ No newline at end of file
+        return parse_topic_list(str(result))[:max_topics]
+
+def parse_topic_list(result):
+    """
+    Parse a topic extraction result into a list of topics
+    
+    Args:
+        result: Topic extraction result text
+        
+    Returns:
+        list: List of topics
+    """
+    topics = []
+    for line in result.strip().split('\n'):
+        if line.strip().startswith('- ') or line.strip().startswith('* '):
+            topics.append(line.strip()[2:])  # Remove the bullet
+        elif ':' in line and len(line.split(':')[0]) < 30:
+            # Format may be "Topic: description"
+            topics.append(line.split(':')[0].strip())
+    
+    return topics
\ No newline at end of file
@@ -1,6 +1,21 @@
 # agents/definitions/transcriber.py
+import asyncio
+import hashlib
 from agents.base import BaseAgent
 from agents.registry import register_agent
+from utils.artifacts import artifact_key, load_artifact, save_artifact, remember_artifact
+from utils.chunking import chunk_transcript, hash_chunk, get_chunk_cache, count_reachable_chunks
+from utils.concurrency import map_concurrently
+from utils.metrics import record_cache_lookup
+from utils.prompt_compression import resolve_compression_options
+from utils.tokens import count_tokens
+
+# Version of the refinement prompt and validation; bump it when either
+# changes so stored refined transcripts are no longer reused
+TRANSCRIBER_VERSION = "1"
+
+# Opens the raw-transcript fallback returned when refinement fails
+FALLBACK_PREFIX = "PROCESSED TRANSCRIPT: "
 
 @register_agent("transcriber")
 class TranscriberAgent(BaseAgent):
@@ -29,20 +44,233 @@ class TranscriberAgent(BaseAgent):
         """
         print(f"Processing transcript with {len(transcript_text)} characters")
         
-        # Create and execute a transcription task
-        from agents.tasks.transcription import TranscriptionTask
-        
-        task = TranscriptionTask.create_refinement_task(self, transcript_text)
+        # In incremental mode, refine chunk by chunk so unchanged chunks come from the cache
+        chunk_cache = get_chunk_cache()
+        if chunk_cache is not None:
+            return self.process_transcript_chunks(transcript_text, chunk_cache)
         
         try:
             print("Executing transcriber task...")
-            result = self.execute_task(task)
+            result = self.refine_text(transcript_text)
             print(f"Transcriber task completed successfully, result length: {len(str(result))}")
             return result
         except Exception as e:
             print(f"Error in transcriber agent: {str(e)}")
             # Return a simplified transcript as fallback
-            return f"PROCESSED TRANSCRIPT: {transcript_text[:1000]}... [Content truncated due to error]"
+            return f"{FALLBACK_PREFIX}{transcript_text[:1000]}... [Content truncated due to error]"
+    
+    async def aprocess_transcript(self, transcript_text):
+        """
+        Process and refine a transcript like process_transcript, without blocking the event loop
+        
+        In incremental mode the changed chunks are refined concurrently.
+        
+        Args:
+            transcript_text: Raw transcript text
+            
+        Returns:
+            str: Refined transcript
+        """
+        print(f"Processing transcript with {len(transcript_text)} characters")
+        
+        chunk_cache = get_chunk_cache()
+        if chunk_cache is not None:
+            return await self.aprocess_transcript_chunks(transcript_text, chunk_cache)
+        
+        try:
+            print("Executing transcriber task...")
+            result = await self.arefine_text(transcript_text)
+            print(f"Transcriber task completed successfully, result length: {len(str(result))}")
+            return result
+        except Exception as e:
+            print(f"Error in transcriber agent: {str(e)}")
+            return f"{FALLBACK_PREFIX}{transcript_text[:1000]}... [Content truncated due to error]"
+    
+    def process_transcript_chunks(self, transcript_text, chunk_cache):
+        """
+        Refine a transcript chunk by chunk, reusing refined chunks from a cache
+        
+        Only the chunks that can reach the analysis tasks' prompts are
+        refined: the tasks cut their input at the task input budget, so
+        chunks past it are passed on as they are rather than paid for. The
+        changed chunks are refined concurrently.
+        
+        Args:
+            transcript_text: Raw transcript text
+            chunk_cache: ChunkCache with refined chunks from earlier runs
+            
+        Returns:
+            str: Refined transcript
+        """
+        chunks = chunk_transcript(transcript_text)
+        reachable = self._count_reachable_chunks(chunks)
+        model = self._refinement_model()
+        
+        def refine_chunk(chunk):
+            refined = chunk_cache.get(hash_chunk(chunk), model)
+            record_cache_lookup("transcript_chunks", refined is not None)
+            if refined is not None:
+                return refined, True
+            
+            try:
+                refined = str(self.refine_text(chunk)).strip()
+                # Only cache usable refinements, so poor ones are retried next time
+                if is_valid_refinement(refined, chunk, model):
+                    chunk_cache.put(hash_chunk(chunk), model, refined)
+            except Exception as e:
+                print(f"Error refining transcript chunk: {str(e)}")
+                refined = chunk.strip()
+            return refined, False
+        
+        results = map_concurrently(refine_chunk, chunks[:reachable])
+        return self._join_chunks(chunks, results)
+    
+    async def aprocess_transcript_chunks(self, transcript_text, chunk_cache):
+        """
+        Refine a transcript chunk by chunk like process_transcript_chunks, without blocking the event loop
+        
+        Args:
+            transcript_text: Raw transcript text
+            chunk_cache: ChunkCache with refined chunks from earlier runs
+            
+        Returns:
+            str: Refined transcript
+        """
+        chunks = chunk_transcript(transcript_text)
+        reachable = self._count_reachable_chunks(chunks)
+        model = self._refinement_model()
+        
+        async def refine_chunk(chunk):
+            refined = chunk_cache.get(hash_chunk(chunk), model)
+            record_cache_lookup("transcript_chunks", refined is not None)
+            if refined is not None:
+                return refined, True
+            
+            try:
+                refined = str(await self.arefine_text(chunk)).strip()
+                if is_valid_refinement(refined, chunk, model):
+                    chunk_cache.put(hash_chunk(chunk), model, refined)
+            except Exception as e:
+                print(f"Error refining transcript chunk: {str(e)}")
+                refined = chunk.strip()
+            return refined, False
+        
+        results = await asyncio.gather(*(refine_chunk(chunk) for chunk in chunks[:reachable]))
+        return self._join_chunks(chunks, results)
+    
+    def _count_reachable_chunks(self, chunks):
+        """Count the leading chunks that fit in the input budget of the crew's analysis tasks"""
+        from agents.tasks.task_base import BaseTask
+        
+        return count_reachable_chunks(chunks, BaseTask.input_token_budget(self.model), self.model)
+    
+    def _join_chunks(self, chunks, results):
+        """
+        Join the refined leading chunks and the unrefined rest of a transcript
+        
+        Args:
+            chunks: Raw chunks
+            results: (refined text, reused) of each leading chunk that was refined
+            
+        Returns:
+            str: Refined transcript
+        """
+        reused_count = sum(1 for _, reused in results if reused)
+        skipped = chunks[len(results):]
+        
+        print(f"Refined {len(results) - reused_count} of {len(chunks)} transcript chunks, reused {reused_count}"
+              + (f", left {len(skipped)} past the analysis input budget unrefined" if skipped else ""))
+        return "\n\n".join([refined for refined, _ in results] + [chunk.strip() for chunk in skipped])
+    
+    def refine_text(self, transcript_text):
+        """
+        Refine transcript text with one refinement task, escalating on poor results
+        
+        Refined transcripts are shared artifacts keyed by the raw text, the
+        transcriber version and the model, so every crew (and every later
+        run) on the same transcript reuses the first refinement.
+        
+        Args:
+            transcript_text: Raw transcript text
+            
+        Returns:
+            str: Refined transcript
+        """
+        from agents.tasks.transcription import TranscriptionTask
+        
+        model, key = self._refinement_key(transcript_text)
+        refined = self._load_refinement(key)
+        if refined is not None:
+            return refined
+        
+        result = self.execute_with_escalation(
+            lambda agent: TranscriptionTask.create_refinement_task(agent, transcript_text),
+            lambda result: is_valid_refinement(result, transcript_text, model)
+        )
+        
+        self._save_refinement(key, model, transcript_text, result)
+        return result
+    
+    async def arefine_text(self, transcript_text):
+        """
+        Refine transcript text like refine_text, without blocking the event loop
+        
+        Args:
+            transcript_text: Raw transcript text
+            
+        Returns:
+            str: Refined transcript
+        """
+        from agents.tasks.transcription import TranscriptionTask
+        
+        model, key = self._refinement_key(transcript_text)
+        refined = await asyncio.to_thread(self._load_refinement, key)
+        if refined is not None:
+            return refined
+        
+        result = await self.aexecute_with_escalation(
+            lambda agent: TranscriptionTask.create_refinement_task(agent, transcript_text),
+            lambda result: is_valid_refinement(result, transcript_text, model)
+        )
+        
+        await asyncio.to_thread(self._save_refinement, key, model, transcript_text, result)
+        return result
+    
+    def _refinement_model(self):
+        """Get the model refinement is routed to"""
+        from agents.tasks.task_base import BaseTask
+        
+        return BaseTask.route_agent(self, "transcript_refinement").model
+    
+    def _refinement_key(self, transcript_text):
+        """Get the model refinement is routed to and the refined transcript's artifact key"""
+        model = self._refinement_model()
+        
+        # The prompt depends on how the transcript is compressed, too
+        compression = resolve_compression_options("transcript_refinement")
+        return model, artifact_key(TRANSCRIBER_VERSION, model, transcript_text, compression)
+    
+    def _load_refinement(self, key):
+        """Get a stored refined transcript, or None"""
+        refined = load_artifact("refined_transcript", key)
+        record_cache_lookup("refined_transcripts", refined is not None)
+        if refined is not None:
+            print(f"Reusing refined transcript ({len(refined)} characters)")
+        return refined
+    
+    def _save_refinement(self, key, model, transcript_text, result):
+        """Store a refined transcript for reuse"""
+        # Only keep usable refinements, so poor ones are retried next time
+        if is_valid_refinement(result, transcript_text, model):
+            save_artifact(
+                "refined_transcript", key, str(result),
+                transcript_hash=hashlib.sha256(transcript_text.encode("utf-8")).hexdigest(),
+                transcriber_version=TRANSCRIBER_VERSION,
+                model=model
+            )
+        else:
+            # Other crews in the same composite run still reuse it
+            remember_artifact("refined_transcript", key, str(result))
     
     def segment_transcript(self, transcript_content):
         """
@@ -57,4 +285,30 @@ class TranscriberAgent(BaseAgent):
         from agents.tasks.transcription import TranscriptionTask
         
         task = TranscriptionTask.create_segmentation_task(self, transcript_content)
-        return self.execute_task(task)
\ No newline at end of file
+        return self.execute_task(task)
+
+def is_valid_refinement(result, transcript_text, model=None):
+    """
+    Check that a refined transcript looks like a complete refinement
+    
+    Refinement removes filler words, so some shrinkage is expected, but a
+    result much shorter than the input usually means the model summarized
+    or truncated the transcript instead of refining it.
+    
+    Args:
+        result: Refined transcript
+        transcript_text: Raw transcript text
+        model: Model refinement is routed to
+        
+    Returns:
+        bool: True if the result is usable
+    """
+    from agents.tasks.task_base import BaseTask
+    
+    result = str(result).strip()
+    if not result:
+        return False
+    
+    # The refinement task only gets as much of the transcript as its input budget allows
+    expected_tokens = min(count_tokens(transcript_text, model), BaseTask.input_token_budget(model, task_type="transcript_refinement"))
+    return count_tokens(result, model) >= expected_tokens * 0.3
\ No newline at end of file
@@ -1,6 +1,9 @@
 # agents/definitions/translator.py
 from agents.base import BaseAgent
 from agents.registry import register_agent
+from agents.schemas import SegmentTranslationsOutput
+from utils.metrics import record_cache_lookup
+from utils.translation_memory import get_translation_memory, split_segments, normalize_segment, memory_key, memory_entry, batch_segments
 
 @register_agent("translator")
 class TranslatorAgent(BaseAgent):
@@ -22,6 +25,9 @@ class TranslatorAgent(BaseAgent):
         """
         Translate text to the target language
         
+        With the translation memory on, segments translated before are taken
+        from the memory and only the others are sent to the LLM, in batches.
+        
         Args:
             text: Text to translate
             target_language: Target language code or name
@@ -30,6 +36,13 @@ class TranslatorAgent(BaseAgent):
         Returns:
             str: Translated text
         """
+        memory = get_translation_memory()
+        if memory is not None and text.strip():
+            try:
+                return self.translate_with_memory(memory, text, target_language, source_language)
+            except Exception as e:
+                print(f"Error translating with the translation memory, translating the whole text: {str(e)}")
+        
         from agents.tasks.translation import TranslationTask
         
         # Create input data
@@ -41,9 +54,87 @@ class TranslatorAgent(BaseAgent):
         if source_language:
             input_data["source_language"] = source_language
         
-        # Create and execute a translation task
-        task = TranslationTask.create_translation_task(self, input_data)
-        return self.execute_task(task)
+        # Create and execute a translation task, escalating if the output is unusable
+        return self.execute_with_escalation(
+            lambda agent: TranslationTask.create_translation_task(agent, input_data),
+            lambda result: bool(str(result).strip())
+        )
+    
+    def translate_with_memory(self, memory, text, target_language, source_language=None):
+        """
+        Translate text segment by segment, reusing segments from the translation memory
+        
+        Args:
+            memory: Translation memory
+            text: Text to translate
+            target_language: Target language code or name
+            source_language: Optional source language (if known)
+            
+        Returns:
+            str: Translated text, with the original line layout and list markers
+        """
+        from agents.tasks.task_base import BaseTask
+        
+        pieces = split_segments(text)
+        segments = list(dict.fromkeys(
+            normalize_segment(segment) for segment, _ in pieces if segment is not None and normalize_segment(segment)
+        ))
+        
+        # Entries are kept per model, so key them on the model the routing policy picks
+        model = BaseTask.route_agent(self, "segment_translation").model
+        source_key = source_language or "auto"
+        keys = {segment: memory_key(segment, source_key, target_language, model) for segment in segments}
+        
+        stored = memory.get_many(list(keys.values()))
+        translations = {segment: stored[key] for segment, key in keys.items() if key in stored}
+        for segment in segments:
+            record_cache_lookup("translation_memory", segment in translations)
+        
+        misses = [segment for segment in segments if segment not in translations]
+        print(f"Translation memory: reused {len(translations)} of {len(segments)} segments, translating {len(misses)}")
+        
+        for batch in batch_segments(misses):
+            translated = self.translate_segments(batch, target_language, source_language)
+            translations.update(zip(batch, translated))
+            memory.put_many([
+                memory_entry(keys[segment], segment, translation, source_key, target_language, model)
+                for segment, translation in zip(batch, translated)
+            ])
+        
+        return "".join(
+            layout if segment is None else translations.get(normalize_segment(segment), segment)
+            for segment, layout in pieces
+        )
+    
+    def translate_segments(self, segments, target_language, source_language=None):
+        """
+        Translate a batch of segments in one request
+        
+        Args:
+            segments: Segments to translate
+            target_language: Target language code or name
+            source_language: Optional source language (if known)
+            
+        Returns:
+            list: Translation of each segment, in order
+        """
+        from agents.tasks.translation import TranslationTask
+        
+        parsed = {}
+        
+        def validate(result):
+            parsed["translations"] = parse_segment_translations(result)
+            return parsed["translations"] is not None and len(parsed["translations"]) == len(segments)
+        
+        self.execute_with_escalation(
+            lambda agent: TranslationTask.create_segment_translation_task(agent, segments, target_language, source_language),
+            validate
+        )
+        
+        if parsed["translations"] is None or len(parsed["translations"]) != len(segments):
+            raise ValueError(f"Expected {len(segments)} segment translations, got {len(parsed['translations'] or [])}")
+        
+        return parsed["translations"]
     
     def translate_summary(self, summary_content, target_language):
         """
@@ -112,4 +203,24 @@ class TranslatorAgent(BaseAgent):
                 translated = self.translate_summary(summary_content, language)
                 results[language.lower()] = translated
         
-        return results
\ No newline at end of file
+        return results
+
+def parse_segment_translations(result):
+    """
+    Get the translations from a segment translation answer
+    
+    Args:
+        result: Task result with a SegmentTranslationsOutput JSON object
+        
+    Returns:
+        list: Translations, or None if the answer has no valid object
+    """
+    text = str(result)
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        return None
+    
+    try:
+        return SegmentTranslationsOutput.model_validate_json(text[start:end + 1]).translations
+    except ValueError:
+        return None
\ No newline at end of file
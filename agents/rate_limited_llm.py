@@ -0,0 +1,138 @@
+# agents/rate_limited_llm.py
+"""
+Rate limiting of every LLM request the agents make
+
+A CrewAI agent may make several LLM requests for one task (a retry after
+an unparsable reply, a summary when the context is too long), and a crew
+kickoff makes its requests inside CrewAI, out of reach of the code that
+starts it. RateLimitedLLM wraps the LLM the agents share, so each request
+takes the shared "openai_chat" limiter for exactly as long as the request
+runs: the budgets are charged per request, the actual token usage is
+recorded on the permit, and the adaptive concurrency limit sees the
+latency of single requests rather than of whole tasks.
+"""
+import copy
+from crewai import LLM
+from crewai.agents.agent_builder.utilities.base_token_process import TokenProcess
+from crewai.utilities.token_counter_callback import TokenCalcHandler
+from agents.async_llm import acall_llm
+from utils.rate_limiter import get_rate_limiter, estimate_tokens, DEFAULT_COMPLETION_TOKENS, is_rate_limit_error, retry_after_from_error
+
+def _messages_text(messages):
+    """Get the text of chat messages, for estimating their tokens"""
+    if isinstance(messages, str):
+        return messages
+    return "\n".join(str(message.get("content", "")) if isinstance(message, dict) else str(message) for message in messages)
+
+class RateLimitedLLM(LLM):
+    """
+    CrewAI LLM that takes the shared chat rate limiter for each request
+    
+    Everything but call() and acall() is delegated to the wrapped LLM,
+    including attribute writes (CrewAI sets the stop words on the LLM), so
+    copies wrap a copy of the LLM: each CrewAI agent gets its own (see
+    BaseAgent.create_agent) and the registry's stays untouched.
+    """
+    
+    def __init__(self, llm, limiter_name="openai_chat"):
+        """
+        Wrap an LLM
+        
+        Args:
+            llm: CrewAI LLM making the requests
+            limiter_name: Rate limiter budget the requests share
+        """
+        object.__setattr__(self, "_llm", llm)
+        object.__setattr__(self, "_limiter_name", limiter_name)
+    
+    def __getattr__(self, name):
+        # Only reached for attributes the wrapper doesn't have itself;
+        # dunder lookups (e.g. while copying) must not reach the wrapped LLM
+        if name.startswith("__") or name in ("_llm", "_limiter_name"):
+            raise AttributeError(name)
+        return getattr(self._llm, name)
+    
+    def __setattr__(self, name, value):
+        setattr(self._llm, name, value)
+    
+    def __copy__(self):
+        return RateLimitedLLM(copy.copy(self._llm), self._limiter_name)
+    
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        """
+        Make one request through the wrapped LLM under the rate limiter
+        
+        Args:
+            messages: Chat messages or prompt text
+            tools: Optional tool schemas
+            callbacks: Optional LiteLLM callbacks (e.g. CrewAI's token counter)
+            available_functions: Optional functions the LLM may call
+        
+        Returns:
+            Response text (or a function call's result)
+        """
+        usage = TokenProcess()
+        callbacks = list(callbacks or []) + [TokenCalcHandler(usage)]
+        
+        with get_rate_limiter(self._limiter_name).acquire(self._estimate_tokens(messages)) as permit:
+            try:
+                result = self._llm.call(messages, tools=tools, callbacks=callbacks, available_functions=available_functions)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    permit.record_rate_limited(retry_after_from_error(e))
+                raise
+            
+            self._record_usage(permit, usage)
+        
+        return result
+    
+    async def acall(self, messages, callbacks=None, stop=None):
+        """
+        Make one request through the wrapped LLM's async API under the rate limiter
+        
+        Args:
+            messages: Chat messages
+            callbacks: Optional LiteLLM callbacks, given the usage like call() does
+            stop: Optional stop words added to the LLM's own
+        
+        Returns:
+            str: Response text
+        """
+        usage = TokenProcess()
+        callbacks = list(callbacks or []) + [TokenCalcHandler(usage)]
+        
+        async with get_rate_limiter(self._limiter_name).acquire_async(self._estimate_tokens(messages)) as permit:
+            try:
+                result = await acall_llm(self._llm, messages, callbacks=callbacks, stop=stop)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    permit.record_rate_limited(retry_after_from_error(e))
+                raise
+            
+            self._record_usage(permit, usage)
+        
+        return result
+    
+    def _estimate_tokens(self, messages):
+        """Estimate a request's prompt plus completion tokens before it is made"""
+        return estimate_tokens(_messages_text(messages)) + DEFAULT_COMPLETION_TOKENS
+    
+    def _record_usage(self, permit, usage):
+        """Charge the limiter for the tokens a request actually used"""
+        summary = usage.get_summary()
+        permit.record_tokens(summary.prompt_tokens + summary.completion_tokens)
+    
+    def supports_function_calling(self):
+        return self._llm.supports_function_calling()
+    
+    def supports_stop_words(self):
+        return self._llm.supports_stop_words()
+    
+    def get_context_window_size(self):
+        return self._llm.get_context_window_size()
+    
+    def set_callbacks(self, callbacks):
+        return self._llm.set_callbacks(callbacks)
+    
+    def set_env_callbacks(self):
+        return self._llm.set_env_callbacks()
@@ -1,4 +1,10 @@
 # agents/registry.py
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Model configuration active in the current thread/task, set by model_scope()
+_model_scope = ContextVar("agent_model_scope", default=None)
 
 class AgentRegistry:
     """
@@ -7,6 +13,20 @@ class AgentRegistry:
     This registry allows for centralized agent registration, configuration,
     and retrieval. It makes it easy to add new agents and integrate them
     into the processing workflow.
+    
+    The registry also owns the shared LLMs (one per model), which every
+    agent using the model shares and which take the shared chat rate limiter
+    for each request they make (see agents/rate_limited_llm.py). CrewAI Agent objects
+    are not shared: they keep the state of the run they are in (executor,
+    crew, tools handler), so each task builds its own (see
+    BaseAgent.create_agent).
+    
+    Model selection is resolved per call rather than through shared state:
+    an explicit model wins, then the innermost model_scope(), then the
+    registry default. The agent instances the registry caches hold nothing
+    but their configuration and LLM client, and each task builds its own
+    CrewAI agent, so crews with different models can run in parallel in one
+    process (benchmarks/check_isolation.py checks this).
     """
     
     def __init__(self):
@@ -14,6 +34,12 @@ class AgentRegistry:
         self.agents = {}
         self.agent_classes = {}
         self.default_model = "gpt-4o"
+        self.llm_clients = {}
+        # Optional callable taking a model name and returning a CrewAI LLM (e.g.
+        # a fake backend for offline benchmarks); OpenAI is used when unset
+        self.llm_factory = None
+        # Re-entrant because building an agent instance fetches its LLM
+        self._cache_lock = threading.RLock()
     
     def register(self, agent_id, agent_class):
         """
@@ -29,9 +55,69 @@ class AgentRegistry:
         if agent_id in self.agent_classes:
             print(f"Warning: Agent '{agent_id}' already registered. Overwriting.")
             
+        agent_class.agent_id = agent_id
         self.agent_classes[agent_id] = agent_class
         return True
     
+    def get_llm(self, model):
+        """
+        Get the shared LLM for a model
+        
+        Args:
+            model (str): Model name
+            
+        Returns:
+            RateLimitedLLM: CrewAI LLM shared by all agents using this model,
+                            rate limited per request
+        """
+        llm = self.llm_clients.get(model)
+        
+        if llm is None:
+            with self._cache_lock:
+                llm = self.llm_clients.get(model)
+                if llm is None:
+                    from agents.rate_limited_llm import RateLimitedLLM
+                    llm = RateLimitedLLM(self._create_llm(model))
+                    self.llm_clients[model] = llm
+        
+        return llm
+    
+    def _create_llm(self, model):
+        """
+        Create a CrewAI LLM for an OpenAI model, or use the LLM factory if one is set
+        
+        Args:
+            model (str): Model name
+            
+        Returns:
+            LLM: CrewAI LLM
+        """
+        if self.llm_factory is not None:
+            return self.llm_factory(model)
+        
+        from crewai import LLM
+        from utils.config import get_openai_api_key
+        
+        return LLM(model=model, api_key=get_openai_api_key())
+    
+    def set_llm_factory(self, factory):
+        """
+        Replace the LLM backend used for new agents
+        
+        Clears the caches so no agent keeps an LLM from the previous backend.
+        
+        Args:
+            factory (callable): Takes a model name and returns a CrewAI LLM, or None to restore OpenAI
+        """
+        self.clear_cache()
+        self.llm_factory = factory
+    
+    def clear_cache(self):
+        """Drop all cached agent instances and LLMs"""
+        with self._cache_lock:
+            self.agents.clear()
+            self.llm_clients.clear()
+    
     def get_agent(self, agent_id, model=None):
         """
         Get an instance of an agent
@@ -43,23 +129,93 @@ class AgentRegistry:
         Returns:
             BaseAgent: Agent instance
         """
-        # Use provided model or default
-        agent_model = model or self.default_model
+        # Use provided model, then the active scope, then the default
+        agent_model = self.resolve_model(agent_id, model)
         
         # Check if we already have an instance with this model
         instance_key = f"{agent_id}_{agent_model}"
         
-        if instance_key in self.agents:
-            return self.agents[instance_key]
-            
-        # Create a new instance if we don't have one yet
-        if agent_id in self.agent_classes:
-            agent_class = self.agent_classes[agent_id]
-            agent = agent_class(model=agent_model)
-            self.agents[instance_key] = agent
+        agent = self.agents.get(instance_key)
+        if agent is not None:
             return agent
-        else:
+            
+        if agent_id not in self.agent_classes:
             raise ValueError(f"Agent '{agent_id}' not registered")
+        
+        # Create a new instance if we don't have one yet
+        with self._cache_lock:
+            agent = self.agents.get(instance_key)
+            if agent is None:
+                agent_class = self.agent_classes[agent_id]
+                agent = agent_class(model=agent_model)
+                self.agents[instance_key] = agent
+        
+        return agent
+    
+    def resolve_model(self, agent_id, model=None):
+        """
+        Resolve the model an agent should use
+        
+        Args:
+            agent_id (str): Agent identifier
+            model (str, optional): Explicitly requested model
+            
+        Returns:
+            str: Model name
+        """
+        if model:
+            return model
+        
+        scope = _model_scope.get()
+        if scope:
+            if agent_id in scope["agent_models"]:
+                return scope["agent_models"][agent_id]
+            if scope["model"]:
+                return scope["model"]
+        
+        return self.default_model
+    
+    def get_model_override(self, agent_id):
+        """
+        Get the model the active scope pins for an agent
+        
+        Args:
+            agent_id (str): Agent identifier
+            
+        Returns:
+            str: Model name, or None if the scope doesn't override this agent
+        """
+        scope = _model_scope.get()
+        if scope:
+            return scope["agent_models"].get(agent_id)
+        return None
+    
+    @contextmanager
+    def model_scope(self, model=None, agent_models=None):
+        """
+        Scope model configuration to the current thread or async task
+        
+        Nested scopes inherit from the enclosing scope. Threads started inside
+        a scope only see it if they run in a copy of the current context.
+        
+        Args:
+            model (str, optional): Default model inside the scope
+            agent_models (dict, optional): Per-agent model overrides by agent ID
+            
+        Yields:
+            dict: The active scope configuration
+        """
+        parent = _model_scope.get() or {"model": None, "agent_models": {}}
+        scope = {
+            "model": model or parent["model"],
+            "agent_models": {**parent["agent_models"], **(agent_models or {})}
+        }
+        
+        token = _model_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _model_scope.reset(token)
     
     def get_all_agents(self, model=None):
         """
@@ -71,11 +227,9 @@ class AgentRegistry:
         Returns:
             dict: Dictionary of agent instances by ID
         """
-        agent_model = model or self.default_model
-        
         agents = {}
         for agent_id in self.agent_classes:
-            agents[agent_id] = self.get_agent(agent_id, agent_model)
+            agents[agent_id] = self.get_agent(agent_id, model)
             
         return agents
     
@@ -83,10 +237,14 @@ class AgentRegistry:
         """
         Set the default model for all agents
         
+        This changes the process-wide default; prefer model_scope() or an
+        explicit model for per-crew configuration.
+        
         Args:
             model (str): Default model name
         """
-        self.default_model = model
+        with self._cache_lock:
+            self.default_model = model
 
 
 # Create a global registry instance
@@ -147,4 +305,19 @@ def set_default_model(model):
     Args:
         model (str): Default model name
     """
-    registry.set_default_model(model)
\ No newline at end of file
+    registry.set_default_model(model)
+
+
+# Helper function to scope model configuration
+def model_scope(model=None, agent_models=None):
+    """
+    Scope model configuration to the current thread or async task
+    
+    Args:
+        model (str, optional): Default model inside the scope
+        agent_models (dict, optional): Per-agent model overrides by agent ID
+        
+    Returns:
+        contextmanager: Context manager activating the scope
+    """
+    return registry.model_scope(model, agent_models)
\ No newline at end of file
@@ -0,0 +1,152 @@
+# agents/routing.py
+import json
+import threading
+from utils.config import get_model_routing_policy_path, is_model_routing_enabled
+
+class ModelRouter:
+    """
+    Routes agent tasks to model tiers
+    
+    The routing policy maps (agent ID, task type) pairs to named tiers, so
+    mechanical steps like transcript formatting or list extraction can run
+    on a cheaper, faster model while synthesis stays on the crew's model.
+    
+    Tiers are ordered from smallest to largest (the escalation order, or
+    the order they are listed in). Routing only moves a task down from the
+    model it would otherwise use to a smaller tier, and only when that
+    model is itself a tier: a crew on a model the policy doesn't list, or
+    already on the smallest tier, keeps its model for every task.
+    Escalation climbs the same order back up, never past that model.
+    """
+    
+    def __init__(self, policy=None):
+        """
+        Initialize the router
+        
+        Args:
+            policy (dict, optional): Routing policy with tiers, routes and escalation
+        """
+        policy = policy or {}
+        escalation = policy.get("escalation") or {}
+        
+        self.tiers = policy.get("tiers") or {}
+        self.routes = policy.get("routes") or {}
+        self.escalation_enabled = bool(escalation.get("enabled", False))
+        self.escalation_order = [self.tiers.get(tier, tier) for tier in escalation.get("order") or self.tiers]
+    
+    def route(self, agent_id, task_type=None, model=None):
+        """
+        Get the model for an agent's task
+        
+        Args:
+            agent_id (str): Agent identifier
+            task_type (str, optional): Task type
+            model (str, optional): Model the task would otherwise run on (e.g.
+                the crew's model); the task is only routed to a smaller tier
+            
+        Returns:
+            str: Model name, or None if the policy doesn't route this task
+        """
+        agent_routes = self.routes.get(agent_id) or {}
+        
+        tier = agent_routes.get(task_type) if task_type else None
+        tier = tier or agent_routes.get("default")
+        
+        if not tier:
+            return None
+        
+        # Routes may name a tier or a model directly
+        routed_model = self.tiers.get(tier, tier)
+        
+        if model is not None and not self._is_smaller(routed_model, model):
+            return None
+        
+        return routed_model
+    
+    def _is_smaller(self, model, other):
+        """Check whether a model comes before another in the tier order"""
+        if model not in self.escalation_order or other not in self.escalation_order:
+            return False
+        return self.escalation_order.index(model) < self.escalation_order.index(other)
+    
+    def escalate(self, model, ceiling=None):
+        """
+        Get the next larger model to retry with
+        
+        Args:
+            model (str): Model whose output failed validation
+            ceiling (str, optional): Largest model to escalate to, e.g. the
+                model the task would have used without routing
+            
+        Returns:
+            str: Next model up, or None if escalation isn't possible
+        """
+        if not self.escalation_enabled or model not in self.escalation_order:
+            return None
+        
+        position = self.escalation_order.index(model)
+        if position + 1 >= len(self.escalation_order):
+            return None
+        
+        next_model = self.escalation_order[position + 1]
+        if ceiling is not None and not self._is_smaller(model, ceiling):
+            return None
+        
+        return next_model
+
+
+def load_routing_policy(path):
+    """
+    Load a routing policy from a YAML or JSON file
+    
+    Args:
+        path (str): Path to the policy file
+        
+    Returns:
+        dict: Routing policy, or an empty policy if the file can't be read
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if path.endswith(".json"):
+                return json.load(f)
+            
+            import yaml
+            return yaml.safe_load(f) or {}
+    except Exception as e:
+        print(f"Error loading model routing policy from {path}: {e}")
+        return {}
+
+
+_router = None
+_router_lock = threading.Lock()
+
+def get_router():
+    """
+    Get the shared model router, loading the policy on first use
+    
+    Returns:
+        ModelRouter: Model router
+    """
+    global _router
+    
+    if _router is None:
+        with _router_lock:
+            if _router is None:
+                if is_model_routing_enabled():
+                    _router = ModelRouter(load_routing_policy(get_model_routing_policy_path()))
+                else:
+                    _router = ModelRouter()
+    
+    return _router
+
+def set_router(router):
+    """
+    Replace the shared model router
+    
+    Args:
+        router (ModelRouter): Router to use, or None to reload from the policy file
+    """
+    global _router
+    
+    with _router_lock:
+        _router = router
@@ -0,0 +1,184 @@
+# agents/schemas.py
+"""
+Structured output schemas for crew tasks
+
+With structured output enabled, a task with a schema asks its agent for
+JSON in that shape. CrewAI validates the JSON, and falls back to a
+conversion call on the agent's LLM only if the answer isn't valid. Each
+schema knows which fields of the analysis result it fills, so a crew's
+result can be assembled from its tasks' validated outputs without the
+regex parser.
+"""
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+
+class SummaryOutput(BaseModel):
+    """Executive summary of a Meeting"""
+    summary: str = Field(description="Concise executive summary")
+    key_topics: List[str] = Field(default_factory=list, description="Main topics discussed")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result["summary"] = self.summary
+        if self.key_topics and not result.get("key_topics"):
+            result["key_topics"] = list(self.key_topics)
+
+class TopicsOutput(BaseModel):
+    """Main topics of a Meeting"""
+    key_topics: List[str] = Field(description="Main topics discussed")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result["key_topics"] = list(self.key_topics)
+
+class SentimentOutput(BaseModel):
+    """Sentiment analysis of a Meeting"""
+    sentiment_analysis: str = Field(description="Overall tone, emotional dynamics and notable shifts")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result["sentiment_analysis"] = self.sentiment_analysis
+
+class ActionItemsOutput(BaseModel):
+    """Action items from a Meeting"""
+    action_items: List[str] = Field(description="Prioritized action items, each as 'Title: what to do and why'")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result["action_items"] = list(self.action_items)
+
+class Claim(BaseModel):
+    """A factual claim and its verification status"""
+    claim: str = Field(description="The claim as stated")
+    status: str = Field(description="Verification status, e.g. Verified, Unverified, Disputed")
+    explanation: str = Field(default="", description="Why the claim has this status")
+
+class FactCheckOutput(BaseModel):
+    """Fact check of the claims made in a Meeting"""
+    claims: List[Claim] = Field(description="Claims checked")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        # Same shape the result parser produces for fact check results
+        result["fact_check"] = {"results": [claim.model_dump() for claim in self.claims]}
+
+class ResearchOutput(BaseModel):
+    """Research that adds context to a Meeting's topics"""
+    research: str = Field(description="Research insights and context")
+    key_topics: List[str] = Field(default_factory=list, description="Topics researched")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result["research"] = self.research
+        if self.key_topics and not result.get("key_topics"):
+            result["key_topics"] = list(self.key_topics)
+
+class TranslationOutput(BaseModel):
+    """A translation into one language"""
+    language: str = Field(description="Target language")
+    text: str = Field(description="Translated text")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result.setdefault("translations", {})[self.language.lower()] = self.text
+
+class MeetingTranslationOutput(BaseModel):
+    """A Meeting's summary and action items translated into one language"""
+    language: str = Field(description="Target language")
+    summary: str = Field(description="Translated summary")
+    action_items: List[str] = Field(default_factory=list, description="Translated action items, in the original order")
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result.setdefault("translations", {})[self.language.lower()] = self.to_result()
+    
+    def to_result(self):
+        """
+        Convert to a translations entry of the analysis result
+        
+        Returns:
+            dict: Translated summary and action items
+        """
+        return {"summary": self.summary, "action_items": list(self.action_items)}
+
+class RegionLocalization(BaseModel):
+    """Content localized for one region"""
+    region: str = Field(description="Region, exactly as listed in the task")
+    content: str = Field(description="Localized content")
+
+class LocalizationOutput(BaseModel):
+    """Content localized for regions that share a language"""
+    localizations: List[RegionLocalization] = Field(description="One localization per region")
+    
+    def by_region(self):
+        """
+        Key the localizations by region
+        
+        Returns:
+            dict: Uppercase region -> localized content
+        """
+        return {localization.region.strip().upper(): localization.content for localization in self.localizations}
+
+class SegmentTranslationsOutput(BaseModel):
+    """Translations of numbered text segments, for the translation memory"""
+    translations: List[str] = Field(description="Translation of each segment, in the order given, one per segment")
+
+class MeetingAnalysis(BaseModel):
+    """Complete analysis result, as returned by a crew"""
+    summary: str = ""
+    key_topics: List[str] = Field(default_factory=list)
+    sentiment_analysis: str = ""
+    action_items: List[str] = Field(default_factory=list)
+    fact_check: Optional[List[Claim]] = None
+    research: Optional[str] = None
+    translations: Optional[Dict[str, str]] = None
+    
+    def merge_into(self, result):
+        """Set the analysis result fields this output provides"""
+        result.update(self.to_result())
+    
+    def to_result(self):
+        """
+        Convert to the analysis result dictionary
+        
+        Returns:
+            dict: Result with the same shape the result parser produces
+        """
+        result = self.model_dump(exclude_none=True)
+        if self.fact_check is not None:
+            result["fact_check"] = {"results": result["fact_check"]}
+        return result
+
+# Schema for each task type that can produce structured output; other task
+# types (content analysis, transcript refinement, ...) stay free-form
+TASK_OUTPUT_SCHEMAS = {
+    "summary": SummaryOutput,
+    "enhanced_summary": SummaryOutput,
+    "bullet_summary": SummaryOutput,
+    "topic_extraction": TopicsOutput,
+    "research_topic_extraction": TopicsOutput,
+    "sentiment": SentimentOutput,
+    "action_items": ActionItemsOutput,
+    "enhanced_action_items": ActionItemsOutput,
+    "categorized_action_items": ActionItemsOutput,
+    "claim_extraction": FactCheckOutput,
+    "claim_verification": FactCheckOutput,
+    "comprehensive_fact_check": FactCheckOutput,
+    "analysis_augmentation": ResearchOutput,
+    "topic_research": ResearchOutput,
+    "summary_translation": TranslationOutput,
+    "translation": TranslationOutput,
+    "meeting_translation": MeetingTranslationOutput
+}
+
+def get_output_schema(task_type):
+    """
+    Get the structured output schema for a task type
+    
+    Args:
+        task_type: Task type
+    
+    Returns:
+        type: Pydantic model, or None if the task type is free-form
+    """
+    return TASK_OUTPUT_SCHEMAS.get(task_type)
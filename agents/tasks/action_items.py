@@ -23,6 +23,7 @@ class ActionItemsTask(BaseTask):
             
         return BaseTask.create_task(
             agent=agent,
+            task_type="action_items",
             description="""
             Your task is to extract actionable insights and recommendations from the podcast summary and sentiment analysis.
             
@@ -56,6 +57,7 @@ class ActionItemsTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="enhanced_action_items",
             description="""
             Your task is to extract comprehensive, high-value action items from all the provided inputs.
             
@@ -105,6 +107,7 @@ class ActionItemsTask(BaseTask):
         
         return BaseTask.create_task(
             agent=agent,
+            task_type="categorized_action_items",
             description="""
             Your task is to extract and categorize action items from the podcast content:
             
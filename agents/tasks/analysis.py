@@ -18,6 +18,7 @@ class AnalysisTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="content_analysis",
             description="""
             Your task is to analyze the refined podcast transcript to identify:
             
@@ -51,6 +52,7 @@ class AnalysisTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="topic_extraction",
             description="""
             Your task is to extract and categorize the main topics discussed in the podcast:
             
@@ -80,6 +82,7 @@ class AnalysisTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="argument_analysis",
             description="""
             Your task is to analyze the arguments and claims made in the podcast:
             
@@ -18,6 +18,7 @@ class FactCheckingTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="claim_extraction",
             description="""
             Your task is to extract factual claims from the podcast transcript:
             
@@ -48,6 +49,7 @@ class FactCheckingTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="claim_verification",
             description="""
             Your task is to verify the factual accuracy of the provided claim:
             
@@ -78,6 +80,7 @@ class FactCheckingTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="comprehensive_fact_check",
             description="""
             Your task is to perform a comprehensive fact check of the podcast:
             
@@ -18,6 +18,7 @@ class ResearchTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="topic_research",
             description="""
             Your task is to research the specified topic and provide valuable insights:
             
@@ -54,6 +55,7 @@ class ResearchTask(BaseTask):
         
         return BaseTask.create_task(
             agent=agent,
+            task_type="source_finding",
             description=f"""
             Your task is to recommend {num_sources} high-quality sources about this topic:
             
@@ -83,6 +85,7 @@ class ResearchTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="analysis_augmentation",
             description="""
             Your task is to augment the podcast analysis with additional research:
             
@@ -119,6 +122,7 @@ class ResearchTask(BaseTask):
         
         return BaseTask.create_task(
             agent=agent,
+            task_type="research_topic_extraction",
             description=f"""
             Your task is to identify {max_topics} key topics from the content that would benefit most from additional research:
             
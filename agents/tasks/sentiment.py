@@ -23,6 +23,7 @@ class SentimentTask(BaseTask):
             
         return BaseTask.create_task(
             agent=agent,
+            task_type="sentiment",
             description="""
             Your task is to analyze the emotional tone and sentiment throughout the podcast.
             
@@ -56,6 +57,7 @@ class SentimentTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="speaker_sentiment",
             description="""
             Your task is to analyze the sentiment of each speaker individually:
             
@@ -93,6 +95,7 @@ class SentimentTask(BaseTask):
         
         return BaseTask.create_task(
             agent=agent,
+            task_type="topic_sentiment",
             description="""
             Your task is to analyze the sentiment associated with each specified topic:
             
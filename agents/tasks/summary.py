@@ -18,6 +18,7 @@ class SummaryTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="summary",
             description="""
             Your task is to create an executive summary of the podcast based on the detailed analysis.
             
@@ -51,6 +52,7 @@ class SummaryTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="enhanced_summary",
             description="""
             Your task is to create a comprehensive executive summary of the podcast using all the provided inputs.
             
@@ -84,6 +86,7 @@ class SummaryTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="bullet_summary",
             description="""
             Your task is to create a bullet-point summary of the podcast:
             
@@ -114,6 +117,7 @@ class SummaryTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="tiered_summary",
             description="""
             Your task is to create a tiered summary of the podcast at three levels of detail:
             
@@ -1,6 +1,23 @@
 # agents/tasks/task_base.py
 from crewai import Task
-from agents.registry import get_agent
+from agents.registry import get_agent, registry
+from agents.routing import get_router
+from agents.schemas import get_output_schema
+from utils.config import is_structured_output_enabled, get_task_input_token_budget, get_rate_limit_config
+from utils.metrics import record_prompt_compression
+from utils.prompt_compression import compress_transcript, resolve_compression_options
+from utils.rate_limiter import DEFAULT_COMPLETION_TOKENS
+from utils.tokens import count_tokens, truncate_to_tokens, allocate_token_budget, get_input_token_budget, get_max_output_tokens
+
+# Task types whose answer restates their whole input (refinement, translation)
+REWRITING_TASK_TYPES = (
+    "transcript_refinement",
+    "translation",
+    "summary_translation",
+    "meeting_translation",
+    "segment_translation",
+    "localization"
+)
 
 class BaseTask:
     """
@@ -11,7 +28,7 @@ class BaseTask:
     """
     
     @staticmethod
-    def create_task(agent, description, expected_output, context=None, input_data=None, max_input_length=5000):
+    def create_task(agent, description, expected_output, context=None, input_data=None, max_input_tokens=None, task_type=None, output_schema=None, name=None, compression=None, input_priorities=None, truncate_input=True):
         """
         Create a CrewAI task with standardized formatting
         
@@ -21,80 +38,252 @@ class BaseTask:
             expected_output (str): Expected output format
             context (dict, optional): Additional context for the task
             input_data (str/dict/object, optional): Input data for the task
-            max_input_length (int, optional): Maximum length of input data to include
+            max_input_tokens (int, optional): Token budget for the input data (defaults to
+                what the model's context window allows, see input_token_budget; never more)
+            task_type (str, optional): Task type used for model routing
+            output_schema (type, optional): Pydantic model the output must match; defaults to the
+                task type's schema when structured output is enabled (see agents/schemas.py)
+            name (str, optional): Task name, which keys the task's output in the crew's
+                results; defaults to the task type
+            compression (bool/dict, optional): Transcript compression for text input: False
+                to send it verbatim, True or a dict of compress_transcript options to compress
+                it; defaults to the configured options for raw transcript task types and no
+                compression for others (see utils/prompt_compression.py)
+            input_priorities (dict, optional): Priority weight of each key of dict input data
+                when sharing the token budget (default 1)
+            truncate_input (bool, optional): False to send the input data whole, for inputs
+                the caller has already sized and that must reach the model verbatim
             
         Returns:
             Task: CrewAI task
         """
-        # Get agent instance if string is provided
-        if isinstance(agent, str):
-            agent_instance = get_agent(agent).create_agent()
-        elif hasattr(agent, 'create_agent'):
+        # Get agent instance, routed to the model tier for this task type
+        agent = BaseTask.route_agent(agent, task_type)
+        
+        if hasattr(agent, 'create_agent'):
             agent_instance = agent.create_agent()
         else:
             agent_instance = agent
         
         # Process input data if provided
         if input_data:
-            # Handle different input types
-            processed_input = BaseTask.process_input_data(input_data, max_input_length)
+            # Drop fillers and repetitions before truncating, so more content fits
+            input_data = BaseTask.compress_input_data(input_data, task_type, compression)
+            
+            # Fit the input into the token budget, leaving room in the context window
+            # for the instructions and the answer
+            model = getattr(getattr(agent_instance, "llm", None), "model", None)
+            if truncate_input:
+                max_input_tokens = BaseTask.input_token_budget(model, description, task_type, max_input_tokens)
+            else:
+                max_input_tokens = None
+            
+            processed_input = BaseTask.process_input_data(input_data, max_input_tokens, model=model, priorities=input_priorities)
             
             # Add input content to description
             full_description = f"{description}\n\nINPUT:\n{processed_input}"
         else:
             full_description = description
             
+        # Request schema-constrained JSON instead of free-form markdown
+        if output_schema is None and is_structured_output_enabled():
+            output_schema = get_output_schema(task_type)
+        
         # Create the task
         task = Task(
+            name=name or task_type,
             description=full_description,
             agent=agent_instance,
             expected_output=expected_output,
-            context=context
+            context=context,
+            output_pydantic=output_schema
         )
         
         return task
     
     @staticmethod
-    def process_input_data(input_data, max_length=5000):
+    def input_token_budget(model, description="", task_type=None, max_tokens=None):
+        """
+        Get the token budget for a task's input data
+        
+        The input gets what the model's context window leaves after the
+        task's instructions and its answer, and no more than the chat rate
+        limiter's tokens per minute leave: a larger request could never be
+        admitted (and the API rejects it as too large). A task whose answer
+        restates its input (REWRITING_TASK_TYPES) keeps the model's whole
+        output limit free for the answer, and takes no more input than fits
+        in it.
+        
+        Args:
+            model: Model that runs the task
+            description (str, optional): Task instructions
+            task_type (str, optional): Task type
+            max_tokens (int, optional): Cap on the budget (defaults to TASK_INPUT_TOKENS, if set)
+            
+        Returns:
+            int: Token budget
+        """
+        if max_tokens is None:
+            max_tokens = get_task_input_token_budget()
+        
+        completion_tokens = DEFAULT_COMPLETION_TOKENS
+        if task_type in REWRITING_TASK_TYPES:
+            output_tokens = get_max_output_tokens(model)
+            if output_tokens:
+                completion_tokens = output_tokens
+                max_tokens = min(max_tokens or output_tokens, output_tokens)
+        
+        tokens_per_minute = get_rate_limit_config("openai_chat")["tokens_per_minute"]
+        return get_input_token_budget(model, description, completion_tokens, max_tokens, tokens_per_minute)
+    
+    @staticmethod
+    def route_agent(agent, task_type=None):
         """
-        Process and format input data for a task
+        Resolve the agent instance that should execute a task
+        
+        The model routing policy may send a task type to a smaller model
+        tier than the one the agent was created with (the crew's model); it
+        never picks a larger model. A model pinned for the agent in the
+        active model scope (e.g. a crew's agent_models) takes precedence.
+        
+        Args:
+            agent: Agent ID string, agent instance, or CrewAI agent
+            task_type (str, optional): Task type
+            
+        Returns:
+            BaseAgent: Agent instance (or the CrewAI agent unchanged)
+        """
+        if isinstance(agent, str):
+            agent_id = agent
+        elif hasattr(agent, 'create_agent'):
+            agent_id = agent.agent_id
+        else:
+            return agent
+        
+        if agent_id and not registry.get_model_override(agent_id):
+            model = registry.resolve_model(agent_id) if isinstance(agent, str) else agent.model
+            routed_model = get_router().route(agent_id, task_type, model)
+            if routed_model:
+                return get_agent(agent_id, model=routed_model)
+        
+        return get_agent(agent) if isinstance(agent, str) else agent
+    
+    @staticmethod
+    def compress_input_data(input_data, task_type=None, compression=None):
+        """
+        Compress the transcript text in a task's input data
+        
+        Args:
+            input_data: Input data in various formats; text and dicts of text are compressed
+            task_type (str, optional): Task type, whose compression settings apply
+            compression (bool/dict, optional): Per-task compression setting
+            
+        Returns:
+            Input data with its text compressed (other inputs unchanged)
+        """
+        options = resolve_compression_options(task_type, compression)
+        if options is None:
+            return input_data
+        
+        if isinstance(input_data, str):
+            texts = {None: input_data}
+        elif isinstance(input_data, dict):
+            texts = {key: value for key, value in input_data.items() if isinstance(value, str)}
+        else:
+            return input_data
+        
+        compressed = {}
+        original_tokens = tokens_saved = 0
+        for key, text in texts.items():
+            compressed[key], stats = compress_transcript(text, **options)
+            original_tokens += stats["original_tokens"]
+            tokens_saved += stats["tokens_saved"]
+        
+        if tokens_saved:
+            print(f"Compressed {task_type or 'task'} input by {tokens_saved} of {original_tokens} tokens")
+            record_prompt_compression(task_type, original_tokens, tokens_saved)
+        
+        if isinstance(input_data, str):
+            return compressed[None]
+        return dict(input_data, **compressed)
+    
+    @staticmethod
+    def process_input_data(input_data, max_tokens=None, model=None, priorities=None):
+        """
+        Process and format input data for a task within a token budget
+        
+        Dict inputs become one section per key. The budget is shared by
+        the sections' actual lengths: short values (a language, a depth)
+        are kept whole and the budget they don't need goes to the longer
+        ones, in proportion to their priorities.
         
         Args:
             input_data: Input data in various formats
-            max_length: Maximum length to include
+            max_tokens: Token budget, or None to keep the input whole
+            model: Model whose tokenizer counts the tokens
+            priorities: Optional dict of priority weights for dict input keys
             
         Returns:
             str: Processed input data
         """
-        # Handle string inputs
-        if isinstance(input_data, str):
-            return input_data[:max_length]
+        # Handle dictionaries with multiple inputs
+        if isinstance(input_data, dict):
+            headers = {key: f"{str(key).upper()}:\n" for key in input_data}
+            sections = {key: BaseTask.render_input(value) for key, value in input_data.items()}
             
-        # Handle task objects
-        elif hasattr(input_data, 'get'):
-            return input_data.get("output", "")[:max_length]
+            if max_tokens is None:
+                return "\n\n".join(f"{headers[key]}{text}" for key, text in sections.items())
             
-        # Handle objects with output attribute
-        elif hasattr(input_data, 'output'):
-            return str(input_data.output)[:max_length]
+            # Headers and the blank lines between sections aren't truncated
+            overhead = sum(count_tokens(header, model) + 1 for header in headers.values())
+            allocations = allocate_token_budget(
+                {key: count_tokens(text, model) for key, text in sections.items()},
+                max_tokens - overhead,
+                priorities
+            )
             
-        # Handle dictionaries with multiple inputs
-        elif isinstance(input_data, dict):
-            sections = []
-            for key, value in input_data.items():
-                if isinstance(value, str):
-                    content = value[:max_length//len(input_data)]
-                else:
-                    content = str(value)[:max_length//len(input_data)]
-                sections.append(f"{key.upper()}:\n{content}")
-            return "\n\n".join(sections)
-            
-        # Handle other types
-        else:
-            return str(input_data)[:max_length]
+            return "\n\n".join(
+                f"{headers[key]}{truncate_to_tokens(text, allocations[key], model)}"
+                for key, text in sections.items()
+            )
+        
+        # Handle strings, tasks, task outputs and other types
+        if max_tokens is None:
+            return BaseTask.render_input(input_data)
+        return truncate_to_tokens(BaseTask.render_input(input_data), max_tokens, model)
+    
+    @staticmethod
+    def render_input(value):
+        """
+        Render one input value as prompt text
+        
+        Args:
+            value: String, CrewAI task, task output or other value
+            
+        Returns:
+            str: Text for the prompt
+        """
+        if isinstance(value, str):
+            return value
+        
+        # A task that hasn't run yet reaches the agent as context when the crew runs it
+        if isinstance(value, Task):
+            if value.output is not None:
+                return value.output.raw
+            return f"(The output of the {value.name or 'previous'} task, provided in the context.)"
+        
+        # Task outputs
+        if hasattr(value, "raw"):
+            return str(value.raw)
+        
+        # Objects with output attribute
+        if hasattr(value, "output"):
+            return str(value.output)
+        
+        return str(value)
     
     @staticmethod
-    def execute_with_agent(task, agent_id=None, agent_instance=None, max_attempts=1):
+    def execute_with_agent(task, agent_id=None, agent_instance=None, max_attempts=None):
         """
         Execute a task with a specified agent
         
@@ -102,7 +291,7 @@ class BaseTask:
             task: Task to execute
             agent_id: ID of agent to use (alternative to agent_instance)
             agent_instance: Agent instance to use (alternative to agent_id)
-            max_attempts: Maximum number of execution attempts
+            max_attempts: Maximum number of execution attempts (default: TASK_RETRY_ATTEMPTS)
             
         Returns:
             str: Task result
@@ -115,4 +304,26 @@ class BaseTask:
             raise ValueError("Either agent_id or agent_instance must be provided")
             
         # Execute the task
-        return agent_instance.execute_task(task, max_iterations=max_attempts)
\ No newline at end of file
+        return agent_instance.execute_task(task, max_iterations=max_attempts)
+    
+    @staticmethod
+    async def aexecute_with_agent(task, agent_id=None, agent_instance=None, max_attempts=None):
+        """
+        Execute a task with a specified agent without blocking the event loop
+        
+        Args:
+            task: Task to execute
+            agent_id: ID of agent to use (alternative to agent_instance)
+            agent_instance: Agent instance to use (alternative to agent_id)
+            max_attempts: Maximum number of execution attempts (default: TASK_RETRY_ATTEMPTS)
+            
+        Returns:
+            str: Task result
+        """
+        if agent_id and not agent_instance:
+            agent_instance = get_agent(agent_id)
+            
+        if not agent_instance:
+            raise ValueError("Either agent_id or agent_instance must be provided")
+            
+        return await agent_instance.aexecute_task(task, max_iterations=max_attempts)
\ No newline at end of file
@@ -18,6 +18,7 @@ class TranscriptionTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="transcript_refinement",
             description="""
             Your task is to review and refine the following transcript:
             
@@ -48,6 +49,7 @@ class TranscriptionTask(BaseTask):
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="transcript_segmentation",
             description="""
             Your task is to segment the podcast transcript into logical sections:
             
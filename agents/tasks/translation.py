@@ -1,23 +1,26 @@
 # agents/tasks/translation.py
 from agents.tasks.task_base import BaseTask
+from agents.schemas import MeetingTranslationOutput, SegmentTranslationsOutput, LocalizationOutput
 
 class TranslationTask(BaseTask):
     """Tasks related to translation and localization of podcast content"""
     
     @staticmethod
-    def create_translation_task(agent, input_data):
+    def create_translation_task(agent, input_data, name=None):
         """
         Create a general text translation task
         
         Args:
             agent: Translator agent (ID or instance)
             input_data: Dict with text and target_language (and optional source_language)
+            name: Optional task name (defaults to the task type)
             
         Returns:
             Task: Translation task
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="translation",
             description="""
             Your task is to translate the provided text to the target language:
             
@@ -30,11 +33,12 @@ class TranslationTask(BaseTask):
             Provide only the translated text without explanations or notes.
             """,
             expected_output="The translated text in the target language.",
-            input_data=input_data
+            input_data=input_data,
+            name=name
         )
     
     @staticmethod
-    def create_summary_translation_task(agent, summary_content, target_language):
+    def create_summary_translation_task(agent, summary_content, target_language, name=None):
         """
         Create a podcast summary translation task
         
@@ -42,6 +46,7 @@ class TranslationTask(BaseTask):
             agent: Translator agent (ID or instance)
             summary_content: Podcast summary content
             target_language: Target language code or name
+            name: Optional task name (defaults to the task type)
             
         Returns:
             Task: Summary translation task
@@ -53,6 +58,7 @@ class TranslationTask(BaseTask):
         
         return BaseTask.create_task(
             agent=agent,
+            task_type="summary_translation",
             description=f"""
             Your task is to translate the podcast summary to {target_language}:
             
@@ -65,23 +71,102 @@ class TranslationTask(BaseTask):
             The translation should be suitable for international business audience.
             """,
             expected_output=f"The podcast summary translated to {target_language}.",
-            input_data=input_data
+            input_data=input_data,
+            name=name
+        )
+    
+    @staticmethod
+    def create_meeting_translation_task(agent, summary_content, action_items, target_language, name=None):
+        """
+        Create a task translating a Meeting's summary and action items in one structured answer
+        
+        Args:
+            agent: Translator agent (ID or instance)
+            summary_content: Meeting summary
+            action_items: List of action items
+            target_language: Target language code or name
+            name: Optional task name (defaults to the task type)
+            
+        Returns:
+            Task: Meeting translation task with a MeetingTranslationOutput answer
+        """
+        action_items_text = "\n".join(f"- {item}" for item in action_items)
+        
+        return BaseTask.create_task(
+            agent=agent,
+            task_type="meeting_translation",
+            description=f"""
+            Your task is to translate the Meeting summary and action items to {target_language}:
+            
+            1. Maintain the original meaning and tone
+            2. Translate every action item, keeping them in the original order
+            3. Adapt any industry-specific terminology appropriately
+            4. Keep important names, brands, and key terms identifiable
+            5. Ensure the translation sounds natural in {target_language}
+            
+            Set language to "{target_language}".
+            """,
+            expected_output=f"The summary and action items translated to {target_language}.",
+            input_data=f"SUMMARY:\n{summary_content}\n\nACTION ITEMS:\n{action_items_text}",
+            output_schema=MeetingTranslationOutput,
+            name=name
+        )
+    
+    @staticmethod
+    def create_segment_translation_task(agent, segments, target_language, source_language=None, name=None):
+        """
+        Create a task translating a batch of numbered segments in one structured answer
+        
+        Args:
+            agent: Translator agent (ID or instance)
+            segments: List of text segments (sentences or list items)
+            target_language: Target language code or name
+            source_language: Optional source language
+            name: Optional task name (defaults to the task type)
+            
+        Returns:
+            Task: Segment translation task with a SegmentTranslationsOutput answer
+        """
+        source = f" from {source_language}" if source_language else ""
+        numbered_segments = "\n".join(f"{index}. {segment}" for index, segment in enumerate(segments, 1))
+        
+        return BaseTask.create_task(
+            agent=agent,
+            task_type="segment_translation",
+            description=f"""
+            Your task is to translate each of the {len(segments)} numbered segments{source} to {target_language}:
+            
+            1. Translate every segment separately, in the order given
+            2. Return exactly one translation per segment, without its number
+            3. Use the other segments as context, but never merge or split segments
+            4. Keep names, brands, figures and technical terminology accurate
+            5. Ensure each translation sounds natural in {target_language}
+            """,
+            expected_output=f"The {len(segments)} segments translated to {target_language}, in order.",
+            input_data=numbered_segments,
+            # Every segment must reach the model verbatim; the translator sizes the batches
+            truncate_input=False,
+            compression=False,
+            output_schema=SegmentTranslationsOutput,
+            name=name
         )
     
     @staticmethod
-    def create_localization_task(agent, input_data):
+    def create_localization_task(agent, input_data, name=None):
         """
         Create a content localization task
         
         Args:
             agent: Translator agent (ID or instance)
             input_data: Dict with content and target_region
+            name: Optional task name (defaults to the task type)
             
         Returns:
             Task: Localization task
         """
         return BaseTask.create_task(
             agent=agent,
+            task_type="localization",
             description="""
             Your task is to localize the content for the specified target region:
             
@@ -94,7 +179,50 @@ class TranslationTask(BaseTask):
             The localized content should feel natural to someone from the target region.
             """,
             expected_output="The localized content adapted for the target region.",
-            input_data=input_data
+            input_data=input_data,
+            name=name
+        )
+    
+    @staticmethod
+    def create_regional_localization_task(agent, content, language, regions, content_language=None, name=None):
+        """
+        Create a task localizing content for several regions that share a language
+        
+        Args:
+            agent: Translator agent (ID or instance)
+            content: Content to localize, ideally already in the regions' language
+            language: Language the regions read
+            regions: List of target regions or cultures
+            content_language: Language the content is in (defaults to the regions' language)
+            name: Optional task name (defaults to the task type)
+            
+        Returns:
+            Task: Localization task with a LocalizationOutput answer
+        """
+        content_language = content_language or language
+        if content_language.lower() == language.lower():
+            starting_point = f"The content is already in {language}; start from it as given"
+        else:
+            starting_point = f"The content is in {content_language}; translate it to {language} first"
+        
+        return BaseTask.create_task(
+            agent=agent,
+            task_type="localization",
+            description=f"""
+            Your task is to localize the content for each of these regions, whose readers use {language}: {", ".join(regions)}.
+            
+            1. {starting_point}
+            2. Change only what each region needs: spelling, terminology, currency, dates, units and cultural references
+            3. Consider local sensitivities and taboos
+            4. Maintain the overall meaning and purpose of the content
+            5. Return one localization per region, with the region exactly as listed
+            
+            Each localized version should feel natural to someone from its region.
+            """,
+            expected_output=f"The content localized for {', '.join(regions)}.",
+            input_data=f"REGIONS: {', '.join(regions)}\n\nCONTENT:\n{content}",
+            output_schema=LocalizationOutput,
+            name=name
         )
     
     @staticmethod
@@ -117,6 +245,7 @@ class TranslationTask(BaseTask):
         
         return BaseTask.create_task(
             agent=agent,
+            task_type="multilingual_summary",
             description="""
             Your task is to create a multilingual version of the podcast summary:
             
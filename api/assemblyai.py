@@ -1,6 +1,7 @@
 # api/assemblyai.py
 import assemblyai as aai
 from utils.config import get_assemblyai_api_key
+from utils.instrumentation import span
 
 def initialize_assemblyai():
     """Initialize AssemblyAI client with API key"""
@@ -8,6 +9,27 @@ def initialize_assemblyai():
     aai.settings.api_key = api_key
     return api_key
 
+def run_transcription(transcriber, audio_file_path, operation, config=None):
+    """
+    Transcribe an audio file, recording the call's wall time and audio duration
+    
+    Args:
+        transcriber: AssemblyAI Transcriber
+        audio_file_path: Path to the audio file
+        operation: Operation name recorded on the span
+        config: Optional TranscriptionConfig
+        
+    Returns:
+        Transcript: AssemblyAI transcript
+    """
+    with span("assemblyai", operation) as transcription_span:
+        transcript = transcriber.transcribe(audio_file_path, config=config)
+        transcription_span.set_attribute("status", str(transcript.status))
+        transcription_span.set_attribute("audio_duration", getattr(transcript, "audio_duration", None))
+        transcription_span.set_attribute("characters", len(transcript.text or ""))
+    
+    return transcript
+
 def transcribe_podcast(audio_file_path):
     """
     Transcribe a Meeting audio file using AssemblyAI
@@ -26,7 +48,7 @@ def transcribe_podcast(audio_file_path):
     
     # Transcribe the audio file
     print(f"Transcribing audio file: {audio_file_path}")
-    transcript = transcriber.transcribe(audio_file_path)
+    transcript = run_transcription(transcriber, audio_file_path, "transcribe")
     
     # Check if transcription was successful
     if transcript.status == "completed":
@@ -60,7 +82,7 @@ def transcribe_with_speaker_diarization(audio_file_path):
     )
     
     # Transcribe the audio file
-    transcript = transcriber.transcribe(audio_file_path, config=config)
+    transcript = run_transcription(transcriber, audio_file_path, "transcribe_with_speaker_diarization", config=config)
     
     # Return utterances with speaker information
     return transcript.utterances
@@ -87,7 +109,7 @@ def transcribe_with_topic_detection(audio_file_path):
     )
     
     # Transcribe the audio file
-    transcript = transcriber.transcribe(audio_file_path, config=config)
+    transcript = run_transcription(transcriber, audio_file_path, "transcribe_with_topic_detection", config=config)
     
     # Return the transcript and chapters (topics)
     return {
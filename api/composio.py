@@ -1,5 +1,7 @@
 # api/composio.py
 from utils.config import get_composio_api_key
+from utils.instrumentation import span
+from utils.metrics import record_email
 import requests
 import json
 
@@ -69,19 +71,20 @@ def send_email_summary(podcast_data, recipients):
     for recipient in recipients:
         try:
             # Make a direct API call to Composio
-            response = requests.post(
-                "https://api.composio.dev/v1/send",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json"
-                },
-                json={
-                    "to": recipient,
-                    "from": "Meeting-analyzer@company.com",
-                    "subject": f"Meeting Summary: {podcast_data['title']}",
-                    "html": email_html
-                }
-            )
+            with span("composio", "send_email"):
+                response = requests.post(
+                    "https://api.composio.dev/v1/send",
+                    headers={
+                        "Authorization": f"Bearer {api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "to": recipient,
+                        "from": "Meeting-analyzer@company.com",
+                        "subject": f"Meeting Summary: {podcast_data['title']}",
+                        "html": email_html
+                    }
+                )
             
             if response.status_code == 200:
                 print(f"Email sent successfully to {recipient}")
@@ -92,5 +95,7 @@ def send_email_summary(podcast_data, recipients):
         except Exception as e:
             print(f"Exception sending email to {recipient}: {str(e)}")
             results.append({"recipient": recipient, "status": "error", "message": str(e)})
+        
+        record_email(results[-1]["status"])
     
     return results
\ No newline at end of file
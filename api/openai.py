@@ -1,17 +1,63 @@
 # api/openai.py
+import threading
 import requests
 from langchain_openai import ChatOpenAI
 from utils.config import get_openai_api_key
+from utils.instrumentation import span
+from utils.singleflight import get_single_flight, request_key
+from utils.rate_limiter import get_rate_limiter, estimate_tokens, DEFAULT_COMPLETION_TOKENS, parse_retry_after, is_rate_limit_error, retry_after_from_error
 
-def get_openai_client():
+# Shared clients keyed by model so HTTP connections are pooled across calls
+_openai_clients = {}
+_openai_clients_lock = threading.Lock()
+
+# Optional callable taking a model name and returning a chat client (e.g. a
+# fake backend for offline benchmarks); ChatOpenAI is used when unset
+_client_factory = None
+
+# Shared session for direct REST calls (embeddings)
+_http_session = requests.Session()
+
+# Attempts for a request that is rejected with a rate limit error
+MAX_RATE_LIMIT_ATTEMPTS = 4
+
+def get_openai_client(model="gpt-4o"):
     """
     Get a configured OpenAI client from LangChain
     
+    Args:
+        model: OpenAI model to use
+        
     Returns:
         ChatOpenAI: Configured OpenAI client
     """
-    api_key = get_openai_api_key()
-    return ChatOpenAI(api_key=api_key, model="gpt-4o")
+    client = _openai_clients.get(model)
+    
+    if client is None:
+        with _openai_clients_lock:
+            client = _openai_clients.get(model)
+            if client is None:
+                if _client_factory is not None:
+                    client = _client_factory(model)
+                else:
+                    api_key = get_openai_api_key()
+                    client = ChatOpenAI(api_key=api_key, model=model)
+                _openai_clients[model] = client
+    
+    return client
+
+def set_openai_client_factory(factory):
+    """
+    Replace the chat client backend, dropping any cached clients
+    
+    Args:
+        factory: Callable taking a model name and returning a chat client, or None to restore ChatOpenAI
+    """
+    global _client_factory
+    
+    with _openai_clients_lock:
+        _openai_clients.clear()
+        _client_factory = factory
 
 def generate_embeddings(text):
     """
@@ -24,18 +70,34 @@ def generate_embeddings(text):
         list: Vector embedding
     """
     api_key = get_openai_api_key()
+    limiter = get_rate_limiter("openai_embeddings")
     
-    response = requests.post(
-        "https://api.openai.com/v1/embeddings",
-        headers={
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        },
-        json={
-            "input": text,
-            "model": "text-embedding-3-small"
-        }
-    )
+    with span("openai", "text-embedding-3-small", operation="embeddings", characters=len(text)) as embedding_span:
+        for attempt in range(MAX_RATE_LIMIT_ATTEMPTS):
+            with limiter.acquire(estimate_tokens(text)) as permit:
+                response = _http_session.post(
+                    "https://api.openai.com/v1/embeddings",
+                    headers={
+                        "Authorization": f"Bearer {api_key}",
+                        "Content-Type": "application/json"
+                    },
+                    json={
+                        "input": text,
+                        "model": "text-embedding-3-small"
+                    }
+                )
+                
+                # Back off and retry once the limiter's pause is over
+                if response.status_code == 429 and attempt < MAX_RATE_LIMIT_ATTEMPTS - 1:
+                    permit.record_rate_limited(parse_retry_after(response.headers))
+                    embedding_span.record_retry()
+                    continue
+                
+                if response.status_code == 200:
+                    usage = response.json().get("usage", {})
+                    permit.record_tokens(usage.get("total_tokens"))
+                    embedding_span.record_tokens(usage.get("prompt_tokens"), model="text-embedding-3-small")
+            break
     
     # Check if request was successful
     if response.status_code != 200:
@@ -68,7 +130,58 @@ def chat_completion(prompt, system_message=None, temperature=0.7):
     # Add user message
     messages.append({"role": "user", "content": prompt})
     
-    # Generate completion
-    completion = client.invoke(prompt)
+    # Generate completion within the shared chat budget
+    completion = invoke_chat_model(client, prompt)
     
-    return completion.content
\ No newline at end of file
+    return completion.content
+
+def invoke_chat_model(client, prompt, operation="chat"):
+    """
+    Invoke a LangChain chat model within the shared chat budget
+    
+    A caller making the same request as one already in flight (e.g. several
+    users asking the same question about the same Meeting) waits for that
+    request's response instead of making its own.
+    
+    Args:
+        client: ChatOpenAI client
+        prompt: Prompt or list of messages
+        operation: Operation name recorded on the span
+        
+    Returns:
+        AIMessage: Model response
+    """
+    # Identical prompts to the same model in flight at once share one request
+    key = request_key(client.model_name, prompt)
+    return get_single_flight("openai_chat").do(key, lambda: _invoke_chat_model(client, prompt, operation))
+
+def _invoke_chat_model(client, prompt, operation):
+    """Make the chat model request for invoke_chat_model"""
+    with span("openai", client.model_name, operation=operation) as chat_span:
+        with get_rate_limiter("openai_chat").acquire(estimate_tokens(prompt) + DEFAULT_COMPLETION_TOKENS) as permit:
+            try:
+                completion = client.invoke(prompt)
+            except Exception as e:
+                if is_rate_limit_error(e):
+                    permit.record_rate_limited(retry_after_from_error(e))
+                raise
+            
+            permit.record_tokens(get_total_tokens(completion))
+        
+        usage = getattr(completion, "usage_metadata", None) or {}
+        chat_span.record_tokens(usage.get("input_tokens"), usage.get("output_tokens"), model=client.model_name)
+    
+    return completion
+
+def get_total_tokens(message):
+    """
+    Get the total tokens used by a LangChain chat response
+    
+    Args:
+        message: AIMessage returned by a chat model
+        
+    Returns:
+        int: Prompt plus completion tokens, or None if not reported
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    return usage.get("total_tokens")
\ No newline at end of file
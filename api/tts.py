@@ -3,11 +3,20 @@ import os
 import requests
 import tempfile
 from utils.config import get_openai_api_key
+from utils.instrumentation import span
+from utils.rate_limiter import get_rate_limiter, parse_retry_after
+from utils.singleflight import get_single_flight, request_key
+
+# Attempts for a request that is rejected with a rate limit error
+MAX_RATE_LIMIT_ATTEMPTS = 4
 
 def text_to_speech(text, output_format="mp3", voice="alloy", model="tts-1"):
     """
     Convert text to speech using OpenAI's text-to-speech API
     
+    A caller converting the same text as a conversion already in flight
+    waits for it and gets the same audio file.
+    
     Args:
         text: Text to convert to speech
         output_format: Output format (mp3, opus, aac, flac)
@@ -16,6 +25,12 @@ def text_to_speech(text, output_format="mp3", voice="alloy", model="tts-1"):
     Returns:
         str: Path to the audio file
     """
+    # Identical conversions in flight at once share one request
+    key = request_key(model, voice, output_format, text)
+    return get_single_flight("openai_tts").do(key, lambda: _synthesize_speech(text, output_format, voice, model))
+
+def _synthesize_speech(text, output_format, voice, model):
+    """Make the text-to-speech request for text_to_speech"""
     # Get OpenAI API key
     api_key = get_openai_api_key()
     
@@ -37,11 +52,25 @@ def text_to_speech(text, output_format="mp3", voice="alloy", model="tts-1"):
     }
     
     try:
-        response = requests.post(
-            "https://api.openai.com/v1/audio/speech",
-            headers=headers,
-            json=payload
-        )
+        limiter = get_rate_limiter("openai_tts")
+        
+        with span("tts", model, voice=voice, characters=len(text)) as tts_span:
+            for attempt in range(MAX_RATE_LIMIT_ATTEMPTS):
+                with limiter.acquire() as permit:
+                    response = requests.post(
+                        "https://api.openai.com/v1/audio/speech",
+                        headers=headers,
+                        json=payload
+                    )
+                    
+                    # Back off and retry once the limiter's pause is over
+                    if response.status_code == 429 and attempt < MAX_RATE_LIMIT_ATTEMPTS - 1:
+                        permit.record_rate_limited(parse_retry_after(response.headers))
+                        tts_span.record_retry()
+                        continue
+                break
+            
+            tts_span.set_attribute("status_code", response.status_code)
         
         # Check for errors
         if response.status_code != 200:
@@ -1,6 +1,24 @@
 # api/wiki_api.py
 import requests
 import json
+from utils.singleflight import get_single_flight, request_key
+
+def _get(url, params):
+    """
+    Make a Wikipedia API request
+    
+    Identical requests in flight at once (e.g. researchers and fact
+    checkers looking up the same topic) share one response.
+    
+    Args:
+        url (str): API URL
+        params (dict): Request parameters
+        
+    Returns:
+        requests.Response: Response
+    """
+    key = request_key(url, params)
+    return get_single_flight("wikipedia").do(key, lambda: requests.get(url, params=params))
 
 def search_wikipedia(query, limit=1, language="en"):
     """
@@ -30,7 +48,7 @@ def search_wikipedia(query, limit=1, language="en"):
         }
         
         # Make the request
-        response = requests.get(url, params=params)
+        response = _get(url, params)
         
         # Check if the request was successful
         if response.status_code == 200:
@@ -82,7 +100,7 @@ def get_wikipedia_summary(title, language="en"):
         }
         
         # Make the request
-        response = requests.get(url, params=params)
+        response = _get(url, params)
         
         # Check if the request was successful
         if response.status_code == 200:
@@ -128,7 +146,7 @@ def search_wikipedia_with_suggestions(query, limit=3, language="en"):
             "namespace": 0,
         }
         
-        response = requests.get(url, params=params)
+        response = _get(url, params)
         
         if response.status_code != 200:
             print(f"Wikipedia API request failed with status {response.status_code}")
@@ -1,4 +1,6 @@
-from api.openai import get_openai_client
+from api.openai import get_openai_client, invoke_chat_model
+from utils.instrumentation import open_span, close_span
+from utils.rate_limiter import get_rate_limiter, estimate_tokens, DEFAULT_COMPLETION_TOKENS, is_rate_limit_error, retry_after_from_error
 from database.mongodb import get_podcast_by_title
 
 def generate_answer(podcast_data, user_question):
@@ -16,9 +18,81 @@ def generate_answer(podcast_data, user_question):
     openai_client = get_openai_client()
     
     # Check if podcast_data is complete or needs more information
-    if not podcast_data.get("summary") or podcast_data.get("summary") == "Summary not available":
-        return "I'm sorry, but I don't have enough information about this Meeting. It may not have been fully analyzed yet."
+    if not has_answerable_content(podcast_data):
+        return NOT_ENOUGH_INFORMATION_ANSWER
     
+    # Create a prompt for the AI
+    prompt = build_answer_prompt(podcast_data, user_question)
+    
+    # Generate an answer within the shared chat budget
+    completion = invoke_chat_model(openai_client, prompt, operation="answer")
+    
+    return completion.content
+
+def stream_answer(podcast_data, user_question):
+    """
+    Stream an answer to a user question based on Meeting data
+    
+    Args:
+        Meeting_data: Dictionary containing Meeting information
+        user_question: User's question
+        
+    Yields:
+        str: Chunks of the generated answer as they arrive
+    """
+    if not has_answerable_content(podcast_data):
+        yield NOT_ENOUGH_INFORMATION_ANSWER
+        return
+    
+    openai_client = get_openai_client()
+    prompt = build_answer_prompt(podcast_data, user_question)
+    
+    # The span isn't made active because a generator may be resumed from
+    # a different context (e.g. Starlette's thread pool)
+    stream_span = open_span("openai", openai_client.model_name, operation="stream_answer")
+    error = None
+    
+    with get_rate_limiter("openai_chat").acquire(estimate_tokens(prompt) + DEFAULT_COMPLETION_TOKENS) as permit:
+        try:
+            for chunk in openai_client.stream(prompt):
+                if chunk.content:
+                    yield chunk.content
+        except Exception as e:
+            error = e
+            if is_rate_limit_error(e):
+                permit.record_rate_limited(retry_after_from_error(e))
+            raise
+        finally:
+            close_span(stream_span, error)
+
+NOT_ENOUGH_INFORMATION_ANSWER = (
+    "I'm sorry, but I don't have enough information about this Meeting. "
+    "It may not have been fully analyzed yet."
+)
+
+def has_answerable_content(podcast_data):
+    """
+    Check whether the Meeting data has enough content to answer questions
+    
+    Args:
+        Meeting_data: Dictionary containing Meeting information
+        
+    Returns:
+        bool: True if a summary is available
+    """
+    return bool(podcast_data.get("summary")) and podcast_data.get("summary") != "Summary not available"
+
+def build_answer_prompt(podcast_data, user_question):
+    """
+    Build the question-answering prompt for a Meeting
+    
+    Args:
+        Meeting_data: Dictionary containing Meeting information
+        user_question: User's question
+        
+    Returns:
+        str: Prompt for the LLM
+    """
     # Create a context for the AI to use
     context = f"""
     Meeting Title: {podcast_data.get('title', 'Unknown Title')}
@@ -37,8 +111,7 @@ def generate_answer(podcast_data, user_question):
     {', '.join(podcast_data.get('action_items', ['No action items available']))}
     """
     
-    # Create a prompt for the AI
-    prompt = f"""
+    return f"""
     You are a helpful assistant that answers questions about Meetings.
     Use the following Meeting information to answer the user's question.
     Only use information from the provided context. If the answer cannot be found
@@ -49,11 +122,6 @@ def generate_answer(podcast_data, user_question):
     
     User Question: {user_question}
     """
-    
-    # Generate an answer
-    completion = openai_client.invoke(prompt)
-    
-    return completion.content
 
 def get_podcast_data_by_id(podcast_id):
     """
@@ -0,0 +1,426 @@
+# app/pipeline.py
+import asyncio
+import inspect
+import json
+import uuid
+from datetime import datetime
+from crews import get_crew
+from api.composio import send_email_summary
+from database.mongodb import store_podcast_data, update_podcast_data, get_podcast_by_id
+from database.qdrant import store_vectors
+from utils.instrumentation import start_run, span
+from utils.checkpoints import start_checkpointed_run, finish_checkpointed_run, get_resumable_run
+from utils.chunking import ChunkCache, chunk_cache_scope, chunk_transcript
+from utils.config import is_incremental_analysis_enabled
+
+def print_progress(level, message):
+    """
+    Default progress reporter that logs to stdout
+    
+    Args:
+        level: One of "info", "success" or "error"
+        message: Progress message
+    """
+    print(f"[{level}] {message}")
+
+def run_crew(crew, transcript):
+    """
+    Run a crew's analysis entry point on a transcript
+    
+    Args:
+        crew: Crew instance
+        transcript: Raw transcript text
+    
+    Returns:
+        str: JSON string with analysis results
+    """
+    # Run inside the crew's model scope so its per-agent models take
+    # precedence over the routing policy while tasks are built
+    with crew.model_scope():
+        # The fact checking crew exposes run_fact_check instead of run_analysis
+        if hasattr(crew, "run_analysis"):
+            return crew.run_analysis(transcript)
+        return crew.run_fact_check(transcript)
+
+async def arun_crew(crew, transcript):
+    """
+    Run a crew's analysis entry point on a transcript without blocking the event loop
+    
+    Crews with an async entry point (arun_analysis, or arun_fact_check for
+    the fact checking crew) run on the event loop; others, like the
+    composite crew, run in a worker thread.
+    
+    Args:
+        crew: Crew instance
+        transcript: Raw transcript text
+    
+    Returns:
+        str: JSON string with analysis results
+    """
+    if hasattr(crew, "arun_analysis"):
+        entry_point = crew.arun_analysis
+    elif hasattr(crew, "arun_fact_check"):
+        entry_point = crew.arun_fact_check
+    else:
+        return await asyncio.to_thread(run_crew, crew, transcript)
+    
+    with crew.model_scope():
+        return await entry_point(transcript)
+
+def get_crew_type(crew):
+    """
+    Get the crew type a crew instance was built as
+    
+    Args:
+        crew: Crew instance
+    
+    Returns:
+        str: Crew type from AVAILABLE_CREWS, or None for other crews
+    """
+    from crews import AVAILABLE_CREWS
+    
+    for crew_type, crew_class in AVAILABLE_CREWS.items():
+        if type(crew) is crew_class:
+            return crew_type
+    
+    return None
+
+def build_crew(crew_type, model="gpt-4o", target_languages=None, crew_types=None):
+    """
+    Create a crew, passing target languages and crew types only to crews that accept them
+    
+    Args:
+        crew_type: Type of crew to create
+        model: LLM model to use
+        target_languages: Optional list of languages for multilingual crews
+        crew_types: Optional list of crew types for the composite crew
+    
+    Returns:
+        BaseCrew: Configured crew instance
+    """
+    from crews import AVAILABLE_CREWS
+    
+    crew_kwargs = {"model": model}
+    
+    if (target_languages or crew_types) and crew_type in AVAILABLE_CREWS:
+        parameters = inspect.signature(AVAILABLE_CREWS[crew_type].__init__).parameters
+        if target_languages and "target_languages" in parameters:
+            crew_kwargs["target_languages"] = target_languages
+        if crew_types and "crew_types" in parameters:
+            crew_kwargs["crew_types"] = crew_types
+    
+    return get_crew(crew_type, **crew_kwargs)
+
+def build_podcast_data(title, transcript, analysis_result):
+    """
+    Build the Meeting document stored in MongoDB from an analysis result
+    
+    Args:
+        title: Meeting title
+        transcript: Raw transcript text
+        analysis_result: Parsed analysis result dictionary
+    
+    Returns:
+        dict: Meeting document
+    """
+    podcast_data = {
+        "title": title,
+        "date_analyzed": datetime.now().isoformat(),
+        "transcript": transcript,
+        "summary": analysis_result.get("summary", "Summary not available"),
+        "key_topics": analysis_result.get("key_topics", ["Topic information not available"]),
+        "sentiment": analysis_result.get("sentiment_analysis", "Sentiment analysis not available"),
+        "action_items": analysis_result.get("action_items", ["Action items not available"])
+    }
+    
+    # Add translations if available
+    if "translations" in analysis_result:
+        podcast_data["translations"] = analysis_result["translations"]
+    
+    # Keep each crew's results of a composite run
+    if "crews" in analysis_result:
+        podcast_data["crew_results"] = analysis_result["crews"]
+    
+    # Keep the run's token and latency accounting with the Meeting
+    if "run_report" in analysis_result:
+        podcast_data["run_report"] = analysis_result["run_report"]
+    
+    return podcast_data
+
+def load_chunk_cache(transcript, previous_meeting_id=None, progress=None):
+    """
+    Load the refined transcript chunks of a previously analyzed Meeting
+    
+    Args:
+        transcript: New raw transcript text
+        previous_meeting_id: Optional ID of the Meeting being re-analyzed
+        progress: Optional callback taking (level, message)
+    
+    Returns:
+        ChunkCache: Cache with the previous Meeting's chunks (empty if there is none)
+    """
+    report = progress or print_progress
+    
+    records = []
+    if previous_meeting_id:
+        try:
+            previous = get_podcast_by_id(previous_meeting_id, {"transcript_chunks": 1})
+            records = (previous or {}).get("transcript_chunks") or []
+        except Exception as e:
+            report("error", f"Error loading the previous analysis: {str(e)}")
+    
+    chunk_cache = ChunkCache(records)
+    if records:
+        chunks = chunk_transcript(transcript)
+        report("info", f"{chunk_cache.count_changed(chunks)} of {len(chunks)} transcript chunks changed since the last analysis")
+    elif previous_meeting_id:
+        report("info", "No refined chunks stored for the previous analysis; refining the whole transcript")
+    
+    return chunk_cache
+
+def analyze_transcript(title, transcript, crew_type="standard", model="gpt-4o",
+                       target_languages=None, recipients=None, crew=None, progress=None, run_id=None,
+                       previous_meeting_id=None, incremental=None, crew_types=None):
+    """
+    Run the full analysis pipeline for a transcript
+    
+    Runs the crew, stores the results in MongoDB and Qdrant, and emails the
+    summary to any recipients. Storage and email failures are reported through
+    the progress callback but do not abort the pipeline.
+    
+    The crew's tasks are checkpointed under the run ID, so a run whose crew
+    fails can be resumed with resume_analysis() without redoing the tasks
+    that completed. A failed run is not stored, indexed or emailed; only
+    the run that completes (possibly after resuming) is.
+    
+    In incremental mode the transcript is refined chunk by chunk and the
+    refined chunks are stored with the Meeting. Only the leading chunks that
+    fit in the analysis tasks' input budget are refined, since the tasks
+    never see the rest. Re-analyzing a Meeting with previous_meeting_id
+    refines only the chunks that changed since; every analysis task still
+    re-runs on the joined transcript, and that Meeting is updated instead
+    of a new one being stored. A failed re-analysis leaves the Meeting as
+    it was until the run is resumed.
+    
+    Args:
+        title: Meeting title
+        transcript: Raw transcript text
+        crew_type: Type of crew to run
+        model: LLM model to use
+        target_languages: Optional list of languages for multilingual crews
+        recipients: Optional list of email addresses to send the summary to
+        crew: Optional pre-built crew instance (overrides crew_type and model)
+        progress: Optional callback taking (level, message)
+        run_id: Optional ID of the run; pass the ID of a failed run to resume it
+        previous_meeting_id: Optional ID of a stored Meeting this transcript is a revision of
+        incremental: Refine chunk by chunk (default: INCREMENTAL_ANALYSIS, or on with previous_meeting_id)
+        crew_types: Optional list of crew types to combine when crew_type is "composite"
+    
+    Returns:
+        dict: Analysis outcome with analysis_result, podcast_data, summary_id and run_id
+              (podcast_data and summary_id are None if the run failed).
+              analysis_result["run_report"] holds the run's token and latency
+              accounting, which is also stored with the Meeting.
+    """
+    report = progress or print_progress
+    
+    # Collect token and latency accounting for the run (reusing the caller's
+    # run report if there is one, e.g. one that also covers transcription)
+    with start_run(title) as run_report, span("pipeline", "analyze_transcript", transcript_chars=len(transcript)):
+        crew, run_id, chunk_cache = _prepare_analysis(
+            title, transcript, crew_type, model, target_languages, recipients, crew, report,
+            run_id, previous_meeting_id, incremental, crew_types
+        )
+        
+        # Run the analysis
+        with span("stage", "crew_analysis", crew=type(crew).__name__, model=crew.model), chunk_cache_scope(chunk_cache):
+            try:
+                result_json = run_crew(crew, transcript)
+            except Exception as e:
+                finish_checkpointed_run(run_id, error=str(e))
+                raise
+            analysis_result = json.loads(result_json)
+        analysis_result["run_report"] = run_report.to_dict()
+        
+        return _complete_analysis(title, transcript, recipients, report, run_id, previous_meeting_id, chunk_cache, analysis_result)
+
+async def aanalyze_transcript(title, transcript, crew_type="standard", model="gpt-4o",
+                              target_languages=None, recipients=None, crew=None, progress=None, run_id=None,
+                              previous_meeting_id=None, incremental=None, crew_types=None):
+    """
+    Run the full analysis pipeline for a transcript without blocking the event loop
+    
+    The async counterpart of analyze_transcript(): the crew runs through
+    arun_crew(), on the event loop for crews with an async entry point,
+    while building the crew, checkpointing, storage, indexing and email
+    run in worker threads. The progress callback is called from those
+    worker threads, so it may block.
+    
+    Args:
+        title: Meeting title
+        transcript: Raw transcript text
+        crew_type: Type of crew to run
+        model: LLM model to use
+        target_languages: Optional list of languages for multilingual crews
+        recipients: Optional list of email addresses to send the summary to
+        crew: Optional pre-built crew instance (overrides crew_type and model)
+        progress: Optional callback taking (level, message)
+        run_id: Optional ID of the run; pass the ID of a failed run to resume it
+        previous_meeting_id: Optional ID of a stored Meeting this transcript is a revision of
+        incremental: Refine chunk by chunk (default: INCREMENTAL_ANALYSIS, or on with previous_meeting_id)
+        crew_types: Optional list of crew types to combine when crew_type is "composite"
+    
+    Returns:
+        dict: Analysis outcome, as from analyze_transcript()
+    """
+    report = progress or print_progress
+    
+    with start_run(title) as run_report, span("pipeline", "analyze_transcript", transcript_chars=len(transcript)):
+        crew, run_id, chunk_cache = await asyncio.to_thread(
+            _prepare_analysis, title, transcript, crew_type, model, target_languages, recipients, crew, report,
+            run_id, previous_meeting_id, incremental, crew_types
+        )
+        
+        with span("stage", "crew_analysis", crew=type(crew).__name__, model=crew.model), chunk_cache_scope(chunk_cache):
+            try:
+                result_json = await arun_crew(crew, transcript)
+            except Exception as e:
+                await asyncio.to_thread(finish_checkpointed_run, run_id, error=str(e))
+                raise
+            analysis_result = json.loads(result_json)
+        analysis_result["run_report"] = run_report.to_dict()
+        
+        return await asyncio.to_thread(
+            _complete_analysis, title, transcript, recipients, report, run_id, previous_meeting_id, chunk_cache, analysis_result
+        )
+
+def _prepare_analysis(title, transcript, crew_type, model, target_languages, recipients, crew, report,
+                      run_id, previous_meeting_id, incremental, crew_types):
+    """
+    Build the crew, record the run's inputs for resuming and load the chunk cache
+    
+    Returns:
+        tuple: (crew, run ID, ChunkCache or None when not incremental)
+    """
+    if incremental is None:
+        incremental = bool(previous_meeting_id) or is_incremental_analysis_enabled()
+    
+    if crew is None:
+        crew = build_crew(crew_type, model=model, target_languages=target_languages, crew_types=crew_types)
+    
+    # Record what's needed to rebuild the crew, so the run can be resumed by ID
+    run_id = run_id or uuid.uuid4().hex
+    crew.run_id = run_id
+    start_checkpointed_run(run_id, {
+        "title": title,
+        "transcript": transcript,
+        "crew_type": get_crew_type(crew) or crew_type,
+        "model": crew.model,
+        "target_languages": getattr(crew, "target_languages", None) or target_languages,
+        "crew_types": getattr(crew, "crew_types", None) or crew_types,
+        "recipients": recipients,
+        "previous_meeting_id": previous_meeting_id,
+        "incremental": incremental
+    })
+    
+    chunk_cache = load_chunk_cache(transcript, previous_meeting_id, report) if incremental else None
+    return crew, run_id, chunk_cache
+
+def _complete_analysis(title, transcript, recipients, report, run_id, previous_meeting_id, chunk_cache, analysis_result):
+    """
+    Finish the run's checkpoints and store, index and email a completed analysis
+    
+    Returns:
+        dict: Analysis outcome, as from analyze_transcript()
+    """
+    # Keep a failed run's checkpoints for resuming, drop a completed run's
+    finish_checkpointed_run(run_id, error=analysis_result.get("message") if analysis_result.get("error") else None)
+    if analysis_result.get("error"):
+        report("error", f"Analysis failed; resume it with run ID {run_id}")
+        return {
+            "analysis_result": analysis_result,
+            "podcast_data": None,
+            "summary_id": None,
+            "run_id": run_id
+        }
+    
+    # Prepare data for storage
+    podcast_data = build_podcast_data(title, transcript, analysis_result)
+    if chunk_cache is not None:
+        podcast_data["transcript_chunks"] = chunk_cache.to_records()
+    
+    # Store in MongoDB, replacing the previous analysis when re-analyzing
+    report("info", "Storing results in database...")
+    try:
+        with span("stage", "store_podcast_data", summary_chars=len(str(podcast_data["summary"]))):
+            if previous_meeting_id:
+                update_podcast_data(previous_meeting_id, podcast_data)
+                summary_id = str(previous_meeting_id)
+            else:
+                summary_id = store_podcast_data(podcast_data)
+        report("success", "Data stored successfully!")
+    except Exception as e:
+        report("error", f"Error storing data: {str(e)}")
+        summary_id = "mock_id_12345"
+    
+    # Store in Qdrant for vector search
+    report("info", "Storing vectors for semantic search...")
+    try:
+        with span("stage", "store_vectors", summary_chars=len(str(podcast_data["summary"]))):
+            # The refined chunks are only needed for re-analysis, not in the search payload
+            store_vectors({key: value for key, value in podcast_data.items() if key != "transcript_chunks"}, summary_id)
+        report("success", "Vectors stored successfully!")
+    except Exception as e:
+        report("error", f"Error storing vectors: {str(e)}")
+    
+    # Send email to board members
+    if recipients:
+        report("info", f"Sending summary email to {len(recipients)} recipients...")
+        try:
+            with span("stage", "send_email_summary", recipients=len(recipients)):
+                send_email_summary(podcast_data, recipients)
+            report("success", "Email sent successfully!")
+        except Exception as e:
+            report("error", f"Error sending email: {str(e)}")
+    
+    return {
+        "analysis_result": analysis_result,
+        "podcast_data": podcast_data,
+        "summary_id": summary_id,
+        "run_id": run_id
+    }
+
+def resume_analysis(run_id, progress=None):
+    """
+    Resume a failed analysis run from its task checkpoints
+    
+    The crew is rebuilt from the run's recorded inputs; tasks that completed
+    before the failure are restored instead of executed.
+    
+    Args:
+        run_id: ID of the failed run
+        progress: Optional callback taking (level, message)
+    
+    Returns:
+        dict: Analysis outcome, as from analyze_transcript()
+    """
+    run = get_resumable_run(run_id)
+    if run is None:
+        raise ValueError(f"No checkpoints found for run '{run_id}'")
+    
+    report = progress or print_progress
+    report("info", f"Resuming run {run_id} ({len(run.get('checkpoints') or {})} tasks checkpointed)")
+    
+    return analyze_transcript(
+        run["title"],
+        run["transcript"],
+        crew_type=run["crew_type"],
+        model=run["model"],
+        target_languages=run.get("target_languages"),
+        recipients=run.get("recipients"),
+        progress=progress,
+        run_id=run_id,
+        previous_meeting_id=run.get("previous_meeting_id"),
+        incremental=run.get("incremental"),
+        crew_types=run.get("crew_types")
+    )
@@ -0,0 +1,47 @@
+# app/resume.py
+"""
+Resume failed analysis runs from their task checkpoints
+
+    python -m app.resume            # list runs that have not completed
+    python -m app.resume RUN_ID     # resume a run
+
+Runs started through the API use the analysis job ID as the run ID.
+"""
+import argparse
+import sys
+from utils.config import load_environment
+
+def main(argv=None):
+    """Command line entry point"""
+    from app.pipeline import resume_analysis
+    from utils.checkpoints import list_resumable_runs
+    
+    parser = argparse.ArgumentParser(description="Resume a failed analysis run from its task checkpoints")
+    parser.add_argument("run_id", nargs="?", help="ID of the run to resume (lists runs if omitted)")
+    args = parser.parse_args(argv)
+    
+    load_environment()
+    
+    if not args.run_id:
+        runs = list_resumable_runs()
+        if not runs:
+            print("No runs to resume")
+        for run in runs:
+            print(f"{run['run_id']}  {run.get('status', 'unknown'):<8}  {run.get('crew_type')}  "
+                  f"{run.get('updated_at', '')}  {run.get('title', '')}  {run.get('error') or ''}")
+        return
+    
+    try:
+        outcome = resume_analysis(args.run_id)
+    except ValueError as e:
+        print(str(e), file=sys.stderr)
+        sys.exit(1)
+    
+    if outcome["analysis_result"].get("error"):
+        print(f"Run {args.run_id} failed again: {outcome['analysis_result'].get('message')}", file=sys.stderr)
+        sys.exit(1)
+    
+    print(f"Run {args.run_id} completed; Meeting stored as {outcome['summary_id']}")
+
+if __name__ == "__main__":
+    main()
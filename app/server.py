@@ -0,0 +1,354 @@
+# app/server.py
+"""
+HTTP API for Meeting analysis, semantic search and chat
+
+Run with:
+    uvicorn app.server:app --host 0.0.0.0 --port 8000
+
+The service is stateless apart from the shared MongoDB, Qdrant and OpenAI
+clients it holds, so several instances can run behind a load balancer.
+Analysis jobs are recorded in MongoDB so any instance can report their status;
+only while MongoDB is unavailable are they kept in a bounded in-process table.
+"""
+import asyncio
+import os
+import threading
+import uuid
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import Response, StreamingResponse
+from pydantic import BaseModel
+
+from utils.config import load_environment
+from utils.instrumentation import start_run, span
+from utils.tracing import setup_tracing
+from utils.metrics import setup_metrics, render_metrics
+from crews import list_available_crews
+from api.assemblyai import transcribe_podcast
+from app.chatbot import generate_answer, stream_answer, get_podcast_data_by_id
+from app.pipeline import aanalyze_transcript
+from utils.checkpoints import get_resumable_run
+from database.mongodb import (
+    get_mongodb_client,
+    is_mongodb_available,
+    get_podcast_by_id,
+    create_analysis_job,
+    update_analysis_job,
+    get_analysis_job
+)
+from database.qdrant import get_qdrant_client, search_similar_content
+
+# Fields returned for a Meeting when no projection is requested
+DEFAULT_MEETING_FIELDS = ["title", "date_analyzed", "summary", "key_topics", "sentiment", "action_items", "translations"]
+
+# Jobs this instance recorded while MongoDB was unavailable, least recently used first
+_local_jobs = OrderedDict()
+_local_jobs_lock = threading.Lock()
+MAX_LOCAL_JOBS = int(os.getenv("LOCAL_JOBS_MAX", "200"))
+
+class AnalysisRequest(BaseModel):
+    """Request body for submitting an analysis"""
+    title: str
+    transcript: Optional[str] = None
+    audio_url: Optional[str] = None
+    crew_type: str = "standard"
+    model: str = "gpt-4o"
+    target_languages: Optional[List[str]] = None
+    recipients: Optional[List[str]] = None
+    # Re-analyze a stored Meeting, refining only the transcript chunks that changed
+    previous_meeting_id: Optional[str] = None
+    incremental: Optional[bool] = None
+    # Crews to combine when crew_type is "composite"
+    crew_types: Optional[List[str]] = None
+
+class SearchRequest(BaseModel):
+    """Request body for semantic search"""
+    query: str
+    limit: int = 3
+
+class ChatRequest(BaseModel):
+    """Request body for chatting about a Meeting"""
+    meeting_id: str
+    question: str
+    stream: bool = False
+
+@asynccontextmanager
+async def lifespan(app):
+    """Create shared clients and the limit on concurrently running analysis jobs"""
+    load_environment()
+    setup_tracing()
+    setup_metrics()
+    
+    # Warm up the shared clients so the first request doesn't pay for connecting
+    get_mongodb_client()
+    get_qdrant_client()
+    
+    # Analysis jobs run on the event loop; at most ANALYSIS_WORKERS at once,
+    # the rest wait their turn as queued
+    app.state.analysis_slots = asyncio.Semaphore(int(os.getenv("ANALYSIS_WORKERS", "4")))
+    app.state.analysis_jobs = set()
+    
+    yield
+    
+    for task in app.state.analysis_jobs:
+        task.cancel()
+
+app = FastAPI(title="Meeting Analyzer API", version="2.0.0", lifespan=lifespan)
+
+def _get_local_job(job_id):
+    """Get a job from the local job table, or None"""
+    with _local_jobs_lock:
+        job = _local_jobs.get(job_id)
+        if job is None:
+            return None
+        _local_jobs.move_to_end(job_id)
+        return dict(job)
+
+def _save_local_job(job_id, update_data):
+    """Record a job in the local job table, evicting the least recently used jobs past LOCAL_JOBS_MAX"""
+    with _local_jobs_lock:
+        _local_jobs.setdefault(job_id, {"job_id": job_id}).update(update_data)
+        _local_jobs.move_to_end(job_id)
+        while len(_local_jobs) > MAX_LOCAL_JOBS:
+            _local_jobs.popitem(last=False)
+
+def _save_job_update(job_id, update_data):
+    """Record a job status change in MongoDB, or locally for jobs recorded while MongoDB was unavailable"""
+    update_data["updated_at"] = datetime.now().isoformat()
+    
+    with _local_jobs_lock:
+        local = job_id in _local_jobs
+    if local or not is_mongodb_available():
+        _save_local_job(job_id, update_data)
+    else:
+        update_analysis_job(job_id, update_data)
+
+def _schedule_analysis_job(job_id, request):
+    """
+    Run an analysis job on the event loop, keeping a reference to it until it finishes
+    
+    Args:
+        job_id: ID of the job
+        request: AnalysisRequest with the job parameters
+    """
+    task = asyncio.create_task(_run_analysis_job(job_id, request))
+    app.state.analysis_jobs.add(task)
+    task.add_done_callback(app.state.analysis_jobs.discard)
+
+async def _run_analysis_job(job_id, request):
+    """
+    Run an analysis job once a slot is free
+    
+    The crew runs on the event loop through aanalyze_transcript();
+    transcription and job status updates run in worker threads.
+    
+    Args:
+        job_id: ID of the job
+        request: AnalysisRequest with the job parameters
+    """
+    stages = []
+    
+    def record_progress(level, message):
+        # Called from the pipeline's worker threads
+        stages.append({"level": level, "message": message, "time": datetime.now().isoformat()})
+        _save_job_update(job_id, {"progress": stages})
+    
+    try:
+        async with app.state.analysis_slots:
+            # One run report and trace cover transcription and analysis
+            with start_run(request.title), span("pipeline", "analysis_job", job_id=job_id, crew_type=request.crew_type):
+                transcript = request.transcript
+                if not transcript:
+                    await asyncio.to_thread(_save_job_update, job_id, {"status": "transcribing"})
+                    with span("stage", "transcription"):
+                        transcript = await asyncio.to_thread(transcribe_podcast, request.audio_url)
+                
+                await asyncio.to_thread(_save_job_update, job_id, {"status": "analyzing"})
+                # The job ID doubles as the run ID its task checkpoints are kept under
+                outcome = await aanalyze_transcript(
+                    request.title,
+                    transcript,
+                    crew_type=request.crew_type,
+                    model=request.model,
+                    target_languages=request.target_languages,
+                    recipients=request.recipients,
+                    progress=record_progress,
+                    run_id=job_id,
+                    previous_meeting_id=request.previous_meeting_id,
+                    incremental=request.incremental,
+                    crew_types=request.crew_types
+                )
+        
+        analysis_result = outcome["analysis_result"]
+        if analysis_result.get("error"):
+            # The crew failed; its completed tasks are checkpointed for POST /analyses/{job_id}/resume
+            await asyncio.to_thread(_save_job_update, job_id, {
+                "status": "failed",
+                "error": analysis_result.get("message"),
+                "resumable": True,
+                "result": analysis_result
+            })
+            return
+        
+        await asyncio.to_thread(_save_job_update, job_id, {
+            "status": "completed",
+            "meeting_id": outcome["summary_id"],
+            "result": analysis_result
+        })
+    except Exception as e:
+        print(f"Error in analysis job {job_id}: {str(e)}")
+        await asyncio.to_thread(_save_job_update, job_id, {"status": "failed", "error": str(e)})
+
+def _serialize_meeting(podcast_data):
+    """Convert a Meeting document to a JSON-serializable dict"""
+    meeting = dict(podcast_data)
+    if "_id" in meeting:
+        meeting["id"] = str(meeting.pop("_id"))
+    return meeting
+
+@app.get("/health")
+async def health():
+    """Liveness check"""
+    return {"status": "ok"}
+
+@app.get("/metrics")
+async def metrics():
+    """Prometheus metrics (only when METRICS_ENABLED is on)"""
+    rendered = render_metrics()
+    if rendered is None:
+        raise HTTPException(status_code=404, detail="Metrics are disabled")
+    
+    body, content_type = rendered
+    return Response(content=body, media_type=content_type)
+
+@app.get("/crews")
+async def crews():
+    """List the available crew types"""
+    return {"crews": list_available_crews()}
+
+@app.post("/analyses", status_code=202)
+async def submit_analysis(request: AnalysisRequest):
+    """Submit a Meeting for analysis and return a job ID to poll"""
+    if not request.transcript and not request.audio_url:
+        raise HTTPException(status_code=400, detail="Either transcript or audio_url must be provided")
+    
+    if request.crew_type not in list_available_crews():
+        raise HTTPException(status_code=400, detail=f"Unknown crew type: {request.crew_type}")
+    
+    for crew_type in request.crew_types or []:
+        if crew_type not in list_available_crews() or crew_type == "composite":
+            raise HTTPException(status_code=400, detail=f"Unknown crew type to combine: {crew_type}")
+    
+    job_id = uuid.uuid4().hex
+    now = datetime.now().isoformat()
+    job = {
+        "job_id": job_id,
+        "status": "queued",
+        "title": request.title,
+        "crew_type": request.crew_type,
+        "model": request.model,
+        "created_at": now,
+        "updated_at": now
+    }
+    if not await asyncio.to_thread(is_mongodb_available) or not await asyncio.to_thread(create_analysis_job, job):
+        _save_local_job(job_id, job)
+    
+    _schedule_analysis_job(job_id, request)
+    
+    return {"job_id": job_id, "status": "queued"}
+
+@app.get("/analyses/{job_id}")
+async def get_analysis_status(job_id: str):
+    """Get the status (and result, once completed) of an analysis job"""
+    job = _get_local_job(job_id) or await asyncio.to_thread(get_analysis_job, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Analysis job '{job_id}' not found")
+    return job
+
+@app.post("/analyses/{job_id}/resume", status_code=202)
+async def resume_analysis_job(job_id: str):
+    """Resume a failed analysis job from its task checkpoints"""
+    job = _get_local_job(job_id) or await asyncio.to_thread(get_analysis_job, job_id)
+    if job and job.get("status") not in ("failed", None):
+        raise HTTPException(status_code=409, detail=f"Analysis job '{job_id}' is {job['status']}, not failed")
+    
+    try:
+        run = await asyncio.to_thread(get_resumable_run, job_id)
+    except ValueError:
+        run = None
+    if not run:
+        raise HTTPException(status_code=404, detail=f"No checkpoints found for analysis job '{job_id}'")
+    
+    # Rebuild the request from the run's recorded inputs; the transcript is kept, so no transcription
+    request = AnalysisRequest(
+        title=run["title"],
+        transcript=run["transcript"],
+        crew_type=run["crew_type"],
+        model=run["model"],
+        target_languages=run.get("target_languages"),
+        recipients=run.get("recipients"),
+        previous_meeting_id=run.get("previous_meeting_id"),
+        incremental=run.get("incremental"),
+        crew_types=run.get("crew_types")
+    )
+    await asyncio.to_thread(_save_job_update, job_id, {"status": "queued", "error": None, "resumable": False})
+    
+    _schedule_analysis_job(job_id, request)
+    
+    return {"job_id": job_id, "status": "queued", "checkpointed_tasks": len(run.get("checkpoints") or {})}
+
+@app.get("/meetings/{meeting_id}")
+async def get_meeting(meeting_id: str, fields: Optional[str] = None):
+    """
+    Get a Meeting by ID or title
+    
+    The optional fields parameter is a comma-separated projection, e.g.
+    ?fields=summary,action_items. The transcript is only returned when
+    explicitly requested.
+    """
+    projection = [field.strip() for field in fields.split(",") if field.strip()] if fields else DEFAULT_MEETING_FIELDS
+    
+    podcast_data = await asyncio.to_thread(get_podcast_by_id, meeting_id, projection)
+    if not podcast_data:
+        raise HTTPException(status_code=404, detail=f"Meeting '{meeting_id}' not found")
+    
+    return _serialize_meeting(podcast_data)
+
+@app.post("/search")
+async def search(request: SearchRequest):
+    """Semantic search over analyzed Meetings"""
+    results = await asyncio.to_thread(search_similar_content, request.query, request.limit)
+    
+    return {
+        "results": [
+            {
+                "score": result.score,
+                "title": (result.payload or {}).get("title"),
+                "summary": (result.payload or {}).get("summary"),
+                "key_topics": (result.payload or {}).get("key_topics", []),
+                "date_analyzed": (result.payload or {}).get("date_analyzed")
+            }
+            for result in results
+        ]
+    }
+
+@app.post("/chat")
+async def chat(request: ChatRequest):
+    """Answer a question about a Meeting, optionally streaming the answer"""
+    podcast_data = await asyncio.to_thread(get_podcast_data_by_id, request.meeting_id)
+    if not podcast_data:
+        raise HTTPException(status_code=404, detail=f"Meeting '{request.meeting_id}' not found")
+    
+    if request.stream:
+        # Starlette iterates sync generators in its thread pool
+        return StreamingResponse(stream_answer(podcast_data, request.question), media_type="text/plain")
+    
+    answer = await asyncio.to_thread(generate_answer, podcast_data, request.question)
+    return {
+        "answer": answer,
+        "source": podcast_data.get("title", "Unknown Meeting")
+    }
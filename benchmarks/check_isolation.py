@@ -0,0 +1,184 @@
+# benchmarks/check_isolation.py
+"""
+Cross-talk check for crews running concurrently in one process
+
+Runs several analyses at once on the fake LLM backend, each on a transcript
+tagged with its own marker (MEETING-0, MEETING-1, ...). The fake LLM echoes
+every marker it finds in a prompt, so each task output shows which
+transcripts reached its prompt:
+
+    python -m benchmarks.check_isolation --crews 8 --rounds 3 --crew-type standard --models gpt-4o,gpt-4o-mini
+
+With --async the analyses run as tasks on one event loop through
+arun_crew(), as the HTTP API runs them, instead of in a thread each.
+
+The exit status is 1 if any task output of an analysis carries another
+analysis's marker (or none at all), which is what shared per-run agent
+state (executors, crews, tools handlers) looks like from the outside. Races
+show up most with no latency, where the analyses' calls interleave most
+closely, so that is the default.
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import re
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Keep CrewAI from sending telemetry and satisfy clients that expect a key
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+os.environ.setdefault("DEBUG_OUTPUT_DIR", os.path.join(tempfile.gettempdir(), "meeting_analyzer_benchmarks"))
+
+# Results shared across runs would hide cross-talk, so every analysis does the full work
+for variable in ("ARTIFACT_STORE", "TRANSLATION_MEMORY"):
+    os.environ.setdefault(variable, "off")
+
+MARKER_PATTERN = r"MEETING-\d+"
+
+def tag_transcript(transcript, marker):
+    """Add a marker to every speaker turn of a transcript"""
+    return "\n".join(f"{line} ({marker})" for line in transcript.split("\n"))
+
+def run_tagged_analysis(crew_type, index, transcript_chars, model="gpt-4o"):
+    """
+    Run one analysis on a transcript tagged with its marker
+    
+    Args:
+        crew_type: Crew type from AVAILABLE_CREWS
+        index: Number of the analysis (its marker is MEETING-<index>)
+        transcript_chars: Transcript length in characters
+        model: Model of the crew
+    
+    Returns:
+        dict: Marker, markers echoed per task, and any error
+    """
+    from app.pipeline import build_crew, run_crew
+    
+    marker, transcript = tagged_transcript(index, transcript_chars)
+    crew = build_crew(crew_type, model=model)
+    return collect_markers(crew_type, crew, marker, json.loads(run_crew(crew, transcript)))
+
+async def arun_tagged_analysis(crew_type, index, transcript_chars, model="gpt-4o"):
+    """
+    Run one analysis like run_tagged_analysis, through the async entry point
+    
+    Args:
+        crew_type: Crew type from AVAILABLE_CREWS
+        index: Number of the analysis (its marker is MEETING-<index>)
+        transcript_chars: Transcript length in characters
+        model: Model of the crew
+    
+    Returns:
+        dict: Marker, markers echoed per task, and any error
+    """
+    from app.pipeline import build_crew, arun_crew
+    
+    marker, transcript = tagged_transcript(index, transcript_chars)
+    crew = build_crew(crew_type, model=model)
+    return collect_markers(crew_type, crew, marker, json.loads(await arun_crew(crew, transcript)))
+
+def tagged_transcript(index, transcript_chars):
+    """Generate the transcript of an analysis, returning (marker, tagged transcript)"""
+    from benchmarks.transcripts import generate_transcript
+    
+    marker = f"MEETING-{index}"
+    return marker, tag_transcript(generate_transcript(transcript_chars, seed=index), marker)
+
+def collect_markers(crew_type, crew, marker, result):
+    """Collect the markers each task of an analysis echoed"""
+    # A composite crew's tasks are those of the crews it runs concurrently
+    crews = {crew_type: crew}
+    crews.update(getattr(crew, "crews", {}))
+    
+    echoed = {}
+    for name, member in crews.items():
+        for task in member.tasks:
+            raw = task.output.raw if task.output is not None else ""
+            echoed[f"{name}.{task.name or task.description[:40]}"] = sorted(set(re.findall(MARKER_PATTERN, raw)))
+    
+    return {
+        "marker": marker,
+        "echoed": echoed,
+        "error": result.get("message") if result.get("error") else None
+    }
+
+def find_cross_talk(result):
+    """
+    List the tasks whose output doesn't carry exactly the analysis's own marker
+    
+    Args:
+        result: Result of run_tagged_analysis
+    
+    Returns:
+        list: (task name, markers echoed) pairs
+    """
+    return [
+        (task_name, markers)
+        for task_name, markers in result["echoed"].items()
+        if markers != [result["marker"]]
+    ]
+
+def main(argv=None):
+    """
+    Run the cross-talk check
+    
+    Args:
+        argv: Command line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Check that concurrent crews don't see each other's inputs")
+    parser.add_argument("--crews", type=int, default=8, help="Analyses to run at once")
+    parser.add_argument("--rounds", type=int, default=3, help="Times to run the analyses")
+    parser.add_argument("--crew-type", default="standard", help="Crew type from AVAILABLE_CREWS")
+    parser.add_argument("--chars", type=int, default=2000, help="Transcript length in characters")
+    parser.add_argument("--models", default="gpt-4o", help="Comma-separated crew models, assigned to the analyses in turn")
+    parser.add_argument("--latency", default="0", help="Fake LLM latency distribution")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Run the analyses on one event loop")
+    parser.add_argument("--verbose", action="store_true", help="Show crew output")
+    args = parser.parse_args(argv)
+    models = [model.strip() for model in args.models.split(",") if model.strip()]
+    
+    from benchmarks.fake_llm import install_fake_backend
+    install_fake_backend(args.latency, echo_pattern=MARKER_PATTERN)
+    
+    output = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(open(os.devnull, "w"))
+    results = []
+    if args.use_async:
+        async def run_rounds():
+            for _ in range(args.rounds):
+                results.extend(await asyncio.gather(*(
+                    arun_tagged_analysis(args.crew_type, index, args.chars, models[index % len(models)])
+                    for index in range(args.crews)
+                )))
+        
+        with output:
+            asyncio.run(run_rounds())
+    else:
+        with output, ThreadPoolExecutor(max_workers=args.crews, thread_name_prefix="analysis") as executor:
+            for _ in range(args.rounds):
+                results.extend(executor.map(
+                    lambda index: run_tagged_analysis(args.crew_type, index, args.chars, models[index % len(models)]),
+                    range(args.crews)
+                ))
+    
+    failed = False
+    for result in results:
+        cross_talk = find_cross_talk(result)
+        if result["error"]:
+            print(f"{result['marker']}: failed: {result['error']}")
+            failed = True
+        elif cross_talk:
+            for task_name, markers in cross_talk:
+                print(f"{result['marker']}: task {task_name} echoed {', '.join(markers) or 'no marker'}")
+            failed = True
+        else:
+            print(f"{result['marker']}: ok ({len(result['echoed'])} tasks)")
+    
+    if failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
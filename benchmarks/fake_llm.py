@@ -0,0 +1,392 @@
+# benchmarks/fake_llm.py
+"""
+Deterministic fake LLM backend for offline benchmarks
+
+FakeLLM stands in for the CrewAI LLM the agents use, and FakeChatClient for
+the LangChain ChatOpenAI client used by api/openai and the chatbot. Both
+sleep for a latency drawn from a seeded distribution, return canned outputs
+chosen from the task description, and report token usage the same way the
+real clients do, so run reports and metrics look like a real run.
+"""
+import asyncio
+import json
+import math
+import random
+import re
+import threading
+import time
+from crewai import LLM
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+# Canned outputs, chosen by the first keyword found in the task description
+CANNED_OUTPUTS = [
+    ("translat", """
+## Summary
+Resumen ejecutivo: el equipo revisó los resultados del trimestre y acordó las prioridades del próximo ciclo.
+
+## Key Topics
+- Resultados del trimestre
+- Prioridades de producto
+- Contratación
+"""),
+    ("locali", """
+## Summary
+Localized summary adapted for the regional audience, keeping product names and figures unchanged.
+
+## Key Topics
+- Regional launch timing
+- Pricing in local currency
+- Cultural adaptation of messaging
+"""),
+    ("claim", """
+1. **Revenue grew 12% quarter over quarter**: Stated by the CFO; consistent with the figures presented. Verdict: Likely true.
+2. **Churn fell below 3%**: No supporting data in the transcript. Verdict: Unverified.
+3. **The new region launches in Q3**: Confirmed by two speakers. Verdict: Likely true.
+"""),
+    ("research", """
+## Key Topics
+- Market expansion strategy
+- Customer retention benchmarks
+- Hiring plan for platform engineering
+
+## Summary
+Background research indicates the expansion plan is in line with comparable companies at this stage.
+"""),
+    ("sentiment", """
+## Sentiment Analysis
+Overall tone is positive and constructive. Speakers were optimistic about growth, cautious about hiring
+timelines, and aligned on the need to reduce churn.
+"""),
+    ("action item", """
+1. **Finalize Q3 launch plan**: Product lead to circulate the launch checklist by Friday.
+2. **Reduce churn**: Customer success to propose three retention experiments.
+3. **Hiring**: Engineering manager to open two platform roles this month.
+4. **Budget review**: Finance to share the updated forecast before the next board meeting.
+"""),
+    ("summar", """
+## Summary
+The meeting reviewed quarterly performance, agreed on launch priorities for the next quarter, and assigned
+owners for churn reduction and hiring. The board asked for an updated forecast before the next meeting.
+
+## Key Topics
+- Quarterly performance
+- Q3 launch plan
+- Churn reduction
+- Hiring
+
+## Sentiment Analysis
+Positive and focused, with some concern about hiring timelines.
+
+## Action Items
+- Circulate the Q3 launch checklist
+- Propose retention experiments
+- Open two platform engineering roles
+"""),
+    ("topic", """
+## Key Topics
+- Quarterly performance
+- Q3 launch plan
+- Churn reduction
+- Hiring
+"""),
+    ("transcript", """
+Speaker A: Let's start with the quarterly results.
+Speaker B: Revenue grew twelve percent and churn is trending down.
+Speaker A: Good. Next, the launch plan for the third quarter.
+"""),
+]
+
+DEFAULT_OUTPUT = """
+## Summary
+The discussion covered performance, priorities and next steps.
+
+## Key Topics
+- Performance
+- Priorities
+- Next steps
+"""
+
+# Answer for tasks that request structured output. It has the fields of
+# every schema in agents/schemas.py, so it validates against any of them.
+STRUCTURED_OUTPUT = json.dumps({
+    "summary": "The meeting reviewed quarterly performance, agreed on launch priorities and assigned owners for churn reduction and hiring.",
+    "key_topics": ["Quarterly performance", "Q3 launch plan", "Churn reduction", "Hiring"],
+    "sentiment_analysis": "Positive and focused, with some concern about hiring timelines.",
+    "action_items": [
+        "Finalize Q3 launch plan: Product lead to circulate the launch checklist by Friday",
+        "Reduce churn: Customer success to propose three retention experiments"
+    ],
+    "claims": [
+        {"claim": "Revenue grew 12% quarter over quarter", "status": "Likely true", "explanation": "Stated by the CFO"}
+    ],
+    "research": "Background research indicates the expansion plan is in line with comparable companies.",
+    "language": "Spanish",
+    "text": "Resumen ejecutivo: el equipo revisó los resultados del trimestre."
+})
+
+# CrewAI appends this to the prompt of tasks with an output schema
+STRUCTURED_OUTPUT_INSTRUCTIONS = "Ensure your final answer contains only the content in the following format"
+
+# Segment translation tasks list their segments as numbered lines after "INPUT:"
+NUMBERED_SEGMENT_PATTERN = re.compile(r'^\d+\. (.*)$', re.MULTILINE)
+
+# Regional localization tasks list their regions on a line after "INPUT:"
+REGIONS_PATTERN = re.compile(r'^REGIONS: (.*)$', re.MULTILINE)
+
+class LatencyModel:
+    """
+    Seeded latency distribution
+    
+    Specs:
+        "0" or "none"              no latency
+        "fixed:S"                  always S seconds
+        "uniform:LOW,HIGH"         uniform between LOW and HIGH seconds
+        "lognormal:MEDIAN,SIGMA"   log-normal with the given median and shape
+    """
+    
+    def __init__(self, spec="0", token_latency=0.0, seed=0):
+        """
+        Initialize the latency model
+        
+        Args:
+            spec: Distribution spec (see class docstring)
+            token_latency: Extra seconds per completion token
+            seed: Random seed
+        """
+        self.spec = spec
+        self.token_latency = token_latency
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        
+        kind, _, params = str(spec).partition(":")
+        self.kind = kind.strip().lower()
+        self.params = [float(value) for value in params.split(",") if value.strip()]
+        
+        if self.kind not in ("0", "none", "fixed", "uniform", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+    
+    def sample(self, completion_tokens=0):
+        """
+        Draw a latency
+        
+        Args:
+            completion_tokens: Tokens in the response
+        
+        Returns:
+            float: Seconds to sleep
+        """
+        with self.lock:
+            if self.kind == "fixed":
+                base = self.params[0]
+            elif self.kind == "uniform":
+                base = self.random.uniform(self.params[0], self.params[1])
+            elif self.kind == "lognormal":
+                base = self.random.lognormvariate(math.log(self.params[0]), self.params[1])
+            else:
+                base = 0.0
+        
+        return base + completion_tokens * self.token_latency
+
+def count_tokens(text):
+    """Approximate token count (about four characters per token)"""
+    return max(1, len(text) // 4)
+
+def choose_output(prompt):
+    """
+    Choose the canned output for a prompt
+    
+    Only the task description is matched, not the transcript or context
+    appended after it.
+    
+    Args:
+        prompt: Prompt text
+    
+    Returns:
+        str: Canned output
+    """
+    description = prompt.split("INPUT:", 1)[0].split("This is the context you're working with", 1)[0].lower()
+    
+    for keyword, output in CANNED_OUTPUTS:
+        if keyword in description:
+            return output.strip()
+    
+    return DEFAULT_OUTPUT.strip()
+
+def choose_structured_output(prompt):
+    """
+    Choose the answer for a task that requests structured output
+    
+    Segment translation tasks get one "translation" per numbered segment and
+    regional localization tasks one localization per region, so they
+    validate; every other task gets STRUCTURED_OUTPUT.
+    
+    Args:
+        prompt: Prompt text
+    
+    Returns:
+        str: JSON answer
+    """
+    description, _, task_input = prompt.partition("INPUT:")
+    task_input = task_input.split(STRUCTURED_OUTPUT_INSTRUCTIONS, 1)[0]
+    
+    if "numbered segments" in description:
+        segments = NUMBERED_SEGMENT_PATTERN.findall(task_input)
+        return json.dumps({"translations": [f"[translated] {segment}" for segment in segments]})
+    
+    regions = REGIONS_PATTERN.search(task_input)
+    if regions:
+        return json.dumps({"localizations": [
+            {"region": region.strip(), "content": f"Summary localized for {region.strip()}."}
+            for region in regions.group(1).split(",")
+        ]})
+    
+    return STRUCTURED_OUTPUT
+
+def _prompt_text(messages):
+    """Get the task prompt from CrewAI or LangChain style messages"""
+    if isinstance(messages, str):
+        return messages
+    
+    contents = []
+    for message in messages:
+        if isinstance(message, dict):
+            if message.get("role") == "user":
+                contents.append(str(message.get("content", "")))
+        else:
+            contents.append(str(getattr(message, "content", message)))
+    
+    return "\n".join(contents)
+
+class FakeLLM(LLM):
+    """CrewAI LLM that returns canned answers after a simulated latency"""
+    
+    def __init__(self, model, latency=None, echo_pattern=None):
+        """
+        Initialize the fake LLM
+        
+        Args:
+            model: Model name reported in token accounting
+            latency: LatencyModel (no latency if omitted)
+            echo_pattern: Optional regex; every distinct match in the prompt
+                          is echoed at the end of the answer, so a check can
+                          see which inputs reached which call
+        """
+        super().__init__(model=model)
+        self.latency = latency or LatencyModel()
+        self.echo_pattern = re.compile(echo_pattern) if echo_pattern else None
+        self.calls = 0
+    
+    def call(self, messages, tools=None, callbacks=None, available_functions=None):
+        """
+        Return a canned "Final Answer" for the task in the messages
+        
+        Token usage is reported to the callbacks (CrewAI's token counter)
+        just as LiteLLM would for a real call.
+        """
+        output, prompt_tokens, completion_tokens = self._answer(messages)
+        time.sleep(self.latency.sample(completion_tokens))
+        return self._respond(output, prompt_tokens, completion_tokens, callbacks)
+    
+    async def acall(self, messages, callbacks=None, stop=None):
+        """Like call(), but waiting out the latency without blocking the event loop"""
+        output, prompt_tokens, completion_tokens = self._answer(messages)
+        await asyncio.sleep(self.latency.sample(completion_tokens))
+        return self._respond(output, prompt_tokens, completion_tokens, callbacks)
+    
+    def _answer(self, messages):
+        """Choose the canned answer for the messages and count the tokens"""
+        prompt = _prompt_text(messages)
+        if STRUCTURED_OUTPUT_INSTRUCTIONS in prompt:
+            output = choose_structured_output(prompt)
+        else:
+            output = choose_output(prompt)
+            if self.echo_pattern is not None:
+                echoed = sorted(set(self.echo_pattern.findall(prompt)))
+                output += f"\n\nEchoed: {' '.join(echoed)}"
+        return output, count_tokens(prompt), count_tokens(output)
+    
+    def _respond(self, output, prompt_tokens, completion_tokens, callbacks):
+        """Report usage to the callbacks and format the answer"""
+        from litellm.types.utils import Usage
+        
+        self.calls += 1
+        
+        usage = Usage(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens
+        )
+        for callback in callbacks or []:
+            if hasattr(callback, "log_success_event"):
+                callback.log_success_event(kwargs={}, response_obj={"usage": usage}, start_time=0, end_time=0)
+        
+        return f"Thought: I now know the final answer\nFinal Answer: {output}"
+    
+    def supports_function_calling(self):
+        return False
+    
+    def supports_stop_words(self):
+        return True
+    
+    def get_context_window_size(self):
+        return 128000
+
+class FakeChatClient:
+    """Stand-in for LangChain's ChatOpenAI with invoke() and stream()"""
+    
+    def __init__(self, model, latency=None):
+        """
+        Initialize the fake chat client
+        
+        Args:
+            model: Model name
+            latency: LatencyModel (no latency if omitted)
+        """
+        self.model_name = model
+        self.latency = latency or LatencyModel()
+    
+    def invoke(self, prompt):
+        """Return a canned answer as an AIMessage with usage metadata"""
+        text = _prompt_text(prompt)
+        output = choose_output(text)
+        prompt_tokens = count_tokens(text)
+        completion_tokens = count_tokens(output)
+        
+        time.sleep(self.latency.sample(completion_tokens))
+        
+        return AIMessage(
+            content=output,
+            usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens
+            }
+        )
+    
+    def stream(self, prompt):
+        """Yield the canned answer word by word"""
+        message = self.invoke(prompt)
+        for word in message.content.split(" "):
+            yield AIMessageChunk(content=word + " ")
+
+def install_fake_backend(latency_spec="0", token_latency=0.0, seed=0, echo_pattern=None):
+    """
+    Route every agent and chat client to the fake backend
+    
+    Args:
+        latency_spec: Latency distribution spec (see LatencyModel)
+        token_latency: Extra seconds per completion token
+        seed: Random seed for the latency distribution
+        echo_pattern: Optional regex whose matches in a prompt the agents'
+                      LLM echoes in its answer (see FakeLLM)
+    
+    Returns:
+        LatencyModel: Shared latency model
+    """
+    from agents.registry import registry
+    from api.openai import set_openai_client_factory
+    
+    latency = LatencyModel(latency_spec, token_latency=token_latency, seed=seed)
+    registry.set_llm_factory(lambda model: FakeLLM(model, latency=latency, echo_pattern=echo_pattern))
+    set_openai_client_factory(lambda model: FakeChatClient(model, latency=latency))
+    return latency
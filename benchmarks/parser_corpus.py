@@ -0,0 +1,214 @@
+# benchmarks/parser_corpus.py
+"""
+Corpus of raw crew outputs for result parser benchmarks
+
+The corpus is seeded from real outputs in benchmarks/corpus/ (starting with
+a copy of debug_output/raw_crew_result.txt; drop more .txt files there to
+add cases) and extended with generated cases for every format
+parse_crew_result handles, large cases built from them (up to several MB)
+and adversarial inputs that make the lazy DOTALL patterns backtrack.
+Generated cases are deterministic, so their parse results can be pinned by
+hash in parser_golden.json.
+"""
+import os
+import random
+
+# Real crew outputs, copied here so pipeline runs that rewrite debug_output/ don't change the corpus
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+TITLES = [
+    "Technological Advancements", "Ethical Implications", "Hiring Plan", "Churn Reduction",
+    "Q3 Launch Plan", "Budget Review", "Partner Program", "Security Audit", "Mobile Roadmap",
+    "Customer Onboarding", "Pricing Experiments", "Data Platform Migration"
+]
+
+SENTENCES = [
+    "Circulate the launch checklist to every team lead by Friday.",
+    "Customer success will propose three retention experiments.",
+    "Engineering should open two platform roles this month.",
+    "Finance will share the updated forecast before the board meeting.",
+    "Legal needs to review the partner contract before we sign.",
+    "Run a pilot with ten customers and report engagement weekly.",
+    "The team agreed to revisit the timeline once hiring is complete.",
+    "Document the decision and share it in the weekly update."
+]
+
+AGENTS = ["Executive Summarizer", "Sentiment Analyzer", "Action Item Extractor", "Content Analyzer"]
+
+LANGUAGES = ["Spanish", "French", "German", "Japanese"]
+
+def _sentences(rng, count):
+    return " ".join(rng.choice(SENTENCES) for _ in range(count))
+
+def numbered_items(rng, count, start=1):
+    """Numbered items with bold titles: "1. **Title**: Description" """
+    return "\n\n".join(
+        f"{number}. **{rng.choice(TITLES)}**: {_sentences(rng, rng.randint(1, 3))}"
+        for number in range(start, start + count)
+    )
+
+def intro_and_items(rng, count):
+    """Intro paragraph followed by numbered items"""
+    return f"{_sentences(rng, 4)}\n\n{numbered_items(rng, count)}"
+
+def prioritized_items(rng, count):
+    """Prioritized Action Items with Context/Action/Benefit sub-bullets"""
+    items = []
+    for number in range(1, count + 1):
+        items.append(
+            f"{number}. **{rng.choice(TITLES)}**\n"
+            f"   - **Context**: {_sentences(rng, 1)}\n"
+            f"   - **Action Item**: {_sentences(rng, 1)}\n"
+            f"   - **Benefit**: {_sentences(rng, 1)}"
+        )
+    return "Prioritized Action Items\n\n" + "\n\n".join(items)
+
+def comprehensive_items(rng, count):
+    """Comprehensive Set of items with Context/Implementation Guidance/Expected Benefit"""
+    items = []
+    for number in range(1, count + 1):
+        items.append(
+            f"{number}. **{rng.choice(TITLES)}**\n"
+            f"   - **Context**: {_sentences(rng, 1)}\n"
+            f"   - **Implementation Guidance**: {_sentences(rng, 2)}\n"
+            f"   - **Expected Benefit**: {_sentences(rng, 1)}"
+        )
+    return "Comprehensive Set of Action Items\n\n" + "\n\n".join(items)
+
+def agent_outputs(rng, count):
+    """Verbose CrewAI log with "# Agent:" blocks and final answers"""
+    blocks = []
+    for index in range(count):
+        agent = AGENTS[index % len(AGENTS)]
+        if agent == "Action Item Extractor":
+            answer = numbered_items(rng, rng.randint(2, 5))
+        else:
+            answer = _sentences(rng, 3)
+        blocks.append(
+            f"# Agent: {agent}\n## Task: {_sentences(rng, 1)}\n\n\n"
+            f"# Agent: {agent}\n## Final Answer: \n{answer}\n\n"
+        )
+    return "".join(blocks)
+
+def task_completions(rng, count):
+    """Task completion log lines without agent headers"""
+    tasks = ["Summarize the meeting", "Analyze the sentiment", "Extract action items", "Analyze the content"]
+    return "\n".join(
+        f"[TASK COMPLETED: {tasks[index % len(tasks)]}]: {_sentences(rng, 2)}"
+        for index in range(count)
+    )
+
+def section_headers(rng, count):
+    """Markdown sections with bulleted topics and action items"""
+    topics = "\n".join(f"- {rng.choice(TITLES)}" for _ in range(count))
+    actions = "\n".join(f"- **{rng.choice(TITLES)}**: {_sentences(rng, 1)}" for _ in range(count))
+    return (
+        f"## Summary\n{_sentences(rng, 4)}\n\n"
+        f"## Key Topics\n{topics}\n\n"
+        f"## Sentiment Analysis\n{_sentences(rng, 2)}\n\n"
+        f"## Action Items\n{actions}\n"
+    )
+
+def additional_fields(rng, count):
+    """Sections plus fact check, research and translation fields"""
+    claims = "\n".join(f"Claim: {_sentences(rng, 1)} Status: {rng.choice(['Verified', 'Unverified'])}" for _ in range(count))
+    translations = "\n\n".join(f"{language} translation: {_sentences(rng, 2)}" for language in LANGUAGES)
+    return (
+        f"{section_headers(rng, count)}\n"
+        f"Fact check results:\n{claims}\n\n"
+        f"Research insights: {_sentences(rng, 3)}\n\n"
+        f"{translations}\n"
+    )
+
+def plain_paragraphs(rng, count):
+    """Free text with no recognizable structure"""
+    return "\n\n".join(_sentences(rng, 3) for _ in range(count))
+
+def repeat_to_size(builder, rng, num_chars):
+    """Grow a case by calling the builder with more items until it reaches num_chars"""
+    count = 8
+    text = builder(rng, count)
+    while len(text) < num_chars:
+        count = int(count * num_chars / len(text)) + 1
+        text = builder(rng, count)
+    return text
+
+def unclosed_sections(count):
+    """Numbered items whose later sub-bullets never appear, so lazy groups scan to the end"""
+    return "Comprehensive Set\n\n" + "\n".join(
+        f"{number}. **Item {number}** - **Context**: never followed by guidance" for number in range(1, count + 1)
+    )
+
+def unclosed_agents(count):
+    """Agent headers with no final answer"""
+    return "\n".join(f"# Agent: Agent {index}\n## Task: keep working" for index in range(count))
+
+def unclosed_task_completions(count):
+    """TASK COMPLETED markers whose closing bracket never appears"""
+    return "\n".join(f"TASK COMPLETED: step {index} still running" for index in range(count))
+
+def unclosed_claims(count):
+    """Fact check claims with no status"""
+    return "Fact check results:\n" + "\n".join(f"claim: statement {index} is pending" for index in range(count))
+
+def long_translation_word(num_chars):
+    """A single very long word in a translation section"""
+    return "Spanish translation: " + "a" * num_chars
+
+def unterminated_bold(count):
+    """Numbered items that open bold markers and never close them"""
+    return "\n".join(f"{number}. **Title {number} without a closing marker" for number in range(1, count + 1))
+
+def build_corpus(seed=0, max_chars=4_000_000, adversarial_scale=0.5):
+    """
+    Build the parser corpus
+    
+    Args:
+        seed: Random seed for generated cases
+        max_chars: Size of the largest generated case
+        adversarial_scale: Multiplier for adversarial case sizes
+    
+    Returns:
+        dict: Case name -> raw crew output
+    """
+    corpus = {}
+    
+    if os.path.isdir(CORPUS_DIR):
+        for file_name in sorted(os.listdir(CORPUS_DIR)):
+            if file_name.endswith(".txt"):
+                with open(os.path.join(CORPUS_DIR, file_name), "r", encoding="utf-8") as f:
+                    corpus[f"sample_{file_name[:-4]}"] = f.read()
+    
+    builders = {
+        "numbered_items": numbered_items,
+        "intro_and_items": intro_and_items,
+        "prioritized_items": prioritized_items,
+        "comprehensive_items": comprehensive_items,
+        "agent_outputs": agent_outputs,
+        "task_completions": task_completions,
+        "section_headers": section_headers,
+        "additional_fields": additional_fields,
+        "plain_paragraphs": plain_paragraphs
+    }
+    
+    for name, builder in builders.items():
+        corpus[name] = builder(random.Random(f"{seed}:{name}"), 6)
+    
+    # Large cases, from a typical long output up to several MB
+    for name in ("numbered_items", "agent_outputs", "section_headers"):
+        for size in (100_000, 1_000_000, max_chars):
+            if size > max_chars:
+                continue
+            rng = random.Random(f"{seed}:{name}:{size}")
+            corpus[f"large_{name}_{size}"] = repeat_to_size(builders[name], rng, size)
+    
+    # Adversarial cases for the backtracking-prone patterns
+    count = int(2000 * adversarial_scale)
+    corpus["adversarial_unclosed_sections"] = unclosed_sections(count)
+    corpus["adversarial_unclosed_agents"] = unclosed_agents(count)
+    corpus["adversarial_unclosed_task_completions"] = unclosed_task_completions(count)
+    corpus["adversarial_unclosed_claims"] = unclosed_claims(count)
+    corpus["adversarial_long_translation_word"] = long_translation_word(int(20_000 * adversarial_scale))
+    corpus["adversarial_unterminated_bold"] = unterminated_bold(count)
+    
+    return corpus
@@ -0,0 +1,267 @@
+# benchmarks/run_crews.py
+"""
+Offline end-to-end crew benchmarks
+
+Runs every crew in crews.AVAILABLE_CREWS against synthetic transcripts with
+the fake LLM backend, so results are reproducible and cost nothing:
+
+    python -m benchmarks.run_crews --sizes 1000,20000,200000 --latency uniform:0.05,0.2 --output bench.json
+
+Each result records wall time, the per-stage breakdown from the run report
+(by span kind and by task), LLM calls and tokens, and peak RSS. Use
+--isolate to run each case in a fresh process so peak RSS is per case, and
+--async to run the crews through their async entry points (arun_crew).
+"""
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+# Keep CrewAI from sending telemetry and satisfy clients that expect a key
+os.environ.setdefault("OTEL_SDK_DISABLED", "true")
+os.environ.setdefault("OPENAI_API_KEY", "sk-offline-benchmark")
+
+# Keep benchmark runs from overwriting the debug output of real runs
+os.environ.setdefault("DEBUG_OUTPUT_DIR", os.path.join(tempfile.gettempdir(), "meeting_analyzer_benchmarks"))
+
+DEFAULT_SIZES = [1000, 10000, 50000, 200000]
+
+# Stores that persist results across runs, off by default so every case does the full work
+PERSISTENT_CACHES = ["ARTIFACT_STORE", "TRANSLATION_MEMORY"]
+
+# Client-side rate limit budgets, lifted by default since the fake backend has no quota
+RATE_LIMITED_APIS = ["OPENAI_CHAT", "OPENAI_EMBEDDINGS", "OPENAI_TTS"]
+
+def get_peak_rss_mb():
+    """
+    Get the peak resident set size of this process
+    
+    Returns:
+        float: Peak RSS in MB, or None where the resource module is unavailable
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes on Linux
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+def setup_backend(latency_spec, token_latency, seed):
+    """Install the fake LLM backend in this process"""
+    from benchmarks.fake_llm import install_fake_backend
+    install_fake_backend(latency_spec, token_latency=token_latency, seed=seed)
+
+def run_case(crew_type, transcript_chars, seed=0, verbose=False, use_async=False):
+    """
+    Run one crew on one synthetic transcript
+    
+    Args:
+        crew_type: Crew type from AVAILABLE_CREWS
+        transcript_chars: Transcript length in characters
+        seed: Transcript seed
+        verbose: Show crew output instead of discarding it
+        use_async: Run the crew on an event loop through arun_crew
+    
+    Returns:
+        dict: Benchmark result for the case
+    """
+    from app.pipeline import build_crew, run_crew, arun_crew
+    from benchmarks.transcripts import generate_transcript
+    from utils.instrumentation import start_run
+    
+    transcript = generate_transcript(transcript_chars, seed=seed)
+    output = contextlib.nullcontext() if verbose else contextlib.redirect_stdout(open(os.devnull, "w"))
+    
+    start = time.perf_counter()
+    error = None
+    with output, start_run(f"{crew_type}:{transcript_chars}") as run_report:
+        try:
+            crew = build_crew(crew_type, model="gpt-4o")
+            result_json = asyncio.run(arun_crew(crew, transcript)) if use_async else run_crew(crew, transcript)
+            result = json.loads(result_json)
+            if result.get("error"):
+                error = result.get("message")
+        except Exception as e:
+            error = str(e)
+    wall_time = time.perf_counter() - start
+    
+    report = run_report.to_dict()
+    return {
+        "crew": crew_type,
+        "transcript_chars": transcript_chars,
+        "wall_time": round(wall_time, 4),
+        "peak_rss_mb": get_peak_rss_mb(),
+        "llm_tokens": report["totals"]["total_tokens"],
+        "prompt_tokens": report["totals"]["prompt_tokens"],
+        "completion_tokens": report["totals"]["completion_tokens"],
+        "stages": {kind: totals["wall_time"] for kind, totals in report["by_kind"].items()},
+        "tasks": {name: totals["wall_time"] for name, totals in report["by_task"].items()},
+        "error": error
+    }
+
+def _run_isolated_case(args):
+    """Run a case in a worker process (installs the backend first)"""
+    crew_type, transcript_chars, seed, latency_spec, token_latency, verbose, use_async = args
+    setup_backend(latency_spec, token_latency, seed)
+    return run_case(crew_type, transcript_chars, seed=seed, verbose=verbose, use_async=use_async)
+
+def summarize_runs(runs):
+    """
+    Combine repeated runs of a case
+    
+    Args:
+        runs: Results of the same case
+    
+    Returns:
+        dict: The first run's details with median and per-run wall times
+    """
+    summary = dict(runs[0])
+    wall_times = [run["wall_time"] for run in runs]
+    summary["wall_time"] = round(statistics.median(wall_times), 4)
+    summary["wall_times"] = wall_times
+    summary["peak_rss_mb"] = max((run["peak_rss_mb"] or 0) for run in runs) or None
+    summary["error"] = next((run["error"] for run in runs if run["error"]), None)
+    return summary
+
+def get_git_commit():
+    """Get the current git commit, if available"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+def run_benchmarks(crew_types, sizes, latency_spec="0", token_latency=0.0, seed=0, repeat=1, isolate=False, verbose=False, use_async=False):
+    """
+    Run the benchmark matrix
+    
+    Args:
+        crew_types: Crew types to run
+        sizes: Transcript sizes in characters
+        latency_spec: Fake LLM latency distribution
+        token_latency: Extra fake latency per completion token
+        seed: Seed for transcripts and latencies
+        repeat: Runs per case (the median wall time is reported)
+        isolate: Run each case in a fresh process
+        verbose: Show crew output
+        use_async: Run the crews through their async entry points
+    
+    Returns:
+        dict: Benchmark report with metadata and per-case results
+    """
+    cases = [(crew_type, size) for crew_type in crew_types for size in sizes]
+    results = []
+    
+    if not isolate:
+        setup_backend(latency_spec, token_latency, seed)
+    
+    for crew_type, size in cases:
+        runs = []
+        for _ in range(repeat):
+            if isolate:
+                with ProcessPoolExecutor(max_workers=1) as executor:
+                    runs.append(executor.submit(
+                        _run_isolated_case,
+                        (crew_type, size, seed, latency_spec, token_latency, verbose, use_async)
+                    ).result())
+            else:
+                runs.append(run_case(crew_type, size, seed=seed, verbose=verbose, use_async=use_async))
+        
+        result = summarize_runs(runs)
+        results.append(result)
+        
+        status = f"error: {result['error']}" if result["error"] else "ok"
+        print(f"{crew_type:<24} {size:>8} chars  {result['wall_time']:>8.3f}s  "
+              f"{result['llm_tokens']:>8} tokens  rss {result['peak_rss_mb']} MB  {status}", file=sys.stderr)
+    
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(),
+            "rate_limits": {api: (os.getenv(f"{api}_RPM"), os.getenv(f"{api}_TPM")) for api in RATE_LIMITED_APIS},
+            "commit": get_git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "latency": latency_spec,
+            "token_latency": token_latency,
+            "seed": seed,
+            "structured_output": os.getenv("STRUCTURED_OUTPUT", "off"),
+            "persistent_caches": {cache: os.getenv(cache) for cache in PERSISTENT_CACHES},
+            "repeat": repeat,
+            "isolated": isolate,
+            "async": use_async
+        },
+        "results": results
+    }
+
+def main(argv=None):
+    """Command line entry point"""
+    from crews import AVAILABLE_CREWS
+    
+    parser = argparse.ArgumentParser(description="Run offline crew benchmarks with a fake LLM backend")
+    parser.add_argument("--crews", default=",".join(AVAILABLE_CREWS), help="Comma-separated crew types")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES), help="Comma-separated transcript sizes in characters")
+    parser.add_argument("--latency", default="0", help="Latency distribution: 0, fixed:S, uniform:LOW,HIGH or lognormal:MEDIAN,SIGMA")
+    parser.add_argument("--token-latency", type=float, default=0.0, help="Extra seconds per completion token")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--isolate", action="store_true", help="Run each case in a fresh process for per-case peak RSS")
+    parser.add_argument("--keep-rate-limits", action="store_true", help="Apply the client-side rate limit budgets to the fake backend")
+    parser.add_argument("--structured-output", action="store_true", help="Have tasks with an output schema request JSON (STRUCTURED_OUTPUT=on)")
+    parser.add_argument("--persistent-caches", action="store_true", help="Reuse refined transcripts and translations across cases and runs")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="Run the crews through their async entry points")
+    parser.add_argument("--verbose", action="store_true", help="Show crew output")
+    parser.add_argument("--output", help="Write the JSON report to this file instead of stdout")
+    args = parser.parse_args(argv)
+    
+    if not args.keep_rate_limits:
+        for api in RATE_LIMITED_APIS:
+            os.environ.setdefault(f"{api}_RPM", "0")
+            os.environ.setdefault(f"{api}_TPM", "0")
+    
+    if args.structured_output:
+        os.environ["STRUCTURED_OUTPUT"] = "on"
+    
+    if not args.persistent_caches:
+        for cache in PERSISTENT_CACHES:
+            os.environ.setdefault(cache, "off")
+    
+    crew_types = [crew.strip() for crew in args.crews.split(",") if crew.strip()]
+    unknown = [crew for crew in crew_types if crew not in AVAILABLE_CREWS]
+    if unknown:
+        parser.error(f"Unknown crew types: {', '.join(unknown)}")
+    
+    report = run_benchmarks(
+        crew_types,
+        [int(size) for size in args.sizes.split(",") if size.strip()],
+        latency_spec=args.latency,
+        token_latency=args.token_latency,
+        seed=args.seed,
+        repeat=args.repeat,
+        isolate=args.isolate,
+        verbose=args.verbose,
+        use_async=args.use_async
+    )
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Benchmark report written to {args.output}", file=sys.stderr)
+    else:
+        print(json.dumps(report, indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+# benchmarks/run_parser.py
+"""
+Result parser benchmarks and parse-equivalence check
+
+Times every extractor in utils/result_parser.py (and parse_crew_result as a
+whole) on the corpus from benchmarks/parser_corpus.py, and compares a hash
+of each output with the golden hashes in benchmarks/parser_golden.json:
+
+    python -m benchmarks.run_parser                  # time and check
+    python -m benchmarks.run_parser --update-golden  # accept the current outputs
+
+The exit status is 1 if any output differs from the golden one, so parser
+optimizations can be checked for equivalence before they ship. Calls that
+take longer than --budget seconds are reported as slow (and fail the run
+with --fail-on-slow), which catches pathological inputs.
+"""
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime
+
+GOLDEN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "parser_golden.json")
+
+# Extractors timed and checked, in the order parse_crew_result tries them
+EXTRACTORS = [
+    "split_intro_and_items",
+    "extract_numbered_items_with_descriptions",
+    "extract_action_items_from_structured_list",
+    "extract_comprehensive_items",
+    "extract_agent_outputs",
+    "parse_sections_with_headers",
+    "extract_bullet_points",
+    "extract_action_items_from_text",
+    "extract_additional_fields",
+    "parse_crew_result"
+]
+
+def hash_text(text):
+    """SHA-256 of a string"""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+def hash_output(output):
+    """SHA-256 of an extractor output in canonical JSON form"""
+    return hash_text(json.dumps(output, sort_keys=True, ensure_ascii=False))
+
+def time_extractor(function, text, repeat=1):
+    """
+    Time an extractor on one input
+    
+    Args:
+        function: Extractor function
+        text: Raw crew output
+        repeat: Number of calls (the fastest is reported)
+    
+    Returns:
+        tuple: (output, fastest call in seconds)
+    """
+    timings = []
+    output = None
+    
+    # parse_crew_result logs to stdout; keep the report readable
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = function(text)
+            timings.append(time.perf_counter() - start)
+    
+    return output, min(timings)
+
+def load_golden(path=GOLDEN_FILE):
+    """Load the golden hashes, or an empty set if there are none yet"""
+    if not os.path.exists(path):
+        return {"cases": {}}
+    
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def run_benchmarks(corpus, extractors=None, repeat=1, budget=2.0, golden=None):
+    """
+    Time every extractor on every case and compare outputs with the golden hashes
+    
+    Args:
+        corpus: Case name -> raw crew output
+        extractors: Extractor names (defaults to EXTRACTORS)
+        repeat: Calls per extractor and case
+        budget: Seconds after which a call is reported as slow
+        golden: Golden hashes from load_golden() (no check if omitted)
+    
+    Returns:
+        dict: Per-case results with timings, output hashes and check status
+    """
+    from utils import result_parser
+    
+    extractors = extractors or EXTRACTORS
+    golden_cases = (golden or {}).get("cases", {})
+    results = []
+    
+    for name, text in corpus.items():
+        expected = golden_cases.get(name)
+        input_hash = hash_text(text)
+        
+        if expected is None:
+            status = "no golden"
+        elif expected["input_sha256"] != input_hash:
+            # The corpus generator or a sample changed; the old hashes say nothing about this input
+            status = "stale golden"
+        else:
+            status = "ok"
+        
+        timings = {}
+        outputs = {}
+        mismatches = []
+        slow = []
+        
+        for extractor in extractors:
+            output, seconds = time_extractor(getattr(result_parser, extractor), text, repeat=repeat)
+            timings[extractor] = round(seconds, 6)
+            outputs[extractor] = hash_output(output)
+            
+            if seconds > budget:
+                slow.append(extractor)
+            if status == "ok" and expected["outputs"].get(extractor) not in (None, outputs[extractor]):
+                mismatches.append(extractor)
+        
+        if mismatches:
+            status = "mismatch"
+        
+        results.append({
+            "case": name,
+            "chars": len(text),
+            "input_sha256": input_hash,
+            "timings": timings,
+            "outputs": outputs,
+            "status": status,
+            "mismatches": mismatches,
+            "slow": slow
+        })
+        
+        slowest = max(timings, key=timings.get)
+        note = f"  MISMATCH: {', '.join(mismatches)}" if mismatches else ("" if status == "ok" else f"  ({status})")
+        if slow:
+            note += f"  SLOW: {', '.join(slow)}"
+        print(f"{name:<40} {len(text):>9} chars  slowest {slowest} {timings[slowest]:.4f}s{note}", file=sys.stderr)
+    
+    return {"results": results}
+
+def update_golden(report, path=GOLDEN_FILE):
+    """
+    Record the output hashes of a benchmark run as the golden hashes
+    
+    Args:
+        report: Report from run_benchmarks()
+        path: Golden file path
+    """
+    # Merge, so updating a subset of cases keeps the others
+    golden = load_golden(path)
+    golden["updated"] = datetime.now().isoformat()
+    for result in report["results"]:
+        golden["cases"][result["case"]] = {
+            "chars": result["chars"],
+            "input_sha256": result["input_sha256"],
+            "outputs": result["outputs"]
+        }
+    
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(golden, f, indent=2, sort_keys=True)
+        f.write("\n")
+    
+    print(f"Golden hashes for {len(report['results'])} cases written to {path}", file=sys.stderr)
+
+def main(argv=None):
+    """Command line entry point"""
+    from benchmarks.parser_corpus import build_corpus
+    from benchmarks.run_crews import get_git_commit
+    
+    parser = argparse.ArgumentParser(description="Benchmark the result parser and check parse equivalence")
+    parser.add_argument("--cases", help="Comma-separated substrings; only matching cases are run")
+    parser.add_argument("--extractors", default=",".join(EXTRACTORS), help="Comma-separated extractor names")
+    parser.add_argument("--max-chars", type=int, default=4_000_000, help="Size of the largest generated case")
+    parser.add_argument("--adversarial-scale", type=float, default=0.5, help="Multiplier for adversarial case sizes")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="Calls per extractor and case (the fastest is reported)")
+    parser.add_argument("--budget", type=float, default=2.0, help="Seconds after which a call is reported as slow")
+    parser.add_argument("--fail-on-slow", action="store_true", help="Exit with status 1 if any call exceeds the budget")
+    parser.add_argument("--update-golden", action="store_true", help="Accept the current outputs as the golden hashes")
+    parser.add_argument("--output", help="Write the JSON report to this file")
+    args = parser.parse_args(argv)
+    
+    extractors = [name.strip() for name in args.extractors.split(",") if name.strip()]
+    unknown = [name for name in extractors if name not in EXTRACTORS]
+    if unknown:
+        parser.error(f"Unknown extractors: {', '.join(unknown)}")
+    
+    corpus = build_corpus(seed=args.seed, max_chars=args.max_chars, adversarial_scale=args.adversarial_scale)
+    if args.cases:
+        filters = [value.strip() for value in args.cases.split(",") if value.strip()]
+        corpus = {name: text for name, text in corpus.items() if any(value in name for value in filters)}
+    
+    golden = None if args.update_golden else load_golden()
+    report = run_benchmarks(corpus, extractors=extractors, repeat=args.repeat, budget=args.budget, golden=golden)
+    report["meta"] = {
+        "timestamp": datetime.now().isoformat(),
+        "commit": get_git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "repeat": args.repeat,
+        "budget": args.budget
+    }
+    
+    if args.update_golden:
+        if args.extractors != ",".join(EXTRACTORS):
+            parser.error("--update-golden needs every extractor")
+        update_golden(report)
+    
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Benchmark report written to {args.output}", file=sys.stderr)
+    
+    mismatched = [result["case"] for result in report["results"] if result["status"] == "mismatch"]
+    slow = [result["case"] for result in report["results"] if result["slow"]]
+    
+    if mismatched:
+        print(f"Parse results differ from the golden hashes for: {', '.join(mismatched)}", file=sys.stderr)
+    if slow:
+        print(f"Calls over the {args.budget}s budget in: {', '.join(slow)}", file=sys.stderr)
+    
+    if mismatched or (slow and args.fail_on_slow):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+# benchmarks/transcripts.py
+import random
+
+SPEAKERS = ["Alice", "Bob", "Carmen", "Deepak", "Elena", "Farid"]
+
+SENTENCES = [
+    "Revenue for the quarter came in at {number} million, which is {number} percent above plan.",
+    "We should revisit the launch timeline for the {topic} project before the board meeting.",
+    "Customer churn in the {topic} segment dropped to {number} percent after the pricing change.",
+    "I'd like {speaker} to own the follow-up on {topic} and report back next week.",
+    "The main risk is hiring; we still have {number} open roles on the {topic} team.",
+    "Can we get a breakdown of {topic} costs by region before we commit to the budget?",
+    "I agree with {speaker}, but we need data on {topic} before making that call.",
+    "Let's table {topic} for now and come back to it once legal has reviewed the contract.",
+    "Our competitors announced a similar {topic} feature last month, so timing matters.",
+    "The pilot with {number} customers showed strong engagement with the {topic} workflow.",
+]
+
+TOPICS = ["onboarding", "analytics", "platform", "mobile", "billing", "security", "partner", "support"]
+
+def generate_transcript(num_chars, seed=0):
+    """
+    Generate a deterministic synthetic Meeting transcript
+    
+    Args:
+        num_chars: Length of the transcript in characters
+        seed: Random seed (the same seed and length give the same transcript)
+    
+    Returns:
+        str: Transcript with speaker-labelled turns
+    """
+    rng = random.Random(f"{seed}:{num_chars}")
+    turns = []
+    length = 0
+    
+    while length < num_chars:
+        speaker = rng.choice(SPEAKERS)
+        sentences = [
+            rng.choice(SENTENCES).format(
+                number=rng.randint(2, 99),
+                topic=rng.choice(TOPICS),
+                speaker=rng.choice(SPEAKERS)
+            )
+            for _ in range(rng.randint(1, 4))
+        ]
+        turn = f"{speaker}: {' '.join(sentences)}"
+        turns.append(turn)
+        length += len(turn) + 1
+    
+    return "\n".join(turns)[:num_chars]
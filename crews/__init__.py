@@ -29,6 +29,9 @@ from crews.multilingual_crew import (
     LocalizationCrew
 )
 
+# Import the crew combining other crews
+from crews.composite_crew import CompositeCrew
+
 # Dictionary of available crews for easy access
 AVAILABLE_CREWS = {
     "standard": PodcastCrew,
@@ -38,7 +41,8 @@ AVAILABLE_CREWS = {
     "deep_research": DeepResearchCrew,
     "fact_checking": FactCheckingCrew,
     "advanced_multilingual": AdvancedMultilingualCrew,
-    "localization": LocalizationCrew
+    "localization": LocalizationCrew,
+    "composite": CompositeCrew
 }
 
 def get_crew(crew_type="standard", **kwargs):
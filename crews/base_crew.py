@@ -1,26 +1,65 @@
 # crews/base_crew.py
+import asyncio
 import json
 import os
+from datetime import datetime
 from crewai import Crew
-from agents.registry import get_agent, set_default_model, get_all_agents
-from utils.result_parser import parse_crew_result
+from crewai.crews.crew_output import CrewOutput
+from pydantic import ValidationError
+from agents.registry import get_agent, model_scope
+from agents.schemas import MeetingAnalysis
+from utils.instrumentation import span, TaskTracker
+from utils.metrics import record_analysis
+from utils.result_parser import parse_crew_result, merge_task_output
+from utils.config import get_debug_output_dir
+from utils.concurrency import map_concurrently
+from utils.checkpoints import get_checkpoint_store, hash_tasks, hash_step, checkpoint_from_output, output_from_checkpoint
+from crews.task_graph import get_task_graph
+from utils.retry import TaskExecutionError
+
+# Result fields every crew returns
+CORE_FIELDS = ["summary", "key_topics", "sentiment_analysis", "action_items"]
 
 class BaseCrew:
     """Base class for Meeting analysis crews"""
     
-    def __init__(self, model="gpt-4o"):
+    def __init__(self, model="gpt-4o", agent_models=None):
         """
         Initialize a base crew
         
         Args:
             model: LLM model to use for all agents
+            agent_models: Optional dict of per-agent model overrides by agent ID
         """
         self.model = model
+        self.agent_models = dict(agent_models or {})
         self.agents = {}
         self.tasks = []
+        self.task_outputs = {}
+        
+        # ID of the analysis run; when set, task outputs are checkpointed under it
+        self.run_id = None
+    
+    def model_for(self, agent_id):
+        """
+        Get the model this crew uses for an agent
+        
+        Args:
+            agent_id: ID of the agent
+            
+        Returns:
+            str: Model name
+        """
+        return self.agent_models.get(agent_id, self.model)
+    
+    def model_scope(self):
+        """
+        Scope this crew's model configuration for registry lookups
         
-        # Set the default model for all agents
-        set_default_model(model)
+        Returns:
+            contextmanager: Context manager activating the crew's models
+        """
+        return model_scope(self.model, self.agent_models)
     
     def add_agent(self, agent_id):
         """
@@ -33,11 +72,26 @@ class BaseCrew:
             BaseCrew: Self for chaining
         """
         if agent_id not in self.agents:
-            agent = get_agent(agent_id)
+            agent = get_agent(agent_id, model=self.model_for(agent_id))
             self.agents[agent_id] = agent
         
         return self
     
+    def get_agent(self, agent_id):
+        """
+        Get this crew's instance of an agent
+        
+        Args:
+            agent_id: ID of the agent
+            
+        Returns:
+            BaseAgent: Agent instance configured with the crew's model
+        """
+        if agent_id in self.agents:
+            return self.agents[agent_id]
+        
+        return get_agent(agent_id, model=self.model_for(agent_id))
+    
     def add_task(self, task):
         """
         Add a task to the crew
@@ -51,6 +105,92 @@ class BaseCrew:
         self.tasks.append(task)
         return self
     
+    def refine_transcript(self, transcript_content):
+        """
+        Refine the transcript with the transcriber agent, checkpointed under the run
+        
+        The refined transcript goes into the task descriptions, and so into
+        the task hashes; a resumed run restores it instead of refining again,
+        which could produce different text and invalidate every checkpoint.
+        
+        Args:
+            transcript_content: Raw transcript content
+            
+        Returns:
+            str: Refined transcript
+        """
+        transcriber = self.get_agent("transcriber")
+        checkpoint_store, step_hash, refined = self._restore_refinement(transcriber, transcript_content)
+        if refined is not None:
+            return refined
+        
+        refined = transcriber.process_transcript(transcript_content)
+        self._checkpoint_refinement(checkpoint_store, step_hash, transcriber, refined)
+        return refined
+    
+    async def arefine_transcript(self, transcript_content):
+        """
+        Refine the transcript like refine_transcript, without blocking the event loop
+        
+        Args:
+            transcript_content: Raw transcript content
+            
+        Returns:
+            str: Refined transcript
+        """
+        transcriber = self.get_agent("transcriber")
+        checkpoint_store, step_hash, refined = await asyncio.to_thread(self._restore_refinement, transcriber, transcript_content)
+        if refined is not None:
+            return refined
+        
+        refined = await transcriber.aprocess_transcript(transcript_content)
+        await asyncio.to_thread(self._checkpoint_refinement, checkpoint_store, step_hash, transcriber, refined)
+        return refined
+    
+    def _restore_refinement(self, transcriber, transcript_content):
+        """
+        Look up this run's checkpoint of the refined transcript
+        
+        Returns:
+            tuple: (checkpoint store or None, step hash, refined transcript or None)
+        """
+        from agents.definitions.transcriber import TRANSCRIBER_VERSION
+        
+        checkpoint_store = get_checkpoint_store() if self.run_id else None
+        if checkpoint_store is None:
+            return None, None, None
+        
+        step_hash = hash_step("transcript_refinement", TRANSCRIBER_VERSION, transcriber.model, transcript_content)
+        try:
+            run = checkpoint_store.get_run(self.run_id) or {}
+        except Exception as e:
+            print(f"Error loading checkpoints for run {self.run_id}: {e}")
+            return checkpoint_store, step_hash, None
+        
+        checkpoint = (run.get("checkpoints") or {}).get(step_hash)
+        if checkpoint is None:
+            return checkpoint_store, step_hash, None
+        
+        print(f"Resuming run {self.run_id}: restored the refined transcript from its checkpoint")
+        return checkpoint_store, step_hash, checkpoint.get("raw", "")
+    
+    def _checkpoint_refinement(self, checkpoint_store, step_hash, transcriber, refined):
+        """Checkpoint a refined transcript, unless refinement failed"""
+        from agents.definitions.transcriber import FALLBACK_PREFIX
+        
+        if checkpoint_store is None or str(refined).startswith(FALLBACK_PREFIX):
+            return
+        
+        try:
+            checkpoint_store.save_checkpoint(self.run_id, step_hash, {
+                "name": "transcript_refinement",
+                "agent": transcriber.role,
+                "raw": str(refined),
+                "completed_at": datetime.now().isoformat()
+            })
+        except Exception as e:
+            print(f"Error checkpointing the refined transcript for run {self.run_id}: {e}")
+    
     def run(self):
         """
         Run the crew with all configured agents and tasks
@@ -58,51 +198,431 @@ class BaseCrew:
         Returns:
             str: JSON string with results
         """
+        crew_type = type(self).__name__
+        record_analysis(crew_type, "started")
+        
         try:
-            # Create CrewAI agent instances for all agents
-            crew_agents = [agent.create_agent() for agent in self.agents.values()]
+            task_graph = get_task_graph()
+            task_hashes, restored_outputs = self._prepare_checkpoints(hash_always=task_graph is not None)
+            remaining_tasks = self.tasks[len(restored_outputs):]
             
-            # Create and run the crew
-            crew = Crew(
-                agents=crew_agents,
-                tasks=self.tasks,
-                verbose=True
-            )
+            # Run the analysis with this crew's models in scope, recording
+            # a span for the crew and for each of its tasks
+            result = None
+            with span("crew", crew_type, model=self.model, tasks=len(self.tasks), restored_tasks=len(restored_outputs)):
+                if task_graph is not None and remaining_tasks:
+                    # Run the tasks through the shared graph of a composite run,
+                    # giving each the outputs of the tasks before it as a kickoff would
+                    for index in range(len(restored_outputs), len(self.tasks)):
+                        if not self.tasks[index].context:
+                            self.tasks[index].context = self.tasks[:index]
+                    
+                    with self.model_scope():
+                        graph_outputs = task_graph.execute(remaining_tasks, task_hashes[len(restored_outputs):])
+                    result = CrewOutput(raw=graph_outputs[-1].raw, tasks_output=graph_outputs)
+                elif remaining_tasks or not restored_outputs:
+                    # Create and run the crew
+                    crew_agents = self._crew_agents(remaining_tasks)
+                    crew = Crew(
+                        agents=crew_agents,
+                        tasks=remaining_tasks,
+                        verbose=True
+                    )
+                    
+                    with self.model_scope(), TaskTracker(remaining_tasks, crew_agents):
+                        result = crew.kickoff()
             
-            # Run the analysis
-            result = crew.kickoff()
+            return self._finish_run(result, restored_outputs)
             
-            # Handle the result type
-            if hasattr(result, 'raw_output'):
-                raw_result = result.raw_output  # CrewOutput with raw_output
-            elif hasattr(result, '__str__'):
-                raw_result = str(result)  # Stringable object
-            else:
-                raw_result = "Failed to extract raw result from crew output"
+        except Exception as e:
+            return self._failed_run(e)
+    
+    def _crew_agents(self, tasks):
+        """
+        Get the CrewAI agents of this run
+        
+        Tasks bring the agents they were created with, which belong to this
+        run alone. Tasks of the same agent on the same model are given one
+        of them, as a sequential kickoff runs them one at a time, and crew
+        agents without a task (available for delegation) get new ones. No
+        CrewAI agent is shared with another run.
+        
+        Args:
+            tasks: Tasks the crew will run
+            
+        Returns:
+            list: CrewAI agents
+        """
+        crew_agents = {}
+        for task in tasks:
+            if task.agent is not None:
+                task.agent = crew_agents.setdefault((task.agent.role, task.agent.llm.model), task.agent)
+        
+        roles = {role for role, _ in crew_agents}
+        for agent in self.agents.values():
+            if agent.role not in roles:
+                crew_agents[(agent.role, agent.model)] = agent.create_agent()
+        
+        return list(crew_agents.values())
+    
+    async def arun(self):
+        """
+        Run the crew's tasks one after another without blocking the event loop
+        
+        The async counterpart of run(): each task sees the outputs of the
+        tasks before it, as in a sequential CrewAI kickoff, and its LLM
+        request is awaited instead of occupying a thread, so many crews can
+        run on one event loop.
+        
+        Returns:
+            str: JSON string with results
+        """
+        crew_type = type(self).__name__
+        record_analysis(crew_type, "started")
+        
+        try:
+            task_hashes, restored_outputs = self._prepare_checkpoints()
+            remaining_tasks = self.tasks[len(restored_outputs):]
             
-            # Save raw result for debugging
-            self._save_debug_output(raw_result)
+            for index in range(len(restored_outputs), len(self.tasks)):
+                if not self.tasks[index].context:
+                    self.tasks[index].context = self.tasks[:index]
             
-            # Parse and structure the results
-            structured_result = self._structure_results(raw_result)
+            result = None
+            with span("crew", crew_type, model=self.model, tasks=len(self.tasks), restored_tasks=len(restored_outputs)):
+                if remaining_tasks:
+                    task_outputs = []
+                    with self.model_scope():
+                        for task in remaining_tasks:
+                            task_outputs.append(await self._aexecute_task(task))
+                    result = CrewOutput(raw=task_outputs[-1].raw, tasks_output=task_outputs)
             
-            # Return as JSON string
-            return json.dumps(structured_result)
+            return self._finish_run(result, restored_outputs)
             
         except Exception as e:
-            print(f"Error in crew execution: {str(e)}")
+            return self._failed_run(e)
+    
+    def _prepare_checkpoints(self, hash_always=False):
+        """
+        Restore the tasks an earlier attempt of this run completed, and
+        checkpoint each remaining task as it completes
+        
+        Args:
+            hash_always: Compute the task hashes even when checkpointing is off
             
-            # Return fallback result
-            fallback_result = {
-                "error": True,
-                "message": f"The analysis encountered an error: {str(e)}",
-                "summary": "The analysis could not be completed due to an error.",
-                "key_topics": ["Error occurred", "Analysis incomplete"],
-                "sentiment_analysis": "Sentiment analysis could not be completed.",
-                "action_items": ["Try again with different settings", "Check agent configuration"]
-            }
+        Returns:
+            tuple: (input hash of each task, restored TaskOutputs)
+        """
+        checkpoint_store = get_checkpoint_store() if self.run_id else None
+        task_hashes = hash_tasks(self.tasks) if checkpoint_store or hash_always else []
+        restored_outputs = self._restore_checkpoints(checkpoint_store, task_hashes)
+        
+        if checkpoint_store is not None:
+            for task, input_hash in zip(self.tasks[len(restored_outputs):], task_hashes[len(restored_outputs):]):
+                task.callback = self._make_checkpoint_callback(checkpoint_store, input_hash, task.callback)
+        
+        return task_hashes, restored_outputs
+    
+    def _finish_run(self, result, restored_outputs):
+        """
+        Structure the results of a crew run
+        
+        Args:
+            result: CrewOutput of the executed tasks, or None if every task was restored
+            restored_outputs: TaskOutputs restored from checkpoints
+            
+        Returns:
+            str: JSON string with results
+        """
+        crew_type = type(self).__name__
+        
+        # Handle the result type
+        if result is None:
+            raw_result = restored_outputs[-1].raw  # Every task was restored
+        elif hasattr(result, 'raw_output'):
+            raw_result = result.raw_output  # CrewOutput with raw_output
+        elif hasattr(result, '__str__'):
+            raw_result = str(result)  # Stringable object
+        else:
+            raw_result = "Failed to extract raw result from crew output"
+        
+        # Keep every task's output, not just the final one
+        self.task_outputs = self._collect_task_outputs(restored_outputs + list(getattr(result, "tasks_output", None) or []))
+        
+        # Save raw result for debugging
+        self._save_debug_output(raw_result)
+        
+        # Parse and structure the results
+        structured_result = self._structure_results(raw_result, self.task_outputs)
+        structured_result["task_outputs"] = {name: task_output.raw for name, task_output in self.task_outputs.items()}
+        record_analysis(crew_type, "failed" if structured_result.get("error") else "completed")
+        
+        # Return as JSON string
+        return json.dumps(structured_result)
+    
+    def _failed_run(self, error):
+        """
+        Report a failed crew run
+        
+        Args:
+            error: The exception the run failed with
+            
+        Returns:
+            str: JSON string with the fallback result
+        """
+        print(f"Error in crew execution: {str(error)}")
+        record_analysis(type(self).__name__, "failed")
+        
+        # Return fallback result
+        fallback_result = {
+            "error": True,
+            "message": f"The analysis encountered an error: {str(error)}",
+            "summary": "The analysis could not be completed due to an error.",
+            "key_topics": ["Error occurred", "Analysis incomplete"],
+            "sentiment_analysis": "Sentiment analysis could not be completed.",
+            "action_items": ["Try again with different settings", "Check agent configuration"]
+        }
+        
+        # A task that failed for good cancels the tasks after it, which all
+        # see its output; record which ones so the run can be resumed
+        if isinstance(error, TaskExecutionError):
+            fallback_result["failed_task"] = error.task_name
+            fallback_result["error_category"] = error.category
+            fallback_result["cancelled_tasks"] = [
+                task.name for task in self.tasks
+                if task.output is None and task.name != error.task_name
+            ]
+        
+        return json.dumps(fallback_result)
+    
+    def run_concurrently(self, agent, tasks):
+        """
+        Run independent tasks of one agent concurrently instead of one after another
+        
+        Each task runs in its own thread on the CrewAI agent (and LLM copy)
+        it was created with, which no other task shares. Outputs are
+        validated against each task's output schema, and stored as the
+        crew's task outputs like those of run().
+        
+        Args:
+            agent: Agent instance the tasks were created for
+            tasks: Tasks that don't use each other's output
+            
+        Returns:
+            dict: Task name -> TaskOutput, leaving out tasks that failed
+        """
+        def execute(task):
+            try:
+                raw = str(agent.execute_task(task)).strip()
+            except TaskExecutionError as e:
+                print(f"Skipping task {task.name}: {str(e)}")
+                return None
+            
+            return self._build_task_output(task, raw)
+        
+        with span("crew", f"{type(self).__name__}.fanout", model=self.model, tasks=len(tasks)), self.model_scope():
+            outputs = map_concurrently(execute, tasks)
+        
+        self.task_outputs = self._collect_task_outputs([output for output in outputs if output is not None])
+        return self.task_outputs
+    
+    async def arun_concurrently(self, agent, tasks):
+        """
+        Run independent tasks of one agent concurrently on the event loop
+        
+        The async counterpart of run_concurrently(): the tasks' LLM requests
+        are all in flight at once without a thread each.
+        
+        Args:
+            agent: Agent instance the tasks were created for
+            tasks: Tasks that don't use each other's output
+            
+        Returns:
+            dict: Task name -> TaskOutput, leaving out tasks that failed
+        """
+        async def execute(task):
+            try:
+                raw = str(await agent.aexecute_task(task)).strip()
+            except TaskExecutionError as e:
+                print(f"Skipping task {task.name}: {str(e)}")
+                return None
+            
+            return await asyncio.to_thread(self._build_task_output, task, raw)
+        
+        with span("crew", f"{type(self).__name__}.fanout", model=self.model, tasks=len(tasks)), self.model_scope():
+            outputs = await asyncio.gather(*(execute(task) for task in tasks))
+        
+        self.task_outputs = self._collect_task_outputs([output for output in outputs if output is not None])
+        return self.task_outputs
+    
+    async def _aexecute_task(self, task):
+        """
+        Execute one task of the crew with the outputs of its context tasks
+        
+        Args:
+            task: CrewAI task
+            
+        Returns:
+            TaskOutput: The task's output (also set as task.output)
+            
+        Raises:
+            TaskExecutionError: If the task failed
+        """
+        from crewai.utilities.formatter import aggregate_raw_outputs_from_tasks
+        
+        # The crew's agent instance with the task agent's role runs it
+        agent = next((agent for agent in self.agents.values() if agent.role == task.agent.role), None)
+        if agent is None:
+            raise ValueError(f"No agent in {type(self).__name__} for role {task.agent.role}")
+        
+        context = aggregate_raw_outputs_from_tasks(task.context) if task.context else None
+        
+        with span("task", task.name or "task", agent=task.agent.role):
+            raw = str(await agent.aexecute_task(task, context=context)).strip()
+            
+            # Converting to the output schema may need an LLM call of its own
+            task.output = await asyncio.to_thread(self._build_task_output, task, raw)
+        
+        if task.callback:
+            task.callback(task.output)
+        
+        return task.output
+    
+    def _build_task_output(self, task, raw):
+        """
+        Build a task's TaskOutput from its raw result, validated against its output schema
+        
+        Args:
+            task: CrewAI task
+            raw: Raw result text
+            
+        Returns:
+            TaskOutput: Output with the structured result, if it validates
+        """
+        from crewai.tasks.output_format import OutputFormat
+        from crewai.tasks.task_output import TaskOutput
+        from crewai.utilities.converter import convert_to_model
+        
+        pydantic = None
+        if task.output_pydantic is not None:
+            converted = convert_to_model(raw, task.output_pydantic, None, task.agent)
+            if isinstance(converted, task.output_pydantic):
+                pydantic = converted
+        
+        return TaskOutput(
+            name=task.name,
+            description=task.description,
+            expected_output=task.expected_output,
+            agent=task.agent.role,
+            raw=raw,
+            pydantic=pydantic,
+            output_format=OutputFormat.PYDANTIC if pydantic is not None else OutputFormat.RAW
+        )
+    
+    def get_task_output(self, name, default=None):
+        """
+        Get the text output of a task from the last run
+        
+        Args:
+            name: Task name
+            default: Value returned if the task produced no output
             
-            return json.dumps(fallback_result)
+        Returns:
+            str: Task output (the text field of a structured translation)
+        """
+        task_output = self.task_outputs.get(name)
+        if task_output is None:
+            return default
+        
+        return getattr(task_output.pydantic, "text", None) or task_output.raw
+    
+    def _collect_task_outputs(self, outputs):
+        """
+        Key the output of each task by task name
+        
+        Args:
+            outputs: TaskOutputs of the crew's tasks, in task order
+            
+        Returns:
+            dict: Task name -> TaskOutput, in task order
+        """
+        task_outputs = {}
+        for index, task_output in enumerate(outputs):
+            name = task_output.name or f"task_{index + 1}"
+            
+            # Keep tasks that share a name apart
+            key = name
+            count = 1
+            while key in task_outputs:
+                count += 1
+                key = f"{name}_{count}"
+            
+            task_outputs[key] = task_output
+        
+        return task_outputs
+    
+    def _restore_checkpoints(self, checkpoint_store, task_hashes):
+        """
+        Restore the outputs of the leading tasks that have checkpoints in this run
+        
+        Args:
+            checkpoint_store: Checkpoint store, or None if checkpointing is off
+            task_hashes: Input hash of each task, from hash_tasks()
+            
+        Returns:
+            list: Restored TaskOutputs, for self.tasks[:len(list)]
+        """
+        if checkpoint_store is None:
+            return []
+        
+        try:
+            run = checkpoint_store.get_run(self.run_id) or {}
+        except Exception as e:
+            print(f"Error loading checkpoints for run {self.run_id}: {e}")
+            return []
+        
+        checkpoints = run.get("checkpoints") or {}
+        restored_outputs = []
+        for task, input_hash in zip(self.tasks, task_hashes):
+            if input_hash not in checkpoints:
+                break
+            task.output = output_from_checkpoint(task, checkpoints[input_hash])
+            restored_outputs.append(task.output)
+        
+        if restored_outputs:
+            print(f"Resuming run {self.run_id}: restored {len(restored_outputs)} of {len(self.tasks)} tasks from checkpoints")
+            
+            # CrewAI gives a task without explicit context the outputs of the
+            # tasks before it in the same kickoff; point the remaining tasks at
+            # the restored ones so they see the same context
+            for index in range(len(restored_outputs), len(self.tasks)):
+                if not self.tasks[index].context:
+                    self.tasks[index].context = self.tasks[:index]
+        
+        return restored_outputs
+    
+    def _make_checkpoint_callback(self, checkpoint_store, input_hash, original=None):
+        """
+        Create a task callback that checkpoints the task's output
+        
+        Args:
+            checkpoint_store: Checkpoint store
+            input_hash: The task's input hash, from hash_tasks()
+            original: Callback the task already had, called afterwards
+            
+        Returns:
+            callable: Callback taking a TaskOutput
+        """
+        def save_checkpoint(task_output):
+            try:
+                checkpoint_store.save_checkpoint(self.run_id, input_hash, checkpoint_from_output(task_output))
+            except Exception as e:
+                print(f"Error saving checkpoint for task {task_output.name}: {e}")
+            
+            if original:
+                return original(task_output)
+        
+        return save_checkpoint
     
     def _save_debug_output(self, raw_result):
         """
@@ -111,7 +631,7 @@ class BaseCrew:
         Args:
             raw_result: Raw result string from CrewAI
         """
-        debug_dir = "debug_output"
+        debug_dir = get_debug_output_dir()
         if not os.path.exists(debug_dir):
             os.makedirs(debug_dir)
         
@@ -120,19 +640,42 @@ class BaseCrew:
         
         print(f"Raw result from crew (first 500 chars): {raw_result[:500]}...")
     
-    def _structure_results(self, raw_result):
+    def _structure_results(self, raw_result, task_outputs=None):
         """
         Structure the raw results from the crew into a clean format
         
+        The results are assembled from the individual task outputs, each
+        filling the fields of its task type. The regex parser only runs on
+        the final crew output, for results no task output provides.
+        
         Args:
             raw_result: Raw result string from CrewAI
+            task_outputs: Optional task name -> TaskOutput from the crew run
             
         Returns:
             dict: Structured results
         """
         try:
             # Parse the crew result
-            structured_result = parse_crew_result(raw_result)
+            with span("stage", "parse_results", characters=len(raw_result)) as parse_span:
+                structured_result, mode = self._structure_task_results(task_outputs)
+                
+                if structured_result is None:
+                    structured_result = self._structure_json_results(raw_result)
+                    mode = "regex" if structured_result is None else "json"
+                
+                if structured_result is None:
+                    structured_result = parse_crew_result(raw_result)
+                elif mode == "tasks":
+                    # Fields no task provided come from the final output, as before
+                    missing_fields = [field for field in CORE_FIELDS if not structured_result.get(field)]
+                    if missing_fields:
+                        parsed_result = parse_crew_result(raw_result)
+                        for field in missing_fields:
+                            structured_result[field] = parsed_result[field]
+                
+                parse_span.set_attribute("mode", mode)
+                parse_span.set_attribute("fields", sorted(structured_result.keys()))
             
             # Validate results
             self._validate_results(structured_result)
@@ -154,6 +697,68 @@ class BaseCrew:
             
             return fallback_result
     
+    def _structure_task_results(self, task_outputs):
+        """
+        Assemble the results from the crew's individual task outputs
+        
+        Structured outputs are merged as validated; free-form outputs are
+        parsed one task at a time for the field their task type fills.
+        
+        Args:
+            task_outputs: Task name -> TaskOutput from the crew run
+            
+        Returns:
+            tuple: (structured results, "json" or "tasks"), or (None, None) if no task output fills a result field
+        """
+        structured_result = MeetingAnalysis().to_result()
+        structured_count = 0
+        parsed_count = 0
+        
+        for name, task_output in (task_outputs or {}).items():
+            if hasattr(task_output.pydantic, "merge_into"):
+                task_output.pydantic.merge_into(structured_result)
+                structured_count += 1
+            elif merge_task_output(name, task_output.raw, structured_result):
+                parsed_count += 1
+        
+        if not structured_count and not parsed_count:
+            return None, None
+        
+        print(f"Assembled results from {structured_count} structured and {parsed_count} free-form task outputs")
+        return structured_result, "tasks" if parsed_count else "json"
+    
+    def _structure_json_results(self, raw_result):
+        """
+        Build the results from a final answer that is already JSON
+        
+        Args:
+            raw_result: Raw result string from CrewAI
+            
+        Returns:
+            dict: Structured results, or None if the output isn't structured
+        """
+        # A final answer in JSON (optionally in a ```json fence) matching the result schema
+        text = raw_result.strip()
+        if text.startswith("```"):
+            text = text.strip("`").strip()
+            if text.lower().startswith("json"):
+                text = text[4:].strip()
+        
+        if not text.startswith("{"):
+            return None
+        
+        try:
+            analysis = MeetingAnalysis.model_validate_json(text)
+        except ValidationError as e:
+            print(f"Raw result is JSON but doesn't match the result schema, parsing as text: {e}")
+            return None
+        
+        # JSON with none of the result fields is some other kind of answer
+        if not any(analysis.to_result().values()):
+            return None
+        
+        return analysis.to_result()
+    
     def _validate_results(self, structured_result):
         """
         Validate the structured results and log warnings for missing data
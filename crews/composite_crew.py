@@ -0,0 +1,137 @@
+# crews/composite_crew.py
+import inspect
+import json
+from crews.base_crew import BaseCrew
+from crews.task_graph import SharedTaskGraph, task_graph_scope
+from utils.artifacts import artifact_scope
+from utils.concurrency import map_concurrently
+from utils.instrumentation import span
+from utils.metrics import record_analysis
+
+# Crews a composite run combines by default
+DEFAULT_CREW_TYPES = ["standard", "research", "fact_checking"]
+
+class CompositeCrew(BaseCrew):
+    """Runs several crews on one Meeting, executing the work they share once"""
+    
+    def __init__(self, model="gpt-4o", crew_types=None, target_languages=None, agent_models=None):
+        """
+        Initialize the composite crew
+        
+        Args:
+            model: LLM model to use
+            crew_types: Crew types to combine (defaults to standard, research and fact checking)
+            target_languages: List of languages for the multilingual crews among them
+            agent_models: Optional dict of per-agent model overrides by agent ID
+        """
+        from crews import AVAILABLE_CREWS, get_crew
+        
+        super().__init__(model=model, agent_models=agent_models)
+        
+        self.crew_types = list(dict.fromkeys(crew_types or DEFAULT_CREW_TYPES))
+        if "composite" in self.crew_types:
+            raise ValueError("A composite crew can't contain another composite crew")
+        
+        self.target_languages = target_languages
+        
+        # Build one crew per type with this crew's models
+        self.crews = {}
+        for crew_type in self.crew_types:
+            crew_kwargs = {"model": model, "agent_models": agent_models}
+            if target_languages and crew_type in AVAILABLE_CREWS:
+                parameters = inspect.signature(AVAILABLE_CREWS[crew_type].__init__).parameters
+                if "target_languages" in parameters:
+                    crew_kwargs["target_languages"] = target_languages
+            self.crews[crew_type] = get_crew(crew_type, **crew_kwargs)
+        
+        # The transcript is refined once, up front, for all crews
+        self.add_agent("transcriber")
+    
+    def run_analysis(self, transcript_content):
+        """
+        Run every crew's analysis on the transcript
+        
+        The crews run concurrently in one shared task graph: the transcript
+        is refined once, and tasks two crews have in common (the same agent
+        and model, the same task on the same input, after the same tasks)
+        are executed once, with the other crews reusing the output.
+        
+        Args:
+            transcript_content: Raw transcript content
+        
+        Returns:
+            str: JSON string with the first successful crew's results, every
+                 crew's results under "crews", and the sharing counts under "composite"
+        """
+        crew_type = type(self).__name__
+        record_analysis(crew_type, "started")
+        
+        graph = SharedTaskGraph()
+        
+        with span("crew", crew_type, model=self.model, crews=len(self.crews)):
+            with artifact_scope(), task_graph_scope(graph):
+                # Refine the transcript before the crews start, so they all reuse it
+                print("Processing transcript with transcriber agent...")
+                self.refine_transcript(transcript_content)
+                
+                crew_results = map_concurrently(
+                    lambda item: self._run_crew(item[0], item[1], transcript_content),
+                    list(self.crews.items())
+                )
+        
+        results = dict(zip(self.crews.keys(), crew_results))
+        print(f"Composite run of {len(results)} crews executed {graph.executed_tasks} tasks "
+              f"and reused {graph.shared_tasks}")
+        
+        # The first crew that succeeded provides the top-level results
+        successful = [result for result in results.values() if not result.get("error")]
+        if successful:
+            structured_result = dict(successful[0])
+        else:
+            structured_result = dict(next(iter(results.values())))
+        
+        structured_result["crews"] = results
+        structured_result["composite"] = {
+            "crew_types": self.crew_types,
+            "executed_tasks": graph.executed_tasks,
+            "shared_tasks": graph.shared_tasks
+        }
+        record_analysis(crew_type, "failed" if structured_result.get("error") else "completed")
+        
+        return json.dumps(structured_result)
+    
+    def _run_crew(self, crew_type, crew, transcript_content):
+        """
+        Run one crew's analysis entry point
+        
+        The crews share this run's ID, so tasks they have in common also
+        share their checkpoints.
+        
+        Args:
+            crew_type: Type of the crew
+            crew: Crew instance
+            transcript_content: Raw transcript content
+        
+        Returns:
+            dict: The crew's structured results
+        """
+        crew.run_id = self.run_id
+        
+        try:
+            with crew.model_scope():
+                # The fact checking crew exposes run_fact_check instead of run_analysis
+                if hasattr(crew, "run_analysis"):
+                    result_json = crew.run_analysis(transcript_content)
+                else:
+                    result_json = crew.run_fact_check(transcript_content)
+            return json.loads(result_json)
+        except Exception as e:
+            print(f"Error running the {crew_type} crew: {str(e)}")
+            return {
+                "error": True,
+                "message": f"The {crew_type} analysis encountered an error: {str(e)}",
+                "summary": "The analysis could not be completed due to an error.",
+                "key_topics": ["Error occurred", "Analysis incomplete"],
+                "sentiment_analysis": "Sentiment analysis could not be completed.",
+                "action_items": ["Try again with different settings", "Check agent configuration"]
+            }
\ No newline at end of file
@@ -1,27 +1,28 @@
 # crews/multilingual_crew.py
 import json
 from crews.base_crew import BaseCrew
-from agents.registry import get_agent
 from agents.tasks.transcription import TranscriptionTask
 from agents.tasks.analysis import AnalysisTask
 from agents.tasks.summary import SummaryTask
 from agents.tasks.sentiment import SentimentTask
 from agents.tasks.action_items import ActionItemsTask
 from agents.tasks.translation import TranslationTask
+from utils.result_parser import split_language_sections
 
 class AdvancedMultilingualCrew(BaseCrew):
     """Advanced multilingual crew for comprehensive translation and localization"""
     
-    def __init__(self, model="gpt-4o", source_language="english", target_languages=None):
+    def __init__(self, model="gpt-4o", source_language="english", target_languages=None, agent_models=None):
         """
         Initialize the advanced multilingual crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
             source_language: Source language of the Meeting
             target_languages: List of languages to translate to
         """
-        super().__init__(model=model)
+        super().__init__(model=model, agent_models=agent_models)
         
         # Add required agents
         self.add_agent("transcriber")
@@ -52,17 +53,46 @@ class AdvancedMultilingualCrew(BaseCrew):
         # Reset tasks
         self.tasks = []
         
-        # Get agent instances
-        transcriber = get_agent("transcriber")
-        analyzer = get_agent("analyzer")
-        summarizer = get_agent("summarizer")
-        sentiment = get_agent("sentiment")
-        action_item = get_agent("action_item")
-        translator = get_agent("translator")
-        
         # Process transcript directly first
         print("Processing transcript with transcriber agent...")
-        transcript_result = transcriber.process_transcript(transcript_content)
+        transcript_result = self.refine_transcript(transcript_content)
+        
+        self.add_analysis_tasks(transcript_result)
+        
+        # Run the crew
+        return self._structure_translations(self.run())
+    
+    async def arun_analysis(self, transcript_content):
+        """
+        Run multilingual analysis without blocking the event loop
+        
+        Args:
+            transcript_content: Raw transcript content
+            
+        Returns:
+            str: JSON string with multilingual analysis results
+        """
+        self.tasks = []
+        
+        print("Processing transcript with transcriber agent...")
+        transcript_result = await self.arefine_transcript(transcript_content)
+        
+        self.add_analysis_tasks(transcript_result)
+        return self._structure_translations(await self.arun())
+    
+    def add_analysis_tasks(self, transcript_result):
+        """
+        Add the analysis and multilingual summary tasks for a refined transcript
+        
+        Args:
+            transcript_result: Refined transcript
+        """
+        # Get agent instances
+        analyzer = self.get_agent("analyzer")
+        summarizer = self.get_agent("summarizer")
+        sentiment = self.get_agent("sentiment")
+        action_item = self.get_agent("action_item")
+        translator = self.get_agent("translator")
         
         # Create core analysis tasks
         analyze_task = AnalysisTask.create_content_analysis_task(analyzer, transcript_result)
@@ -86,10 +116,17 @@ class AdvancedMultilingualCrew(BaseCrew):
             self.target_languages
         )
         self.add_task(multilingual_task)
+    
+    def _structure_translations(self, result_json):
+        """
+        Add the source language content and each target language's summary to the results
         
-        # Run the crew
-        result_json = self.run()
-        
+        Args:
+            result_json: JSON string with the crew's results
+            
+        Returns:
+            str: JSON string with the multilingual results
+        """
         try:
             # Structure the multilingual results
             result = json.loads(result_json)
@@ -111,45 +148,18 @@ class AdvancedMultilingualCrew(BaseCrew):
                 "action_items": result.get("action_items", [])
             }
             
-            # Process multilingual content if available
+            # Split the multilingual summary task's output by its language headers
+            multilingual_summary = self.get_task_output("multilingual_summary", "")
+            language_sections = split_language_sections(multilingual_summary, self.target_languages)
+            
             for language in self.target_languages:
                 lang_key = language.lower()
                 
-                # Look for language-specific content in the result
-                if f"{lang_key}_summary" in result:
-                    if lang_key not in result["translations"]:
+                if lang_key in language_sections:
+                    if not isinstance(result["translations"].get(lang_key), dict):
                         result["translations"][lang_key] = {}
                     
-                    result["translations"][lang_key]["summary"] = result[f"{lang_key}_summary"]
-                    
-                    # Clean up the main result by removing language-specific keys
-                    del result[f"{lang_key}_summary"]
-                
-                if f"{lang_key}_action_items" in result:
-                    if lang_key not in result["translations"]:
-                        result["translations"][lang_key] = {}
-                        
-                    # Handle action items as either text or list
-                    action_items = result[f"{lang_key}_action_items"]
-                    if isinstance(action_items, str):
-                        # Try to parse text into list
-                        items = []
-                        for line in action_items.split('\n'):
-                            line = line.strip()
-                            if line and (line.startswith('-') or line.startswith('*')):
-                                items.append(line[1:].strip())
-                            elif line:
-                                items.append(line)
-                        
-                        if items:
-                            result["translations"][lang_key]["action_items"] = items
-                        else:
-                            result["translations"][lang_key]["action_items"] = [action_items]
-                    else:
-                        result["translations"][lang_key]["action_items"] = action_items
-                    
-                    # Clean up the main result
-                    del result[f"{lang_key}_action_items"]
+                    result["translations"][lang_key]["summary"] = language_sections[lang_key]
             
             return json.dumps(result)
         except Exception as e:
@@ -159,12 +169,13 @@ class AdvancedMultilingualCrew(BaseCrew):
 class LocalizationCrew(AdvancedMultilingualCrew):
     """Crew specialized in content localization for different cultures and regions"""
     
-    def __init__(self, model="gpt-4o", source_culture="US", target_cultures=None):
+    def __init__(self, model="gpt-4o", source_culture="US", target_cultures=None, agent_models=None):
         """
         Initialize the localization crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
             source_culture: Source culture/region of the Meeting
             target_cultures: List of cultures/regions to localize for
         """
@@ -187,12 +198,12 @@ class LocalizationCrew(AdvancedMultilingualCrew):
         # Set default target cultures if none provided
         target_cultures = target_cultures or ["UK", "CA", "MX", "FR"]
         
-        # Map cultures to languages
+        # Map cultures to languages, translating once per language however many cultures share it
         source_language = culture_to_language.get(source_culture, "english")
-        target_languages = [culture_to_language.get(culture, "english") for culture in target_cultures]
+        target_languages = list(dict.fromkeys(culture_to_language.get(culture, "english") for culture in target_cultures))
         
         # Initialize the multilingual crew
-        super().__init__(model=model, source_language=source_language, target_languages=target_languages)
+        super().__init__(model=model, source_language=source_language, target_languages=target_languages, agent_models=agent_models)
         
         # Store culture information
         self.source_culture = source_culture
@@ -214,57 +225,145 @@ class LocalizationCrew(AdvancedMultilingualCrew):
             str: JSON string with localized analysis results
         """
         # First, run the multilingual analysis
-        result_json = super().run_analysis(transcript_content)
+        result = self._add_culture_info(super().run_analysis(transcript_content))
+        if result.get("error") or "summary" not in result:
+            return json.dumps(result)
+        
+        # Add culture-specific localizations
+        try:
+            localizations = self.localize_results(result)
+        except Exception as e:
+            localizations = e
+        
+        return json.dumps(self._add_localizations(result, localizations))
+    
+    async def arun_analysis(self, transcript_content):
+        """
+        Run localized analysis without blocking the event loop
+        
+        Args:
+            transcript_content: Raw transcript content
+            
+        Returns:
+            str: JSON string with localized analysis results
+        """
+        result = self._add_culture_info(await super().arun_analysis(transcript_content))
+        if result.get("error") or "summary" not in result:
+            return json.dumps(result)
+        
+        try:
+            localizations = await self.alocalize_results(result)
+        except Exception as e:
+            localizations = e
+        
+        return json.dumps(self._add_localizations(result, localizations))
+    
+    def _add_culture_info(self, result_json):
+        """
+        Add the source and target cultures to the multilingual results
+        
+        Args:
+            result_json: JSON string with the multilingual results
+            
+        Returns:
+            dict: The results, with an (empty unless already present) localizations section
+        """
         result = json.loads(result_json)
         
         # Add localization information
         result["source_culture"] = self.source_culture
         result["target_cultures"] = self.target_cultures
         
-        # Add culture-specific localizations
         if "localizations" not in result:
             result["localizations"] = {}
         
-        # Reset tasks for localization
-        self.tasks = []
+        return result
+    
+    def _add_localizations(self, result, localizations):
+        """
+        Add localizations to the results
         
-        # Get translator agent
-        translator = get_agent("translator")
+        Args:
+            result: Results from _add_culture_info
+            localizations: Localizations from localize_results, or the exception localizing failed with
+            
+        Returns:
+            dict: The results
+        """
+        if isinstance(localizations, Exception):
+            print(f"Error processing localization results: {localizations}")
+            result["localization_error"] = str(localizations)
+        else:
+            result["localizations"].update(localizations)
+        
+        return result
+    
+    def localize_results(self, result):
+        """
+        Localize the summary for every target culture
+        
+        Cultures that share a language are localized together in one request,
+        starting from the summary already translated to that language, and
+        the requests for different languages run concurrently.
         
-        # Create localization tasks for each target culture
+        Args:
+            result: Multilingual analysis result
+            
+        Returns:
+            dict: Culture -> {"content", "language"}, leaving out cultures that failed
+        """
+        translator = self.get_agent("translator")
+        cultures_by_language, tasks = self._localization_tasks(translator, result)
+        return self._collect_localizations(cultures_by_language, self.run_concurrently(translator, tasks))
+    
+    async def alocalize_results(self, result):
+        """
+        Localize the summary like localize_results, without blocking the event loop
+        
+        Args:
+            result: Multilingual analysis result
+            
+        Returns:
+            dict: Culture -> {"content", "language"}, leaving out cultures that failed
+        """
+        translator = self.get_agent("translator")
+        cultures_by_language, tasks = self._localization_tasks(translator, result)
+        return self._collect_localizations(cultures_by_language, await self.arun_concurrently(translator, tasks))
+    
+    def _localization_tasks(self, translator, result):
+        """Build one localization task per target language, returning (cultures by language, tasks)"""
+        cultures_by_language = {}
         for culture in self.target_cultures:
-            language = self.culture_language_map.get(culture)
+            cultures_by_language.setdefault(self.culture_language_map.get(culture, "english"), []).append(culture)
+        
+        # Name each task after its language so its output can be found by language
+        tasks = []
+        for language, cultures in cultures_by_language.items():
+            translation = result.get("translations", {}).get(language)
+            if language != self.source_language and isinstance(translation, dict) and translation.get("summary"):
+                content, content_language = translation["summary"], language
+            else:
+                content, content_language = result["summary"], self.source_language
+            
+            tasks.append(TranslationTask.create_regional_localization_task(
+                translator, content, language, cultures, content_language=content_language, name=f"{language}_localized"
+            ))
+        return cultures_by_language, tasks
+    
+    def _collect_localizations(self, cultures_by_language, task_outputs):
+        """Get each target culture's localization from the localization task outputs"""
+        localizations = {}
+        for language, cultures in cultures_by_language.items():
+            task_output = task_outputs.get(f"{language}_localized")
+            localized = task_output.pydantic.by_region() if task_output is not None and task_output.pydantic is not None else {}
             
-            # Create a localization task
-            if "summary" in result:
-                localization_task = TranslationTask.create_localization_task(
-                    translator,
-                    {
-                        "content": result["summary"],
-                        "target_region": culture
+            for culture in cultures:
+                if culture.upper() in localized:
+                    localizations[culture] = {
+                        "content": localized[culture.upper()],
+                        "language": language
                     }
-                )
-                self.add_task(localization_task)
+                else:
+                    print(f"No usable localization for {culture}")
         
-        # If we have tasks, run localization
-        if self.tasks:
-            # Run the localization tasks
-            localization_result = self.run()
-            
-            try:
-                # Parse localization results
-                localization_data = json.loads(localization_result)
-                
-                # Process localization results
-                for culture in self.target_cultures:
-                    key = f"{culture.lower()}_localized"
-                    if key in localization_data:
-                        result["localizations"][culture] = {
-                            "content": localization_data[key],
-                            "language": self.culture_language_map.get(culture, "english")
-                        }
-            except Exception as e:
-                print(f"Error processing localization results: {e}")
-                result["localization_error"] = str(e)
-        
-        return json.dumps(result)
\ No newline at end of file
+        return localizations
\ No newline at end of file
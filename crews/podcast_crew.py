@@ -1,7 +1,6 @@
 # crews/podcast_crew.py
 import json
 from crews.base_crew import BaseCrew
-from agents.registry import get_agent
 from agents.tasks.transcription import TranscriptionTask
 from agents.tasks.analysis import AnalysisTask
 from agents.tasks.summary import SummaryTask
@@ -14,14 +13,15 @@ from agents.tasks.translation import TranslationTask
 class PodcastCrew(BaseCrew):
     """Standard crew for Meeting analysis"""
     
-    def __init__(self, model="gpt-4o"):
+    def __init__(self, model="gpt-4o", agent_models=None):
         """
         Initialize the Meeting crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
         """
-        super().__init__(model=model)
+        super().__init__(model=model, agent_models=agent_models)
         
         # Add the standard agents
         self.add_agent("transcriber")
@@ -43,16 +43,48 @@ class PodcastCrew(BaseCrew):
         # Reset tasks
         self.tasks = []
         
-        # Get agent instances
-        transcriber = get_agent("transcriber")
-        analyzer = get_agent("analyzer")
-        summarizer = get_agent("summarizer")
-        sentiment = get_agent("sentiment")
-        action_item = get_agent("action_item")
-        
         # Process transcript directly first
         print("Processing transcript with transcriber agent...")
-        transcript_result = transcriber.process_transcript(transcript_content)
+        transcript_result = self.refine_transcript(transcript_content)
+        
+        self.add_analysis_tasks(transcript_result)
+        
+        # Run the crew
+        return self.run()
+    
+    async def arun_analysis(self, transcript_content):
+        """
+        Run the crew's Meeting analysis without blocking the event loop
+        
+        The async counterpart of run_analysis, for running many analyses
+        on one event loop.
+        
+        Args:
+            transcript_content: Raw transcript content
+            
+        Returns:
+            str: JSON string with analysis results
+        """
+        self.tasks = []
+        
+        print("Processing transcript with transcriber agent...")
+        transcript_result = await self.arefine_transcript(transcript_content)
+        
+        self.add_analysis_tasks(transcript_result)
+        return await self.arun()
+    
+    def add_analysis_tasks(self, transcript_result):
+        """
+        Add the crew's analysis tasks for a refined transcript
+        
+        Args:
+            transcript_result: Refined transcript
+        """
+        # Get agent instances
+        analyzer = self.get_agent("analyzer")
+        summarizer = self.get_agent("summarizer")
+        sentiment = self.get_agent("sentiment")
+        action_item = self.get_agent("action_item")
         
         # Create tasks for the crew
         analyze_task = AnalysisTask.create_content_analysis_task(analyzer, transcript_result)
@@ -66,51 +98,38 @@ class PodcastCrew(BaseCrew):
         
         action_task = ActionItemsTask.create_action_items_task(action_item, summarize_task, sentiment_task)
         self.add_task(action_task)
-        
-        # Run the crew
-        return self.run()
 
 class EnhancedPodcastCrew(PodcastCrew):
     """Enhanced Meeting crew with fact checking and research"""
     
-    def __init__(self, model="gpt-4o"):
+    def __init__(self, model="gpt-4o", agent_models=None):
         """
         Initialize the enhanced Meeting crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
         """
-        super().__init__(model=model)
+        super().__init__(model=model, agent_models=agent_models)
         
         # Add additional agents
         self.add_agent("fact_checker")
         self.add_agent("researcher")
     
-    def run_analysis(self, transcript_content):
+    def add_analysis_tasks(self, transcript_result):
         """
-        Run enhanced Meeting analysis with all agents including fact checking and research
+        Add the enhanced analysis tasks, including fact checking and research
         
         Args:
-            transcript_content: Raw transcript content
-            
-        Returns:
-            str: JSON string with enhanced analysis results
+            transcript_result: Refined transcript
         """
-        # Reset tasks
-        self.tasks = []
-        
         # Get agent instances
-        transcriber = get_agent("transcriber")
-        analyzer = get_agent("analyzer")
-        summarizer = get_agent("summarizer")
-        sentiment = get_agent("sentiment")
-        action_item = get_agent("action_item")
-        fact_checker = get_agent("fact_checker")
-        researcher = get_agent("researcher")
-        
-        # Process transcript directly first
-        print("Processing transcript with transcriber agent...")
-        transcript_result = transcriber.process_transcript(transcript_content)
+        analyzer = self.get_agent("analyzer")
+        summarizer = self.get_agent("summarizer")
+        sentiment = self.get_agent("sentiment")
+        action_item = self.get_agent("action_item")
+        fact_checker = self.get_agent("fact_checker")
+        researcher = self.get_agent("researcher")
         
         # Create core analysis tasks
         analyze_task = AnalysisTask.create_content_analysis_task(analyzer, transcript_result)
@@ -149,21 +168,20 @@ class EnhancedPodcastCrew(PodcastCrew):
         )
         self.add_task(action_task)
         
-        # Run the crew
-        return self.run()
 
 class MultilingualPodcastCrew(PodcastCrew):
     """Multilingual Meeting crew with translation capabilities"""
     
-    def __init__(self, model="gpt-4o", target_languages=None):
+    def __init__(self, model="gpt-4o", target_languages=None, agent_models=None):
         """
         Initialize the multilingual Meeting crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
             target_languages: List of languages to translate to
         """
-        super().__init__(model=model)
+        super().__init__(model=model, agent_models=agent_models)
         
         # Add translator agent
         self.add_agent("translator")
@@ -184,86 +202,134 @@ class MultilingualPodcastCrew(PodcastCrew):
         # First, run standard analysis
         result_json = super().run_analysis(transcript_content)
         result = json.loads(result_json)
+        if result.get("error"):
+            return result_json
         
         # Add translations of the summary and action items
-        translator = get_agent("translator")
+        try:
+            translations = self.translate_results(result.get("summary", ""), result.get("action_items", []))
+        except Exception as e:
+            translations = e
         
-        translated_summaries = {}
-        translated_action_items = {}
+        return json.dumps(self._add_translations(result, translations))
+    
+    async def arun_analysis(self, transcript_content):
+        """
+        Run multilingual Meeting analysis without blocking the event loop
+        
+        Args:
+            transcript_content: Raw transcript content
+            
+        Returns:
+            str: JSON string with multilingual analysis results
+        """
+        result_json = await super().arun_analysis(transcript_content)
+        result = json.loads(result_json)
+        if result.get("error"):
+            return result_json
         
-        # Get the summary content
-        summary = result.get("summary", "")
+        try:
+            translations = await self.atranslate_results(result.get("summary", ""), result.get("action_items", []))
+        except Exception as e:
+            translations = e
         
-        # Get the action items
-        action_items = result.get("action_items", [])
-        action_items_text = "\n".join([f"- {item}" for item in action_items])
+        return json.dumps(self._add_translations(result, translations))
+    
+    def _add_translations(self, result, translations):
+        """
+        Add translations to the analysis results
         
-        # Reset tasks for translation
-        self.tasks = []
+        Args:
+            result: Structured analysis results
+            translations: Translations from translate_results, or the exception translating failed with
+            
+        Returns:
+            dict: The results
+        """
+        if isinstance(translations, Exception):
+            print(f"Error processing translation results: {translations}")
+            result["translations"] = {
+                "error": f"Translation processing failed: {str(translations)}"
+            }
+        else:
+            result["translations"] = {
+                language_key: translation.to_result() for language_key, translation in translations.items()
+            }
         
-        # Translate to each target language
-        for language in self.target_languages:
-            if language.lower() != "english":
-                try:
-                    # Create translation tasks
-                    # Translate summary
-                    summary_task = TranslationTask.create_summary_translation_task(
-                        translator, summary, language
-                    )
-                    self.add_task(summary_task)
-                    
-                    # Translate action items
-                    action_items_task = TranslationTask.create_translation_task(
-                        translator, 
-                        {
-                            "text": action_items_text,
-                            "target_language": language
-                        }
-                    )
-                    self.add_task(action_items_task)
-                    
-                except Exception as e:
-                    print(f"Error creating translation tasks for {language}: {e}")
-        
-        # If we have tasks, run translation
-        if self.tasks:
-            # Run the translation tasks
-            translation_result = self.run()
+        return result
+    
+    def translate_results(self, summary, action_items):
+        """
+        Translate the summary and action items to every target language at once
+        
+        Each language is one structured request, and all of them run
+        concurrently, so adding a language adds little wall time.
+        
+        Args:
+            summary: Meeting summary
+            action_items: List of action items
             
-            # Try to parse translation results
-            try:
-                translation_data = json.loads(translation_result)
-                
-                # Add translations to the result
-                result["translations"] = {}
-                
-                for language in self.target_languages:
-                    if language.lower() != "english":
-                        language_key = language.lower()
-                        if f"{language_key}_summary" in translation_data:
-                            result["translations"][language_key] = {
-                                "summary": translation_data[f"{language_key}_summary"],
-                                "action_items": translation_data[f"{language_key}_action_items"]
-                            }
-            except Exception as e:
-                print(f"Error processing translation results: {e}")
-                result["translations"] = {
-                    "error": f"Translation processing failed: {str(e)}"
-                }
-        
-        return json.dumps(result)
+        Returns:
+            dict: Lowercase language -> MeetingTranslationOutput, leaving out failed languages
+        """
+        translator = self.get_agent("translator")
+        languages, tasks = self._translation_tasks(translator, summary, action_items)
+        return self._collect_translations(languages, self.run_concurrently(translator, tasks))
+    
+    async def atranslate_results(self, summary, action_items):
+        """
+        Translate the summary and action items like translate_results, without blocking the event loop
+        
+        Args:
+            summary: Meeting summary
+            action_items: List of action items
+            
+        Returns:
+            dict: Lowercase language -> MeetingTranslationOutput, leaving out failed languages
+        """
+        translator = self.get_agent("translator")
+        languages, tasks = self._translation_tasks(translator, summary, action_items)
+        return self._collect_translations(languages, await self.arun_concurrently(translator, tasks))
+    
+    def _translation_tasks(self, translator, summary, action_items):
+        """Build one translation task per target language, returning (languages, tasks)"""
+        languages = [language for language in self.target_languages if language.lower() != "english"]
+        
+        # Name each task after its language so its output can be found by language
+        tasks = [
+            TranslationTask.create_meeting_translation_task(
+                translator, summary, action_items, language, name=f"{language.lower()}_translation"
+            )
+            for language in languages
+        ]
+        return languages, tasks
+    
+    def _collect_translations(self, languages, task_outputs):
+        """Get the validated translation of each language from the translation task outputs"""
+        translations = {}
+        for language in languages:
+            language_key = language.lower()
+            task_output = task_outputs.get(f"{language_key}_translation")
+            if task_output is None or task_output.pydantic is None:
+                print(f"No usable translation to {language}")
+                continue
+            
+            translations[language_key] = task_output.pydantic
+        
+        return translations
 
 class ResearchPodcastCrew(BaseCrew):
     """Research-focused Meeting crew that prioritizes factual information and references"""
     
-    def __init__(self, model="gpt-4o"):
+    def __init__(self, model="gpt-4o", agent_models=None):
         """
         Initialize the research Meeting crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
         """
-        super().__init__(model=model)
+        super().__init__(model=model, agent_models=agent_models)
         
         # Add required agents
         self.add_agent("transcriber")
@@ -286,17 +352,46 @@ class ResearchPodcastCrew(BaseCrew):
         # Reset tasks
         self.tasks = []
         
-        # Get agent instances
-        transcriber = get_agent("transcriber")
-        analyzer = get_agent("analyzer")
-        researcher = get_agent("researcher")
-        fact_checker = get_agent("fact_checker")
-        summarizer = get_agent("summarizer")
-        action_item = get_agent("action_item")
-        
         # Process transcript directly first
         print("Processing transcript with transcriber agent...")
-        transcript_result = transcriber.process_transcript(transcript_content)
+        transcript_result = self.refine_transcript(transcript_content)
+        
+        self.add_analysis_tasks(transcript_result)
+        
+        # Run the crew
+        return self._add_references(self.run())
+    
+    async def arun_analysis(self, transcript_content):
+        """
+        Run research-focused Meeting analysis without blocking the event loop
+        
+        Args:
+            transcript_content: Raw transcript content
+            
+        Returns:
+            str: JSON string with research-focused analysis results
+        """
+        self.tasks = []
+        
+        print("Processing transcript with transcriber agent...")
+        transcript_result = await self.arefine_transcript(transcript_content)
+        
+        self.add_analysis_tasks(transcript_result)
+        return self._add_references(await self.arun())
+    
+    def add_analysis_tasks(self, transcript_result):
+        """
+        Add the research-focused analysis tasks for a refined transcript
+        
+        Args:
+            transcript_result: Refined transcript
+        """
+        # Get agent instances
+        analyzer = self.get_agent("analyzer")
+        researcher = self.get_agent("researcher")
+        fact_checker = self.get_agent("fact_checker")
+        summarizer = self.get_agent("summarizer")
+        action_item = self.get_agent("action_item")
         
         # Initial analysis task
         analyze_task = AnalysisTask.create_content_analysis_task(analyzer, transcript_result)
@@ -350,11 +445,17 @@ class ResearchPodcastCrew(BaseCrew):
             }
         )
         self.add_task(action_task)
+    
+    def _add_references(self, result_json):
+        """
+        Add structured references to the research crew's results
         
-        # Run the crew
-        result_json = self.run()
-        
-        # Add structured references to the result
+        Args:
+            result_json: JSON string with the crew's results
+            
+        Returns:
+            str: JSON string with results including references
+        """
         try:
             result = json.loads(result_json)
             
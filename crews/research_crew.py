@@ -1,7 +1,6 @@
 # crews/research_crew.py
 import json
 from crews.base_crew import BaseCrew
-from agents.registry import get_agent
 from agents.tasks.transcription import TranscriptionTask
 from agents.tasks.analysis import AnalysisTask
 from agents.tasks.summary import SummaryTask
@@ -12,14 +11,15 @@ from agents.tasks.research import ResearchTask
 class DeepResearchCrew(BaseCrew):
     """Specialized crew for deep research of Meeting topics"""
     
-    def __init__(self, model="gpt-4o"):
+    def __init__(self, model="gpt-4o", agent_models=None):
         """
         Initialize the deep research crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
         """
-        super().__init__(model=model)
+        super().__init__(model=model, agent_models=agent_models)
         
         # Add required agents
         self.add_agent("transcriber")
@@ -42,16 +42,47 @@ class DeepResearchCrew(BaseCrew):
         # Reset tasks
         self.tasks = []
         
-        # Get agent instances
-        transcriber = get_agent("transcriber")
-        analyzer = get_agent("analyzer")
-        researcher = get_agent("researcher")
-        summarizer = get_agent("summarizer")
-        action_item = get_agent("action_item")
-        
         # Process transcript directly first
         print("Processing transcript with transcriber agent...")
-        transcript_result = transcriber.process_transcript(transcript_content)
+        transcript_result = self.refine_transcript(transcript_content)
+        
+        self.add_research_tasks(transcript_result, research_depth)
+        
+        # Run the crew
+        return self._add_research_sections(self.run(), research_depth)
+    
+    async def arun_analysis(self, transcript_content, research_depth="deep"):
+        """
+        Run deep research analysis without blocking the event loop
+        
+        Args:
+            transcript_content: Raw transcript content
+            research_depth: Research depth (shallow, medium, deep)
+            
+        Returns:
+            str: JSON string with research results
+        """
+        self.tasks = []
+        
+        print("Processing transcript with transcriber agent...")
+        transcript_result = await self.arefine_transcript(transcript_content)
+        
+        self.add_research_tasks(transcript_result, research_depth)
+        return self._add_research_sections(await self.arun(), research_depth)
+    
+    def add_research_tasks(self, transcript_result, research_depth="deep"):
+        """
+        Add the deep research tasks for a refined transcript
+        
+        Args:
+            transcript_result: Refined transcript
+            research_depth: Research depth (shallow, medium, deep)
+        """
+        # Get agent instances
+        analyzer = self.get_agent("analyzer")
+        researcher = self.get_agent("researcher")
+        summarizer = self.get_agent("summarizer")
+        action_item = self.get_agent("action_item")
         
         # Extract topics for research
         topics_task = AnalysisTask.create_topic_extraction_task(analyzer, transcript_result)
@@ -100,17 +131,27 @@ class DeepResearchCrew(BaseCrew):
             }
         )
         self.add_task(action_task)
+    
+    def _add_research_sections(self, result_json, research_depth):
+        """
+        Add structured research, sources and methodology sections to the results
         
-        # Run the crew
-        result_json = self.run()
-        
+        Args:
+            result_json: JSON string with the crew's results
+            research_depth: Research depth the tasks were created with
+            
+        Returns:
+            str: JSON string with the structured research results
+        """
         try:
             # Add structured research elements to the result
             result = json.loads(result_json)
             
-            # Ensure we have a research section
+            # Ensure we have a research section (the research task's text becomes its insights)
             if "research" not in result:
                 result["research"] = {}
+            elif not isinstance(result["research"], dict):
+                result["research"] = {"insights": result["research"]}
             
             # Add a sources section if not present
             if "sources" not in result:
@@ -133,14 +174,15 @@ class DeepResearchCrew(BaseCrew):
 class FactCheckingCrew(BaseCrew):
     """Specialized crew for fact checking Meeting content"""
     
-    def __init__(self, model="gpt-4o"):
+    def __init__(self, model="gpt-4o", agent_models=None):
         """
         Initialize the fact checking crew
         
         Args:
             model: LLM model to use
+            agent_models: Optional dict of per-agent model overrides by agent ID
         """
-        super().__init__(model=model)
+        super().__init__(model=model, agent_models=agent_models)
         
         # Add required agents
         self.add_agent("transcriber")
@@ -162,15 +204,46 @@ class FactCheckingCrew(BaseCrew):
         # Reset tasks
         self.tasks = []
         
-        # Get agent instances
-        transcriber = get_agent("transcriber")
-        analyzer = get_agent("analyzer")
-        fact_checker = get_agent("fact_checker")
-        summarizer = get_agent("summarizer")
-        
         # Process transcript directly first
         print("Processing transcript with transcriber agent...")
-        transcript_result = transcriber.process_transcript(transcript_content)
+        transcript_result = self.refine_transcript(transcript_content)
+        
+        self.add_fact_check_tasks(transcript_result, max_claims)
+        
+        # Run the crew
+        return self._structure_fact_check(self.run())
+    
+    async def arun_fact_check(self, transcript_content, max_claims=10):
+        """
+        Run fact checking on Meeting content without blocking the event loop
+        
+        Args:
+            transcript_content: Raw transcript content
+            max_claims: Maximum number of claims to check
+            
+        Returns:
+            str: JSON string with fact checking results
+        """
+        self.tasks = []
+        
+        print("Processing transcript with transcriber agent...")
+        transcript_result = await self.arefine_transcript(transcript_content)
+        
+        self.add_fact_check_tasks(transcript_result, max_claims)
+        return self._structure_fact_check(await self.arun())
+    
+    def add_fact_check_tasks(self, transcript_result, max_claims=10):
+        """
+        Add the fact checking tasks for a refined transcript
+        
+        Args:
+            transcript_result: Refined transcript
+            max_claims: Maximum number of claims to check
+        """
+        # Get agent instances
+        analyzer = self.get_agent("analyzer")
+        fact_checker = self.get_agent("fact_checker")
+        summarizer = self.get_agent("summarizer")
         
         # Extract claims from the transcript
         claims_task = FactCheckingTask.create_claim_extraction_task(fact_checker, transcript_result)
@@ -201,10 +274,17 @@ class FactCheckingCrew(BaseCrew):
             }
         )
         self.add_task(summary_task)
+    
+    def _structure_fact_check(self, result_json):
+        """
+        Parse the fact check text into structured claims and their verification status
         
-        # Run the crew
-        result_json = self.run()
-        
+        Args:
+            result_json: JSON string with the crew's results
+            
+        Returns:
+            str: JSON string with the structured fact checking results
+        """
         try:
             # Structure the fact checking results
             result = json.loads(result_json)
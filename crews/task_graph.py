@@ -0,0 +1,156 @@
+# crews/task_graph.py
+"""
+Shared execution of the tasks of several crews
+
+While a SharedTaskGraph is active (see task_graph_scope), BaseCrew.run
+executes its tasks through the graph instead of a CrewAI kickoff. A task is
+identified by its input hash, which covers the task and every task before
+it in its crew (the context a sequential crew gives it), so two crews that
+start with the same tasks on the same transcript run them once: the first
+crew to reach a task executes it and the others wait for and reuse its
+output. Crews running concurrently in the same graph therefore share their
+common work without changing what any task sees.
+"""
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from contextvars import ContextVar
+from crewai.utilities.formatter import aggregate_raw_outputs_from_tasks
+from utils.instrumentation import span, get_agent_token_usage, record_agent_tokens
+from utils.retry import get_retry_policy, classify_error, TaskExecutionError
+
+# Task graph active in the current thread/task, set by task_graph_scope()
+_task_graph = ContextVar("task_graph", default=None)
+
+class SharedTaskGraph:
+    """Executes the tasks of several crews, running identical tasks once"""
+    
+    def __init__(self):
+        """Initialize an empty graph"""
+        self.lock = threading.Lock()
+        self.outputs = {}
+        self.executed_tasks = 0
+        self.shared_tasks = 0
+    
+    def execute(self, tasks, task_hashes):
+        """
+        Execute a crew's tasks in order, reusing outputs of identical tasks
+        
+        Args:
+            tasks: The crew's tasks to run; tasks without explicit context
+                   must have it set to the tasks before them
+            task_hashes: Input hash of each task, from hash_tasks()
+        
+        Returns:
+            list: TaskOutput of each task
+        """
+        task_outputs = []
+        
+        for task, input_hash in zip(tasks, task_hashes):
+            with self.lock:
+                future = self.outputs.get(input_hash)
+                owner = future is None
+                if owner:
+                    future = self.outputs[input_hash] = Future()
+            
+            if owner:
+                try:
+                    future.set_result(self._execute_task(task))
+                    with self.lock:
+                        self.executed_tasks += 1
+                except BaseException as e:
+                    future.set_exception(e)
+                    raise
+            else:
+                # Another crew runs (or ran) this exact task; wait for its output
+                task.output = future.result()
+                if task.callback:
+                    task.callback(task.output)
+                with self.lock:
+                    self.shared_tasks += 1
+                print(f"Reusing the output of task {task.name} from another crew")
+            
+            task_outputs.append(task.output)
+        
+        return task_outputs
+    
+    def _execute_task(self, task):
+        """
+        Execute one task with its context, recording a span for it
+        
+        Transient errors are retried under the configured retry policy, as
+        in BaseAgent.execute_task; a task that still fails fails every crew
+        waiting for its output.
+        
+        The task runs on the CrewAI agent it was created with, which
+        belongs to its crew's run alone (see BaseAgent.create_agent).
+        
+        Args:
+            task: CrewAI task
+        
+        Returns:
+            TaskOutput: The task's output (also set as task.output)
+        
+        Raises:
+            TaskExecutionError: If the task failed and won't be retried
+        """
+        agent = task.agent
+        context = aggregate_raw_outputs_from_tasks(task.context) if task.context else None
+        
+        policy = get_retry_policy()
+        started = time.monotonic()
+        attempt = 0
+        
+        with span("task", task.name or "task", agent=agent.role) as task_span:
+            while True:
+                attempt += 1
+                tokens_before = get_agent_token_usage(agent)
+                try:
+                    # Each LLM request takes the shared chat rate limiter itself
+                    return task.execute_sync(agent=agent, context=context)
+                except Exception as e:
+                    category = classify_error(e)
+                    delay = policy.next_delay(e, attempt, started)
+                    if delay is None:
+                        task_span.error = str(e)
+                        raise TaskExecutionError(
+                            f"Task {task.name or 'task'} failed with {agent.role} agent after {attempt} attempt(s): {str(e)}",
+                            task_name=task.name,
+                            agent_role=agent.role,
+                            category=category,
+                            attempts=attempt
+                        ) from e
+                    
+                    print(f"Error in task {task.name} ({category}), retrying in {delay:.1f}s: {str(e)}")
+                    task_span.record_retry()
+                finally:
+                    record_agent_tokens(task_span, agent, tokens_before)
+                
+                time.sleep(delay)
+
+@contextmanager
+def task_graph_scope(graph):
+    """
+    Execute crew runs inside the block through a shared task graph
+    
+    Args:
+        graph: SharedTaskGraph
+    
+    Yields:
+        SharedTaskGraph: The graph
+    """
+    token = _task_graph.set(graph)
+    try:
+        yield graph
+    finally:
+        _task_graph.reset(token)
+
+def get_task_graph():
+    """
+    Get the task graph active in this context
+    
+    Returns:
+        SharedTaskGraph: Active graph, or None
+    """
+    return _task_graph.get()
\ No newline at end of file
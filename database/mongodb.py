@@ -1,10 +1,64 @@
 # database/mongodb.py
+import os
+import threading
+import time
 from pymongo import MongoClient
 from utils.config import get_mongodb_uri
+from utils.instrumentation import instrumented
+
+# Shared client - MongoClient maintains its own connection pool and is thread-safe
+_mongodb_client = None
+_mongodb_client_lock = threading.Lock()
+
+# Mock client used after a failed connection, until the next connection attempt is due
+_mock_client = None
+_mock_client_until = 0.0
 
 def get_mongodb_client():
     """
-    Get a MongoDB client instance with robust error handling for cloud connections
+    Get the shared MongoDB client, connecting on first use
+    
+    When connecting fails, the mock client is shared too, and connecting is
+    only tried again after MONGODB_RETRY_SECONDS (default 30), so callers
+    don't each wait out the server selection timeout while MongoDB is down.
+    
+    Returns:
+        MongoClient: MongoDB client (or a mock client while MongoDB is unavailable)
+    """
+    global _mongodb_client, _mock_client, _mock_client_until
+    
+    if _mongodb_client is not None:
+        return _mongodb_client
+    if _mock_client is not None and time.monotonic() < _mock_client_until:
+        return _mock_client
+    
+    with _mongodb_client_lock:
+        if _mongodb_client is not None:
+            return _mongodb_client
+        if _mock_client is not None and time.monotonic() < _mock_client_until:
+            return _mock_client
+        
+        client = create_mongodb_client()
+        if isinstance(client, MongoClient):
+            _mongodb_client = client
+            _mock_client = None
+        else:
+            _mock_client = client
+            _mock_client_until = time.monotonic() + float(os.getenv("MONGODB_RETRY_SECONDS", "30"))
+        return client
+
+def is_mongodb_available():
+    """
+    Check whether MongoDB is connected rather than replaced by the mock client
+    
+    Returns:
+        bool: True if the shared client is a real connection
+    """
+    return isinstance(get_mongodb_client(), MongoClient)
+
+def create_mongodb_client():
+    """
+    Create a MongoDB client instance with robust error handling for cloud connections
     
     Returns:
         MongoClient: MongoDB client
@@ -48,6 +102,10 @@ def get_mongodb_client():
                 class MockResult:
                     inserted_id = "mock_id_12345"
                 return MockResult()
+            def update_one(self, *args, **kwargs):
+                class MockResult:
+                    modified_count = 0
+                return MockResult()
         
         return MockMongoClient()
 
@@ -62,6 +120,7 @@ def get_podcast_collection():
     db = client["podcast_analytics"]
     return db["summaries"]
 
+@instrumented("mongodb")
 def store_podcast_data(podcast_data):
     """
     Store Meeting data in MongoDB
@@ -76,12 +135,14 @@ def store_podcast_data(podcast_data):
     result = collection.insert_one(podcast_data)
     return str(result.inserted_id)
 
-def get_podcast_by_id(podcast_id):
+@instrumented("mongodb")
+def get_podcast_by_id(podcast_id, projection=None):
     """
     Retrieve Meeting data by ID
     
     Args:
         podcast_id: ID of the Meeting document
+        projection: Optional list of fields to return
         
     Returns:
         dict: Meeting data or None if not found
@@ -93,45 +154,48 @@ def get_podcast_by_id(podcast_id):
         
         # Check if podcast_id is a valid ObjectId
         if ObjectId.is_valid(podcast_id):
-            return collection.find_one({"_id": ObjectId(podcast_id)})
+            return collection.find_one({"_id": ObjectId(podcast_id)}, projection)
         else:
             # If not a valid ObjectId, try to find by title
-            return collection.find_one({"title": podcast_id})
+            return collection.find_one({"title": podcast_id}, projection)
     except Exception as e:
         print(f"Error retrieving podcast by ID: {e}")
         return None
 
-def get_podcast_by_title(title):
+@instrumented("mongodb")
+def get_podcast_by_title(title, projection=None):
     """
     Retrieve Meeting data by title
     
     Args:
         title: Title of the Meeting
+        projection: Optional list of fields to return
         
     Returns:
         dict: Meeting data or None if not found
     """
     try:
         collection = get_podcast_collection()
-        result = collection.find_one({"title": title})
+        result = collection.find_one({"title": title}, projection)
         
         # If no exact match, try case-insensitive search
         if not result:
             import re
             regex = re.compile(f"^{re.escape(title)}$", re.IGNORECASE)
-            result = collection.find_one({"title": {"$regex": regex}})
+            result = collection.find_one({"title": {"$regex": regex}}, projection)
             
         # If still no match, try partial match
         if not result:
             import re
             regex = re.compile(f".*{re.escape(title)}.*", re.IGNORECASE)
-            result = collection.find_one({"title": {"$regex": regex}})
+            result = collection.find_one({"title": {"$regex": regex}}, projection)
             
         return result
     except Exception as e:
         print(f"Error retrieving Meeting by title: {e}")
         return None
 
+@instrumented("mongodb")
 def get_all_podcasts():
     """
     Retrieve all Meeting data
@@ -146,6 +210,7 @@ def get_all_podcasts():
         print(f"Error retrieving all Meetings: {e}")
         return []
 
+@instrumented("mongodb")
 def get_all_podcast_titles():
     """
     Retrieve all Meeting titles
@@ -169,6 +234,7 @@ def get_all_podcast_titles():
         # Return mock data for testing
         return ["Sample Meeting 1", "Sample Meeting 2", "Sample Meeting 3"]
 
+@instrumented("mongodb")
 def update_podcast_data(podcast_id, update_data):
     """
     Update Meeting data
@@ -190,6 +256,7 @@ def update_podcast_data(podcast_id, update_data):
     
     return result.modified_count > 0
 
+@instrumented("mongodb")
 def delete_podcast(podcast_id):
     """
     Delete a Meeting document
@@ -205,4 +272,229 @@ def delete_podcast(podcast_id):
     collection = get_podcast_collection()
     result = collection.delete_one({"_id": ObjectId(podcast_id)})
     
-    return result.deleted_count > 0
\ No newline at end of file
+    return result.deleted_count > 0
+
+def get_jobs_collection():
+    """
+    Get the MongoDB collection for analysis jobs
+    
+    Jobs are kept in MongoDB rather than in process memory so that any
+    API instance behind a load balancer can report a job's status.
+    
+    Returns:
+        Collection: MongoDB collection
+    """
+    client = get_mongodb_client()
+    db = client["podcast_analytics"]
+    return db["analysis_jobs"]
+
+@instrumented("mongodb")
+def create_analysis_job(job_data):
+    """
+    Store a new analysis job
+    
+    Args:
+        job_data: Dictionary with the job fields, including "job_id"
+        
+    Returns:
+        str: ID of the job, or None if it couldn't be stored
+    """
+    try:
+        collection = get_jobs_collection()
+        collection.insert_one(dict(job_data))
+        return job_data["job_id"]
+    except Exception as e:
+        print(f"Error creating analysis job {job_data.get('job_id')}: {e}")
+        return None
+
+@instrumented("mongodb")
+def update_analysis_job(job_id, update_data):
+    """
+    Update an analysis job
+    
+    Args:
+        job_id: ID of the job
+        update_data: Dictionary containing fields to update
+        
+    Returns:
+        bool: True if update was successful
+    """
+    try:
+        collection = get_jobs_collection()
+        result = collection.update_one({"job_id": job_id}, {"$set": update_data})
+        return result.modified_count > 0
+    except Exception as e:
+        print(f"Error updating analysis job {job_id}: {e}")
+        return False
+
+@instrumented("mongodb")
+def get_analysis_job(job_id):
+    """
+    Retrieve an analysis job
+    
+    Args:
+        job_id: ID of the job
+        
+    Returns:
+        dict: Job data or None if not found
+    """
+    try:
+        collection = get_jobs_collection()
+        return collection.find_one({"job_id": job_id}, {"_id": 0})
+    except Exception as e:
+        print(f"Error retrieving analysis job {job_id}: {e}")
+        return None
+
+def get_crew_runs_collection():
+    """
+    Get the MongoDB collection for crew run checkpoints
+    
+    Returns:
+        Collection: MongoDB collection
+    """
+    client = get_mongodb_client()
+    db = client["podcast_analytics"]
+    return db["crew_runs"]
+
+@instrumented("mongodb")
+def update_crew_run(run_id, update_data):
+    """
+    Update a crew run record, creating it if needed
+    
+    Args:
+        run_id: ID of the run
+        update_data: Dictionary containing fields to set (dotted keys set nested fields)
+    """
+    collection = get_crew_runs_collection()
+    collection.update_one({"run_id": run_id}, {"$set": update_data}, upsert=True)
+
+@instrumented("mongodb")
+def get_crew_run(run_id):
+    """
+    Retrieve a crew run record with its checkpoints
+    
+    Args:
+        run_id: ID of the run
+        
+    Returns:
+        dict: Run record or None if not found
+    """
+    collection = get_crew_runs_collection()
+    return collection.find_one({"run_id": run_id}, {"_id": 0})
+
+@instrumented("mongodb")
+def delete_crew_run(run_id):
+    """
+    Delete a crew run record and its checkpoints
+    
+    Args:
+        run_id: ID of the run
+    """
+    collection = get_crew_runs_collection()
+    collection.delete_one({"run_id": run_id})
+
+@instrumented("mongodb")
+def delete_crew_runs_before(cutoff):
+    """
+    Delete the crew run records last updated before a time
+    
+    Args:
+        cutoff: ISO timestamp; runs with an older updated_at are deleted
+        
+    Returns:
+        int: Number of runs deleted
+    """
+    collection = get_crew_runs_collection()
+    return collection.delete_many({"updated_at": {"$lt": cutoff}}).deleted_count
+
+@instrumented("mongodb")
+def list_crew_runs():
+    """
+    List crew run records, without their transcripts and checkpoints
+    
+    Returns:
+        list: Run records
+    """
+    collection = get_crew_runs_collection()
+    return list(collection.find({}, {"_id": 0, "transcript": 0, "checkpoints": 0}))
+
+def get_translation_memory_collection():
+    """
+    Get the MongoDB collection for the translation memory
+    
+    Returns:
+        Collection: MongoDB collection
+    """
+    client = get_mongodb_client()
+    db = client["podcast_analytics"]
+    return db["translation_memory"]
+
+@instrumented("mongodb")
+def get_translation_memory_entries(keys):
+    """
+    Retrieve translation memory entries by key
+    
+    Args:
+        keys: Entry keys
+        
+    Returns:
+        dict: Key -> translation for the keys found
+    """
+    collection = get_translation_memory_collection()
+    results = collection.find({"_id": {"$in": list(keys)}}, {"translation": 1})
+    return {doc["_id"]: doc["translation"] for doc in results}
+
+@instrumented("mongodb")
+def store_translation_memory_entries(entries):
+    """
+    Store translation memory entries, replacing existing ones with the same key
+    
+    Args:
+        entries: Documents with _id (the key), segment, translation, languages and model
+    """
+    from pymongo import ReplaceOne
+    
+    if not entries:
+        return
+    
+    collection = get_translation_memory_collection()
+    collection.bulk_write([ReplaceOne({"_id": entry["_id"]}, entry, upsert=True) for entry in entries])
+
+def get_artifacts_collection():
+    """
+    Get the MongoDB collection for shared intermediate artifacts
+    
+    Returns:
+        Collection: MongoDB collection
+    """
+    client = get_mongodb_client()
+    db = client["podcast_analytics"]
+    return db["artifacts"]
+
+@instrumented("mongodb")
+def get_artifact(kind, key):
+    """
+    Retrieve an artifact record
+    
+    Args:
+        kind: Artifact kind
+        key: Artifact key
+        
+    Returns:
+        dict: Artifact record or None if not found
+    """
+    collection = get_artifacts_collection()
+    return collection.find_one({"_id": f"{kind}:{key}"}, {"_id": 0})
+
+@instrumented("mongodb")
+def store_artifact(kind, key, record):
+    """
+    Store an artifact record, replacing any with the same kind and key
+    
+    Args:
+        kind: Artifact kind
+        key: Artifact key
+        record: Dictionary containing the artifact value and metadata
+    """
+    collection = get_artifacts_collection()
+    collection.replace_one({"_id": f"{kind}:{key}"}, dict(record, kind=kind, key=key), upsert=True)
\ No newline at end of file
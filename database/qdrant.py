@@ -1,20 +1,32 @@
 # database/qdrant.py
+import threading
 from qdrant_client import QdrantClient
 from qdrant_client.http import models
 from utils.config import get_qdrant_api_key, get_qdrant_uri
 from api.openai import generate_embeddings
+from utils.instrumentation import span
+
+# Shared client so HTTP connections are reused across requests
+_qdrant_client = None
+_qdrant_client_lock = threading.Lock()
 
 def get_qdrant_client():
     """
-    Get a Qdrant client instance
+    Get the shared Qdrant client instance
     
     Returns:
         QdrantClient: Qdrant client
     """
-    uri = get_qdrant_uri()
-    api_key = get_qdrant_api_key()
+    global _qdrant_client
+    
+    if _qdrant_client is None:
+        with _qdrant_client_lock:
+            if _qdrant_client is None:
+                uri = get_qdrant_uri()
+                api_key = get_qdrant_api_key()
+                _qdrant_client = QdrantClient(url=uri, api_key=api_key)
     
-    return QdrantClient(url=uri, api_key=api_key)
+    return _qdrant_client
 
 def create_collection_if_not_exists(collection_name="podcast_vectors", vector_size=1536):
     """
@@ -27,18 +39,20 @@ def create_collection_if_not_exists(collection_name="podcast_vectors", vector_si
     client = get_qdrant_client()
     
     # Check if collection exists
-    collections = client.get_collections()
+    with span("qdrant", "get_collections"):
+        collections = client.get_collections()
     collection_names = [c.name for c in collections.collections]
     
     if collection_name not in collection_names:
         # Create the collection
-        client.create_collection(
-            collection_name=collection_name,
-            vectors_config=models.VectorParams(
-                size=vector_size,
-                distance=models.Distance.COSINE
+        with span("qdrant", "create_collection"):
+            client.create_collection(
+                collection_name=collection_name,
+                vectors_config=models.VectorParams(
+                    size=vector_size,
+                    distance=models.Distance.COSINE
+                )
             )
-        )
         print(f"Created collection: {collection_name}")
     else:
         print(f"Collection {collection_name} already exists")
@@ -71,16 +85,17 @@ def store_vectors(podcast_data, document_id):
         
         # Store in Qdrant
         client = get_qdrant_client()
-        client.upsert(
-            collection_name="podcast_vectors",
-            points=[
-                models.PointStruct(
-                    id=point_id,  # Use a numeric ID
-                    vector=embedding,
-                    payload=cleaned_data  # Use cleaned data
-                )
-            ]
-        )
+        with span("qdrant", "upsert"):
+            client.upsert(
+                collection_name="podcast_vectors",
+                points=[
+                    models.PointStruct(
+                        id=point_id,  # Use a numeric ID
+                        vector=embedding,
+                        payload=cleaned_data  # Use cleaned data
+                    )
+                ]
+            )
         
         return True
     except Exception as e:
@@ -151,11 +166,12 @@ def search_similar_content(query_text, limit=3):
         
         # Search Qdrant
         client = get_qdrant_client()
-        search_results = client.search(
-            collection_name="podcast_vectors",
-            query_vector=query_embedding,
-            limit=limit
-        )
+        with span("qdrant", "search", limit=limit):
+            search_results = client.search(
+                collection_name="podcast_vectors",
+                query_vector=query_embedding,
+                limit=limit
+            )
         
         return search_results
     except Exception as e:
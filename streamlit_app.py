@@ -8,20 +8,33 @@ import base64
 
 # Import custom modules
 from utils.config import load_environment
-from crews import get_crew, list_available_crews
+from crews import list_available_crews
 from api.assemblyai import transcribe_podcast
-from api.composio import send_email_summary
-from database.mongodb import store_podcast_data, get_all_podcast_titles, get_podcast_by_title
-from database.qdrant import store_vectors
+from database.mongodb import get_all_podcast_titles, get_podcast_by_title
 from app.chatbot import generate_answer
+from app.pipeline import analyze_transcript, build_crew
+from utils.instrumentation import start_run, span
+from utils.tracing import setup_tracing
+from utils.metrics import setup_metrics
 from api.tts import text_to_speech
 
 # Load environment variables
 load_environment()
+setup_tracing()
+setup_metrics()
+
+def report_progress(level, message):
+    """Show pipeline progress messages in the Streamlit UI"""
+    if level == "success":
+        st.success(message)
+    elif level == "error":
+        st.error(message)
+    else:
+        st.info(message)
 
 def main():
     st.title("Meeting Analyzer & Chatbot")
-
+    
     # Add app version and sidebar config
     st.sidebar.title("Configuration")
     st.sidebar.caption("Version 2.0 - Enhanced Agent Architecture")
@@ -100,11 +113,13 @@ def main():
                 audio_path = tmp_file.name
             
             try:
-                with st.spinner("Analyzing Meeting..."):
+                # One run report and trace cover transcription and analysis
+                with st.spinner("Analyzing Meeting..."), start_run(podcast_title), span("pipeline", "analyze_meeting", crew_type=selected_crew_type):
                     # Use AssemblyAI for transcription
                     st.info("Transcribing Meeting...")
                     try:
-                        transcript = transcribe_podcast(audio_path)
+                        with span("stage", "transcription"):
+                            transcript = transcribe_podcast(audio_path)
                         st.success("Transcription complete!")
                     except Exception as e:
                         st.error(f"Transcription error: {str(e)}")
@@ -115,59 +130,29 @@ def main():
                     st.info(f"Running {crew_type} crew analysis with {selected_model}...")
                     
                     # Create crew with options
-                    crew_kwargs = {"model": selected_model}
-                    
-                    # Add language options for multilingual crews
-                    if "Multilingual" in crew_type or "Localization" in crew_type:
-                        crew_kwargs["target_languages"] = target_languages
-                    
-                    podcast_crew = get_crew(selected_crew_type, **crew_kwargs)
-                    
-                    # Run the analysis
-                    result_json = podcast_crew.run_analysis(transcript)
-                    analysis_result = json.loads(result_json)
+                    podcast_crew = build_crew(
+                        selected_crew_type,
+                        model=selected_model,
+                        target_languages=target_languages if ("Multilingual" in crew_type or "Localization" in crew_type) else None
+                    )
                     
-                    # Prepare data for storage
-                    podcast_data = {
-                        "title": podcast_title,
-                        "date_analyzed": datetime.now().isoformat(),
-                        "transcript": transcript,
-                        "summary": analysis_result.get("summary", "Summary not available"),
-                        "key_topics": analysis_result.get("key_topics", ["Topic information not available"]),
-                        "sentiment": analysis_result.get("sentiment_analysis", "Sentiment analysis not available"),
-                        "action_items": analysis_result.get("action_items", ["Action items not available"])
-                    }
+                    recipient_list = [email.strip() for email in board_emails.split("\n") if email.strip()] if board_emails else []
                     
-                    # Add translations if available
-                    if "translations" in analysis_result:
-                        podcast_data["translations"] = analysis_result["translations"]
-                    
-                    # Store in MongoDB
-                    st.info("Storing results in database...")
-                    try:
-                        summary_id = store_podcast_data(podcast_data)
-                        st.success("Data stored successfully!")
-                    except Exception as e:
-                        st.error(f"Error storing data: {str(e)}")
-                        summary_id = "mock_id_12345"
-                    
-                    # Store in Qdrant for vector search
-                    st.info("Storing vectors for semantic search...")
-                    try:
-                        store_vectors(podcast_data, summary_id)
-                        st.success("Vectors stored successfully!")
-                    except Exception as e:
-                        st.error(f"Error storing vectors: {str(e)}")
+                    # Run the analysis, store the results and email board members
+                    outcome = analyze_transcript(
+                        podcast_title,
+                        transcript,
+                        recipients=recipient_list,
+                        crew=podcast_crew,
+                        progress=report_progress
+                    )
+                    analysis_result = outcome["analysis_result"]
                     
-                    # Send email to board members
-                    if board_emails:
-                        recipient_list = [email.strip() for email in board_emails.split("\n") if email.strip()]
-                        st.info(f"Sending summary email to {len(recipient_list)} recipients...")
-                        try:
-                            send_email_summary(podcast_data, recipient_list)
-                            st.success("Email sent successfully!")
-                        except Exception as e:
-                            st.error(f"Error sending email: {str(e)}")
+                    # A failed run isn't stored; its completed tasks are kept for resuming
+                    if analysis_result.get("error"):
+                        st.error(f"{analysis_result.get('message')} Resume it with: python -m app.resume {outcome['run_id']}")
+                        os.unlink(audio_path)
+                        return
                     
                     # Display results
                     st.success("Meeting analysis complete!")
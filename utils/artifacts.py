@@ -0,0 +1,203 @@
+# utils/artifacts.py
+"""
+Persisted intermediate artifacts shared across crews and runs
+
+Work that every crew repeats on the same input, such as refining a raw
+transcript, is stored under its kind and a key derived from everything the
+result depends on, so the next crew or run on the same input reuses it.
+
+Artifacts are kept in local JSON files (ARTIFACT_STORE=local, the default,
+under ARTIFACT_DIR) or in MongoDB (ARTIFACT_STORE=mongodb). Inside an
+artifact_scope they are also kept in memory, so crews run together share
+them even when they aren't persisted.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from utils.config import get_artifact_store_type, get_artifact_dir
+
+# Kinds and keys become directory and file names in the local store
+NAME_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+# In-memory artifacts of the current composite run, set by artifact_scope()
+_scoped_artifacts = ContextVar("scoped_artifacts", default=None)
+
+class LocalArtifactStore:
+    """Artifacts in one JSON file each, in a directory per kind"""
+    
+    def __init__(self, directory):
+        """
+        Initialize the store
+        
+        Args:
+            directory: Directory for the artifact files
+        """
+        self.directory = directory
+    
+    def _path(self, kind, key):
+        """Get the file for an artifact, rejecting names that aren't plain file names"""
+        if not NAME_PATTERN.match(kind) or not NAME_PATTERN.match(key):
+            raise ValueError(f"Invalid artifact name: {kind}/{key}")
+        return os.path.join(self.directory, kind, f"{key}.json")
+    
+    def get(self, kind, key):
+        """Get an artifact record, or None"""
+        path = self._path(kind, key)
+        if not os.path.exists(path):
+            return None
+        
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def put(self, kind, key, record):
+        """Store an artifact record, replacing any with the same key"""
+        path = self._path(kind, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        
+        # Write to a uniquely named temporary file first, so concurrent writers
+        # and crashes never leave a truncated record
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(record, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+class MongoArtifactStore:
+    """Artifacts in MongoDB, one document per artifact"""
+    
+    def get(self, kind, key):
+        """Get an artifact record, or None"""
+        from database.mongodb import get_artifact
+        return get_artifact(kind, key)
+    
+    def put(self, kind, key, record):
+        """Store an artifact record, replacing any with the same key"""
+        from database.mongodb import store_artifact
+        store_artifact(kind, key, record)
+
+def get_artifact_store():
+    """
+    Get the configured artifact store
+    
+    Returns:
+        LocalArtifactStore/MongoArtifactStore: Store, or None if artifacts aren't persisted
+    """
+    store_type = get_artifact_store_type()
+    if store_type is None:
+        return None
+    
+    with _stores_lock:
+        if store_type not in _stores:
+            if store_type == "local":
+                _stores[store_type] = LocalArtifactStore(get_artifact_dir())
+            elif store_type == "mongodb":
+                _stores[store_type] = MongoArtifactStore()
+            else:
+                raise ValueError(f"Unknown artifact store: {store_type}")
+        return _stores[store_type]
+
+def artifact_key(*parts):
+    """
+    Derive an artifact key from everything the artifact depends on
+    
+    Args:
+        parts: Input text, versions, model names, ...
+    
+    Returns:
+        str: Key
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part or "").encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def load_artifact(kind, key):
+    """
+    Get a stored artifact's value
+    
+    Lookup errors are reported and treated as a miss, since the artifact
+    can always be recomputed.
+    
+    Args:
+        kind: Artifact kind, e.g. "refined_transcript"
+        key: Key from artifact_key()
+    
+    Returns:
+        Value, or None if there is none
+    """
+    scoped = _scoped_artifacts.get()
+    if scoped is not None and (kind, key) in scoped:
+        return scoped[(kind, key)]
+    
+    store = get_artifact_store()
+    if store is None:
+        return None
+    
+    try:
+        record = store.get(kind, key)
+    except Exception as e:
+        print(f"Error loading {kind} artifact: {e}")
+        return None
+    
+    return record.get("value") if record else None
+
+def save_artifact(kind, key, value, **metadata):
+    """
+    Store an artifact
+    
+    Args:
+        kind: Artifact kind, e.g. "refined_transcript"
+        key: Key from artifact_key()
+        value: JSON-serializable value
+        metadata: What the artifact was derived from (input hash, versions, ...)
+    """
+    scoped = _scoped_artifacts.get()
+    if scoped is not None:
+        scoped[(kind, key)] = value
+    
+    store = get_artifact_store()
+    if store is None:
+        return
+    
+    try:
+        store.put(kind, key, dict(metadata, value=value, created_at=datetime.now().isoformat()))
+    except Exception as e:
+        print(f"Error saving {kind} artifact: {e}")
+
+def remember_artifact(kind, key, value):
+    """
+    Keep an artifact for the rest of the active artifact scope, without persisting it
+    
+    For results that are good enough to share within a run but shouldn't
+    be reused by later runs.
+    
+    Args:
+        kind: Artifact kind, e.g. "refined_transcript"
+        key: Key from artifact_key()
+        value: Value
+    """
+    scoped = _scoped_artifacts.get()
+    if scoped is not None:
+        scoped[(kind, key)] = value
+
+@contextmanager
+def artifact_scope():
+    """
+    Keep the artifacts loaded and saved inside the block in memory as well
+    
+    Yields:
+        dict: (kind, key) -> value of the artifacts saved in the block
+    """
+    token = _scoped_artifacts.set({})
+    try:
+        yield _scoped_artifacts.get()
+    finally:
+        _scoped_artifacts.reset(token)
@@ -0,0 +1,398 @@
+# utils/checkpoints.py
+"""
+Per-task checkpoints for resumable crew runs
+
+While an analysis run executes, each completed task's output is saved under
+the run's ID and the task's input hash. The input hash covers the task and
+every task before it, since those produce the context the task sees. When a
+run with the same ID is started again (see app.pipeline.resume_analysis),
+the leading tasks whose input hash has a checkpoint are restored instead of
+executed, so a failure late in a long crew costs only the failed task and
+the ones after it.
+
+Steps a crew runs directly before its tasks, like transcript refinement,
+are checkpointed the same way under a hash of their own inputs (see
+hash_step). Their outputs go into the task descriptions, so restoring them
+is what keeps the task hashes of a resumed run equal to the failed run's.
+
+Checkpoints are kept in local JSON files (CHECKPOINT_STORE=local, the
+default, under CHECKPOINT_DIR) or in MongoDB (CHECKPOINT_STORE=mongodb),
+together with the run's inputs so it can be resumed by ID alone. A run's
+record is deleted once it completes; the records of runs that failed and
+were never resumed (or were abandoned mid-run) hold the full transcript, so
+they are deleted once they are older than CHECKPOINT_TTL_HOURS.
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from utils.config import get_checkpoint_store_type, get_checkpoint_dir, get_checkpoint_ttl_hours
+
+# Run IDs become file names in the local store
+RUN_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]+$')
+
+# Seconds between sweeps for expired runs in one process
+EXPIRY_INTERVAL_SECONDS = 3600
+
+_stores = {}
+_stores_lock = threading.Lock()
+_last_expiry = None
+
+class LocalCheckpointStore:
+    """Crew run records in one JSON file per run"""
+    
+    def __init__(self, directory):
+        """
+        Initialize the store
+        
+        Args:
+            directory: Directory for the run files
+        """
+        self.directory = directory
+        self.lock = threading.Lock()
+    
+    def _path(self, run_id):
+        """Get the file for a run, rejecting IDs that aren't plain file names"""
+        if not RUN_ID_PATTERN.match(run_id):
+            raise ValueError(f"Invalid run ID: {run_id}")
+        return os.path.join(self.directory, f"{run_id}.json")
+    
+    def _read(self, run_id):
+        """Read a run file, or None if there is none"""
+        path = self._path(run_id)
+        if not os.path.exists(path):
+            return None
+        
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    
+    def _write(self, run_id, run):
+        """Write a run file"""
+        if not os.path.exists(self.directory):
+            os.makedirs(self.directory, exist_ok=True)
+        
+        # Write to a temporary file first so a crash never leaves a truncated record
+        path = self._path(run_id)
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(run, f)
+        os.replace(temp_path, path)
+    
+    def get_run(self, run_id):
+        """Get a run record with its checkpoints, or None"""
+        with self.lock:
+            return self._read(run_id)
+    
+    def update_run(self, run_id, update_data):
+        """Set fields of a run record, creating it if needed"""
+        with self.lock:
+            run = self._read(run_id) or {"run_id": run_id, "checkpoints": {}}
+            run.update(update_data)
+            self._write(run_id, run)
+    
+    def save_checkpoint(self, run_id, input_hash, checkpoint):
+        """Save a task checkpoint under the run"""
+        with self.lock:
+            run = self._read(run_id) or {"run_id": run_id, "checkpoints": {}}
+            run.setdefault("checkpoints", {})[input_hash] = checkpoint
+            self._write(run_id, run)
+    
+    def delete_run(self, run_id):
+        """Delete a run record and its checkpoints"""
+        with self.lock:
+            path = self._path(run_id)
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def list_runs(self):
+        """List run records, without their transcripts and checkpoints"""
+        runs = []
+        if not os.path.isdir(self.directory):
+            return runs
+        
+        for file_name in sorted(os.listdir(self.directory)):
+            if file_name.endswith(".json"):
+                run = self.get_run(file_name[:-5])
+                if run:
+                    runs.append({key: value for key, value in run.items() if key not in ("transcript", "checkpoints")})
+        
+        return runs
+    
+    def delete_runs_before(self, cutoff):
+        """Delete the run records last written before a time, returning how many were deleted"""
+        deleted = 0
+        if not os.path.isdir(self.directory):
+            return deleted
+        
+        with self.lock:
+            for file_name in os.listdir(self.directory):
+                path = os.path.join(self.directory, file_name)
+                if file_name.endswith(".json") and os.path.getmtime(path) < cutoff.timestamp():
+                    os.remove(path)
+                    deleted += 1
+        
+        return deleted
+
+class MongoCheckpointStore:
+    """Crew run records in MongoDB, one document per run"""
+    
+    def get_run(self, run_id):
+        """Get a run record with its checkpoints, or None"""
+        from database.mongodb import get_crew_run
+        return get_crew_run(run_id)
+    
+    def update_run(self, run_id, update_data):
+        """Set fields of a run record, creating it if needed"""
+        from database.mongodb import update_crew_run
+        update_crew_run(run_id, update_data)
+    
+    def save_checkpoint(self, run_id, input_hash, checkpoint):
+        """Save a task checkpoint under the run"""
+        from database.mongodb import update_crew_run
+        update_crew_run(run_id, {f"checkpoints.{input_hash}": checkpoint})
+    
+    def delete_run(self, run_id):
+        """Delete a run record and its checkpoints"""
+        from database.mongodb import delete_crew_run
+        delete_crew_run(run_id)
+    
+    def list_runs(self):
+        """List run records, without their transcripts and checkpoints"""
+        from database.mongodb import list_crew_runs
+        return list_crew_runs()
+    
+    def delete_runs_before(self, cutoff):
+        """Delete the run records last updated before a time, returning how many were deleted"""
+        from database.mongodb import delete_crew_runs_before
+        return delete_crew_runs_before(cutoff.isoformat())
+
+def get_checkpoint_store():
+    """
+    Get the configured checkpoint store
+    
+    Returns:
+        LocalCheckpointStore/MongoCheckpointStore: Store, or None if checkpointing is off
+    """
+    store_type = get_checkpoint_store_type()
+    if store_type is None:
+        return None
+    
+    with _stores_lock:
+        if store_type not in _stores:
+            if store_type == "local":
+                _stores[store_type] = LocalCheckpointStore(get_checkpoint_dir())
+            elif store_type == "mongodb":
+                _stores[store_type] = MongoCheckpointStore()
+            else:
+                raise ValueError(f"Unknown checkpoint store: {store_type}")
+        return _stores[store_type]
+
+def hash_tasks(tasks):
+    """
+    Compute the input hash of each task in a crew
+    
+    Args:
+        tasks: CrewAI tasks in execution order
+    
+    Returns:
+        list: Input hash per task, each covering the task and all tasks before it
+    """
+    hashes = []
+    previous_hash = ""
+    
+    for task in tasks:
+        llm = getattr(task.agent, "llm", None)
+        digest = hashlib.sha256()
+        for part in (previous_hash, task.name, task.description, task.expected_output,
+                     getattr(task.agent, "role", None), getattr(llm, "model", None)):
+            digest.update(str(part or "").encode("utf-8"))
+            digest.update(b"\0")
+        
+        previous_hash = digest.hexdigest()
+        hashes.append(previous_hash)
+    
+    return hashes
+
+def hash_step(name, *inputs):
+    """
+    Compute the input hash of a step a crew runs outside its tasks
+    
+    Args:
+        name: Step name, e.g. "transcript_refinement"
+        inputs: Everything the step's output depends on (model, input text, ...)
+    
+    Returns:
+        str: Input hash
+    """
+    digest = hashlib.sha256()
+    for part in (name,) + inputs:
+        digest.update(str(part or "").encode("utf-8"))
+        digest.update(b"\0")
+    return f"{name}:{digest.hexdigest()}"
+
+def checkpoint_from_output(task_output):
+    """
+    Convert a task output to a checkpoint
+    
+    Args:
+        task_output: CrewAI TaskOutput
+    
+    Returns:
+        dict: JSON-serializable checkpoint
+    """
+    return {
+        "name": task_output.name,
+        "agent": task_output.agent,
+        "raw": task_output.raw,
+        "pydantic": task_output.pydantic.model_dump() if task_output.pydantic is not None else None,
+        "json_dict": task_output.json_dict,
+        "completed_at": datetime.now().isoformat()
+    }
+
+def output_from_checkpoint(task, checkpoint):
+    """
+    Restore a task output from a checkpoint
+    
+    Args:
+        task: CrewAI task the checkpoint was saved for
+        checkpoint: Checkpoint from checkpoint_from_output()
+    
+    Returns:
+        TaskOutput: Task output
+    """
+    from crewai.tasks.output_format import OutputFormat
+    from crewai.tasks.task_output import TaskOutput
+    
+    pydantic = None
+    if checkpoint.get("pydantic") is not None and task.output_pydantic is not None:
+        pydantic = task.output_pydantic.model_validate(checkpoint["pydantic"])
+    
+    if pydantic is not None:
+        output_format = OutputFormat.PYDANTIC
+    elif checkpoint.get("json_dict") is not None:
+        output_format = OutputFormat.JSON
+    else:
+        output_format = OutputFormat.RAW
+    
+    return TaskOutput(
+        name=task.name,
+        description=task.description,
+        expected_output=task.expected_output,
+        agent=checkpoint.get("agent") or "",
+        raw=checkpoint.get("raw", ""),
+        pydantic=pydantic,
+        json_dict=checkpoint.get("json_dict"),
+        output_format=output_format
+    )
+
+def start_checkpointed_run(run_id, inputs):
+    """
+    Record the start (or restart) of a run with the inputs needed to resume it
+    
+    Args:
+        run_id: ID of the run
+        inputs: Run inputs (title, transcript, crew_type, model, ...)
+    """
+    store = get_checkpoint_store()
+    if store is None:
+        return
+    
+    expire_checkpointed_runs()
+    
+    try:
+        now = datetime.now().isoformat()
+        run = store.get_run(run_id)
+        update_data = dict(inputs, status="running", updated_at=now)
+        if run is None:
+            update_data["created_at"] = now
+        store.update_run(run_id, update_data)
+    except Exception as e:
+        print(f"Error recording run {run_id} for checkpointing: {e}")
+
+def finish_checkpointed_run(run_id, error=None):
+    """
+    Record the end of a run
+    
+    A completed run's record and checkpoints are deleted; a failed run keeps
+    them so it can be resumed.
+    
+    Args:
+        run_id: ID of the run
+        error: Error message if the run failed
+    """
+    store = get_checkpoint_store()
+    if store is None:
+        return
+    
+    try:
+        if error:
+            store.update_run(run_id, {"status": "failed", "error": error, "updated_at": datetime.now().isoformat()})
+        else:
+            store.delete_run(run_id)
+    except Exception as e:
+        print(f"Error recording the end of run {run_id}: {e}")
+
+def expire_checkpointed_runs(force=False):
+    """
+    Delete the records of runs not updated within CHECKPOINT_TTL_HOURS
+    
+    Runs once per EXPIRY_INTERVAL_SECONDS in a process unless forced.
+    
+    Args:
+        force: Sweep even if the last sweep was recent
+    
+    Returns:
+        int: Number of runs deleted
+    """
+    global _last_expiry
+    
+    store = get_checkpoint_store()
+    if store is None:
+        return 0
+    
+    with _stores_lock:
+        if not force and _last_expiry is not None and time.monotonic() - _last_expiry < EXPIRY_INTERVAL_SECONDS:
+            return 0
+        _last_expiry = time.monotonic()
+    
+    try:
+        deleted = store.delete_runs_before(datetime.now() - timedelta(hours=get_checkpoint_ttl_hours()))
+    except Exception as e:
+        print(f"Error deleting expired checkpointed runs: {e}")
+        return 0
+    
+    if deleted:
+        print(f"Deleted {deleted} checkpointed runs older than {get_checkpoint_ttl_hours():g} hours")
+    return deleted
+
+def get_resumable_run(run_id):
+    """
+    Get the record of a run that can be resumed
+    
+    Args:
+        run_id: ID of the run
+    
+    Returns:
+        dict: Run record with its inputs and checkpoints, or None if there is none
+    """
+    store = get_checkpoint_store()
+    if store is None:
+        return None
+    
+    return store.get_run(run_id)
+
+def list_resumable_runs():
+    """
+    List the runs that have not completed
+    
+    Returns:
+        list: Run records without transcripts and checkpoints
+    """
+    store = get_checkpoint_store()
+    if store is None:
+        return []
+    
+    return store.list_runs()
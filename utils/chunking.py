@@ -0,0 +1,216 @@
+# utils/chunking.py
+"""
+Content-defined transcript chunking for incremental re-analysis
+
+A transcript is split into segments (lines, and sentences within long
+lines), and a chunk ends after a segment whose hash hits a boundary once the
+chunk has reached a minimum size. Since boundaries depend only on the
+segments themselves, not on their position, fixing a speaker name or
+appending to a transcript changes only the chunks around the edit; the
+others keep their content and hash, so their refined text can be reused.
+
+While a ChunkCache is active (see chunk_cache_scope), the transcriber
+refines transcripts chunk by chunk and takes unchanged chunks from the
+cache instead of the LLM. The analysis tasks cut their input at the task
+input budget, so only the leading chunks that fit in it are refined (see
+count_reachable_chunks); the rest would never reach a prompt.
+"""
+import hashlib
+import re
+from contextlib import contextmanager
+from contextvars import ContextVar
+from utils.tokens import count_tokens
+
+# Chunk sizes in characters, each well within one refinement prompt
+MIN_CHUNK_CHARS = 1500
+MAX_CHUNK_CHARS = 4500
+
+# Once a chunk has MIN_CHUNK_CHARS, about one segment in this many ends it
+BOUNDARY_DIVISOR = 8
+
+# Lines longer than this are split into sentences
+MAX_SEGMENT_CHARS = 1000
+
+SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?])\s+')
+
+# Chunk cache active in the current thread/task, set by chunk_cache_scope()
+_chunk_cache = ContextVar("chunk_cache", default=None)
+
+class ChunkCache:
+    """Refined transcript chunks by chunk hash and model"""
+    
+    def __init__(self, records=None):
+        """
+        Initialize the cache
+        
+        Args:
+            records: Optional chunk records from to_records() of an earlier run
+        """
+        self.entries = {}
+        self.used = {}
+        
+        for record in records or []:
+            if record.get("hash") and record.get("refined"):
+                self.entries[(record["hash"], record.get("model"))] = record["refined"]
+    
+    def get(self, chunk_hash, model):
+        """
+        Get a chunk's refined text
+        
+        Args:
+            chunk_hash: Hash of the raw chunk from hash_chunk()
+            model: Model the chunk is refined with
+        
+        Returns:
+            str: Refined text, or None if the chunk isn't cached
+        """
+        refined = self.entries.get((chunk_hash, model))
+        if refined is not None:
+            self.used[(chunk_hash, model)] = refined
+        return refined
+    
+    def put(self, chunk_hash, model, refined):
+        """Store a chunk's refined text"""
+        self.entries[(chunk_hash, model)] = refined
+        self.used[(chunk_hash, model)] = refined
+    
+    def count_changed(self, chunks):
+        """
+        Count the chunks that have no refined text for any model
+        
+        Args:
+            chunks: Raw chunks from chunk_transcript()
+        
+        Returns:
+            int: Number of new or changed chunks
+        """
+        known_hashes = {chunk_hash for chunk_hash, _ in self.entries}
+        return sum(1 for chunk in chunks if hash_chunk(chunk) not in known_hashes)
+    
+    def to_records(self):
+        """
+        Get the chunks used in this run for storing with the Meeting
+        
+        Returns:
+            list: Chunk records with hash, model and refined text
+        """
+        return [
+            {"hash": chunk_hash, "model": model, "refined": refined}
+            for (chunk_hash, model), refined in self.used.items()
+        ]
+
+def split_segments(text):
+    """
+    Split text into segments at line ends, and at sentence ends within long lines
+    
+    Args:
+        text: Text to split
+    
+    Returns:
+        list: Segments; joined together they give back the text
+    """
+    segments = []
+    
+    for line in text.splitlines(keepends=True):
+        if len(line) <= MAX_SEGMENT_CHARS:
+            segments.append(line)
+            continue
+        
+        start = 0
+        for match in SENTENCE_END_PATTERN.finditer(line):
+            segments.append(line[start:match.end()])
+            start = match.end()
+        if start < len(line):
+            segments.append(line[start:])
+    
+    # Text without sentence ends still has to fit in a chunk
+    return [
+        segment[offset:offset + MAX_CHUNK_CHARS]
+        for segment in segments
+        for offset in range(0, len(segment), MAX_CHUNK_CHARS)
+    ]
+
+def _is_boundary(segment):
+    """Check whether a chunk may end after a segment, based on its content alone"""
+    digest = hashlib.sha1(segment.strip().encode("utf-8")).hexdigest()
+    return int(digest[:8], 16) % BOUNDARY_DIVISOR == 0
+
+def chunk_transcript(text):
+    """
+    Split a transcript into content-defined chunks
+    
+    Args:
+        text: Transcript text
+    
+    Returns:
+        list: Chunks of at most MAX_CHUNK_CHARS; joined together they give back the text
+    """
+    chunks = []
+    current = []
+    size = 0
+    
+    for segment in split_segments(text):
+        if current and size + len(segment) > MAX_CHUNK_CHARS:
+            chunks.append("".join(current))
+            current, size = [], 0
+        
+        current.append(segment)
+        size += len(segment)
+        
+        if size >= MIN_CHUNK_CHARS and _is_boundary(segment):
+            chunks.append("".join(current))
+            current, size = [], 0
+    
+    if current:
+        chunks.append("".join(current))
+    
+    return chunks
+
+def count_reachable_chunks(chunks, max_tokens, model=None):
+    """
+    Count the leading chunks that start within a token budget
+    
+    Args:
+        chunks: Chunks from chunk_transcript()
+        max_tokens: Tokens of the transcript a prompt can take
+        model: Model whose encoding to count with
+    
+    Returns:
+        int: Number of leading chunks that at least partly fit
+    """
+    used = 0
+    for index, chunk in enumerate(chunks):
+        if used >= max_tokens:
+            return index
+        used += count_tokens(chunk, model)
+    return len(chunks)
+
+def hash_chunk(chunk):
+    """Hash a raw chunk"""
+    return hashlib.sha256(chunk.encode("utf-8")).hexdigest()
+
+@contextmanager
+def chunk_cache_scope(cache):
+    """
+    Refine transcripts chunk by chunk with the given cache inside the block
+    
+    Args:
+        cache: ChunkCache, or None to refine transcripts in one pass
+    
+    Yields:
+        ChunkCache: The cache
+    """
+    token = _chunk_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _chunk_cache.reset(token)
+
+def get_chunk_cache():
+    """
+    Get the chunk cache active in this context
+    
+    Returns:
+        ChunkCache: Active cache, or None
+    """
+    return _chunk_cache.get()
@@ -0,0 +1,32 @@
+# utils/concurrency.py
+"""
+Thread fan-out for independent LLM calls
+
+Each call runs in a copy of the caller's context, so the model scope, run
+report, current span and other context variables set around the fan-out
+apply inside it just as they would to a sequential call.
+"""
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from utils.config import get_fanout_max_workers
+
+def map_concurrently(func, items, max_workers=None):
+    """
+    Call a function on each item concurrently
+    
+    Args:
+        func: Function taking one item
+        items: Items to call it on
+        max_workers: Maximum calls at once (defaults to FANOUT_MAX_WORKERS)
+    
+    Returns:
+        list: Results in the order of the items; the first exception raised is re-raised
+    """
+    items = list(items)
+    if len(items) <= 1:
+        return [func(item) for item in items]
+    
+    max_workers = min(len(items), max_workers or get_fanout_max_workers())
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fanout") as executor:
+        futures = [executor.submit(contextvars.copy_context().run, func, item) for item in items]
+        return [future.result() for future in futures]
\ No newline at end of file
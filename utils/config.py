@@ -66,4 +66,177 @@ def get_qdrant_uri():
 
 def get_qdrant_api_key():
     """Get Qdrant API key from environment"""
-    return os.getenv("QDRANT_API_KEY")
\ No newline at end of file
+    return os.getenv("QDRANT_API_KEY")
+
+def get_model_routing_policy_path():
+    """Get the model routing policy file path (YAML or JSON) from environment"""
+    default_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "agents", "model_routing.yaml")
+    return os.getenv("MODEL_ROUTING_POLICY", default_path)
+
+def is_model_routing_enabled():
+    """Check whether per-task model routing is enabled (off unless MODEL_ROUTING=on)"""
+    return os.getenv("MODEL_ROUTING", "off").lower() in ("on", "true", "1")
+
+# Default client-side budgets per API, kept a little under OpenAI's tier-1 quotas
+DEFAULT_RATE_LIMITS = {
+    "openai_chat": {"requests_per_minute": 500, "tokens_per_minute": 30000, "max_concurrency": 16},
+    "openai_embeddings": {"requests_per_minute": 3000, "tokens_per_minute": 1000000, "max_concurrency": 32},
+    "openai_tts": {"requests_per_minute": 50, "tokens_per_minute": None, "max_concurrency": 4}
+}
+
+def get_rate_limit_config(name):
+    """
+    Get the client-side rate limit budget for an API from environment
+    
+    Reads <NAME>_RPM, <NAME>_TPM, <NAME>_CONCURRENCY and <NAME>_LATENCY_TARGET,
+    e.g. OPENAI_CHAT_TPM=450000 for an organization on a higher usage tier.
+    A value of 0 disables that budget.
+    
+    Args:
+        name: Budget name, e.g. "openai_chat"
+        
+    Returns:
+        dict: Keyword arguments for RateLimiter
+    """
+    config = dict(DEFAULT_RATE_LIMITS.get(name, {"requests_per_minute": None, "tokens_per_minute": None, "max_concurrency": 16}))
+    prefix = name.upper()
+    
+    for key, suffix in (("requests_per_minute", "RPM"), ("tokens_per_minute", "TPM"), ("max_concurrency", "CONCURRENCY")):
+        value = os.getenv(f"{prefix}_{suffix}")
+        if value:
+            config[key] = int(value) or None
+    
+    latency_target = os.getenv(f"{prefix}_LATENCY_TARGET")
+    config["latency_target"] = float(latency_target) if latency_target else None
+    config["max_concurrency"] = config["max_concurrency"] or 1
+    
+    return config
+
+def get_tracing_exporter():
+    """Get the OpenTelemetry span exporter (console, file or otlp) from environment, or None if tracing is off"""
+    exporter = os.getenv("TRACING_EXPORTER", "").strip().lower()
+    return exporter if exporter and exporter not in ("off", "none", "false", "0") else None
+
+def get_tracing_file_path():
+    """Get the file the file span exporter appends OTLP JSON lines to"""
+    return os.getenv("TRACING_FILE", os.path.join("debug_output", "traces.jsonl"))
+
+def is_metrics_enabled():
+    """Check whether Prometheus metrics are enabled (off unless METRICS_ENABLED=on)"""
+    return os.getenv("METRICS_ENABLED", "off").lower() in ("on", "true", "1")
+
+def get_metrics_port():
+    """Get the port for the local /metrics endpoint (0 serves metrics only through the API server)"""
+    return int(os.getenv("METRICS_PORT", "9464"))
+
+def get_metrics_host():
+    """Get the address the local /metrics endpoint binds to"""
+    return os.getenv("METRICS_HOST", "127.0.0.1")
+
+def is_structured_output_enabled():
+    """Check whether tasks with an output schema request structured JSON output (off unless STRUCTURED_OUTPUT=on)"""
+    return os.getenv("STRUCTURED_OUTPUT", "off").lower() in ("on", "true", "1")
+
+def get_debug_output_dir():
+    """Get the directory raw crew results are saved to for debugging"""
+    return os.getenv("DEBUG_OUTPUT_DIR", "debug_output")
+
+def get_checkpoint_store_type():
+    """Get where crew task checkpoints are kept (local or mongodb) from environment, or None if checkpointing is off"""
+    store = os.getenv("CHECKPOINT_STORE", "local").strip().lower()
+    return None if store in ("", "off", "none", "false", "0") else store
+
+def get_checkpoint_dir():
+    """Get the directory local crew task checkpoints are kept in"""
+    return os.getenv("CHECKPOINT_DIR", os.path.join(get_debug_output_dir(), "checkpoints"))
+
+def get_checkpoint_ttl_hours():
+    """Get how long a failed or abandoned run's checkpoints are kept for resuming (CHECKPOINT_TTL_HOURS, default a week)"""
+    return max(0.0, float(os.getenv("CHECKPOINT_TTL_HOURS", "168")))
+
+def is_incremental_analysis_enabled():
+    """Check whether re-analyses refine transcripts chunk by chunk, reusing unchanged chunks (off unless INCREMENTAL_ANALYSIS=on)"""
+    return os.getenv("INCREMENTAL_ANALYSIS", "off").lower() in ("on", "true", "1")
+
+def get_fanout_max_workers():
+    """Get the maximum number of independent tasks a crew runs at once (e.g. one per translation language)"""
+    return max(1, int(os.getenv("FANOUT_MAX_WORKERS", "8")))
+
+def get_translation_memory_type():
+    """Get where the translation memory is kept (local or mongodb) from environment, or None if it is off"""
+    store = os.getenv("TRANSLATION_MEMORY", "local").strip().lower()
+    return None if store in ("", "off", "none", "false", "0") else store
+
+def get_translation_memory_dir():
+    """Get the directory the local translation memory is kept in"""
+    return os.getenv("TRANSLATION_MEMORY_DIR", os.path.join(get_debug_output_dir(), "translation_memory"))
+
+def get_artifact_store_type():
+    """Get where shared intermediate artifacts such as refined transcripts are kept (local or mongodb), or None if they aren't"""
+    store = os.getenv("ARTIFACT_STORE", "local").strip().lower()
+    return None if store in ("", "off", "none", "false", "0") else store
+
+def get_artifact_dir():
+    """Get the directory local artifacts are kept in"""
+    return os.getenv("ARTIFACT_DIR", os.path.join(get_debug_output_dir(), "artifacts"))
+
+def get_retry_config():
+    """
+    Get the retry policy for agent task execution from environment
+    
+    Reads TASK_RETRY_ATTEMPTS (attempts per task, including the first),
+    TASK_RETRY_BASE_DELAY and TASK_RETRY_MAX_DELAY (backoff bounds in
+    seconds) and TASK_DEADLINE (seconds a task may take over all its
+    attempts; 0 for no deadline).
+    
+    Returns:
+        dict: Keyword arguments for RetryPolicy
+    """
+    deadline = float(os.getenv("TASK_DEADLINE", "300"))
+    return {
+        "max_attempts": max(1, int(os.getenv("TASK_RETRY_ATTEMPTS", "3"))),
+        "base_delay": float(os.getenv("TASK_RETRY_BASE_DELAY", "1.0")),
+        "max_delay": float(os.getenv("TASK_RETRY_MAX_DELAY", "30.0")),
+        "deadline": deadline or None
+    }
+
+def is_single_flight_enabled():
+    """Check whether concurrent identical LLM and API calls are collapsed into one (on unless SINGLE_FLIGHT=off)"""
+    return os.getenv("SINGLE_FLIGHT", "on").lower() not in ("off", "false", "0")
+
+def get_prompt_compression_config(task_type=None):
+    """
+    Get the transcript compression options for a task type from environment
+    
+    PROMPT_COMPRESSION (off unless on) turns compression on or off, and
+    PROMPT_COMPRESSION_SPEAKER_LABELS and PROMPT_COMPRESSION_TIMESTAMPS (off
+    unless on) add speaker label abbreviation and timestamp removal.
+    PROMPT_COMPRESSION_<TASK_TYPE> (e.g.
+    PROMPT_COMPRESSION_TRANSCRIPT_REFINEMENT=on) turns compression on or off
+    for one of the task types that take the raw transcript.
+    
+    Args:
+        task_type: Optional task type
+    
+    Returns:
+        dict: "enabled" plus keyword arguments for compress_transcript
+    """
+    def flag(name, default):
+        return os.getenv(name, default).lower() in ("on", "true", "1")
+    
+    enabled = flag("PROMPT_COMPRESSION", "off")
+    if task_type:
+        enabled = flag(f"PROMPT_COMPRESSION_{task_type.upper()}", "on" if enabled else "off")
+    
+    return {
+        "enabled": enabled,
+        "disfluencies": True,
+        "repetitions": True,
+        "speaker_labels": flag("PROMPT_COMPRESSION_SPEAKER_LABELS", "off"),
+        "timestamps": flag("PROMPT_COMPRESSION_TIMESTAMPS", "off")
+    }
+
+def get_task_input_token_budget():
+    """Get the cap on a task's input tokens (TASK_INPUT_TOKENS), or None to let the input fill the model's context window"""
+    value = os.getenv("TASK_INPUT_TOKENS")
+    return max(1, int(value)) if value else None
@@ -0,0 +1,503 @@
+# utils/instrumentation.py
+"""
+Token and latency accounting for analysis runs
+
+Code that calls an external service wraps the call in span(), which records
+wall time, time spent queued behind the rate limiter, prompt and completion
+tokens, retries and cache hits. Spans are collected into the RunReport that
+is active for the current context (see start_run), giving a per-agent,
+per-task and per-crew breakdown of where a run's time and tokens went.
+"""
+import functools
+import itertools
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+
+_current_report = ContextVar("run_report", default=None)
+_current_span = ContextVar("span", default=None)
+_span_ids = itertools.count(1)
+
+# Objects with on_start(span) and on_end(span) methods, e.g. the tracer
+_span_observers = []
+
+class Span:
+    """Measurements for one instrumented operation"""
+    
+    def __init__(self, kind, name, attributes=None, parent=None):
+        """
+        Initialize a span
+        
+        Args:
+            kind: Kind of operation, e.g. "crew", "task", "agent", "openai", "tts" or "assemblyai"
+            name: Name of the operation (crew class, task name, model, ...)
+            attributes: Optional dict of extra attributes
+            parent: Enclosing span, if any
+        """
+        self.span_id = next(_span_ids)
+        self.parent = parent
+        self.parent_id = parent.span_id if parent else None
+        self.kind = kind
+        self.name = name
+        self.attributes = dict(attributes or {})
+        self.started_at = datetime.now().isoformat()
+        self.start = time.perf_counter()
+        self.wall_time = None
+        self.queue_time = 0.0
+        self.model = None
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.retries = 0
+        self.cache_hits = 0
+        self.error = None
+        self.report = None
+        self.active = False
+    
+    def record_tokens(self, prompt_tokens=0, completion_tokens=0, model=None):
+        """
+        Record tokens used by the operation
+        
+        Args:
+            prompt_tokens: Prompt tokens used
+            completion_tokens: Completion tokens used
+            model: Model that used them
+        """
+        self.prompt_tokens += prompt_tokens or 0
+        self.completion_tokens += completion_tokens or 0
+        if model:
+            self.model = model
+    
+    def record_queue_time(self, seconds):
+        """Record time spent waiting for rate limit budget"""
+        self.queue_time += seconds
+    
+    def record_retry(self, count=1):
+        """Record a retried attempt"""
+        self.retries += count
+    
+    def record_cache_hit(self, count=1):
+        """Record a result served from a cache instead of an API call"""
+        self.cache_hits += count
+    
+    def set_attribute(self, key, value):
+        """Set an extra attribute on the span"""
+        self.attributes[key] = value
+    
+    def finish(self, error=None):
+        """
+        Close the span
+        
+        Args:
+            error: Exception that ended the operation, if any
+        """
+        self.wall_time = time.perf_counter() - self.start
+        if error is not None:
+            self.error = str(error)
+    
+    def to_dict(self):
+        """
+        Convert the span to a JSON-serializable dict
+        
+        Returns:
+            dict: Span measurements
+        """
+        return {
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "kind": self.kind,
+            "name": self.name,
+            "started_at": self.started_at,
+            "wall_time": round(self.wall_time or 0.0, 4),
+            "queue_time": round(self.queue_time, 4),
+            "model": self.model,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "retries": self.retries,
+            "cache_hits": self.cache_hits,
+            "error": self.error,
+            "attributes": self.attributes
+        }
+
+class RunReport:
+    """Collects the spans of one analysis run"""
+    
+    def __init__(self, name):
+        """
+        Initialize a run report
+        
+        Args:
+            name: Name of the run (usually the Meeting title)
+        """
+        self.name = name
+        self.started_at = datetime.now().isoformat()
+        self.start = time.perf_counter()
+        self.wall_time = None
+        self.spans = []
+        self.lock = threading.Lock()
+    
+    def add(self, span):
+        """Add a finished span to the report"""
+        with self.lock:
+            self.spans.append(span)
+    
+    def finish(self):
+        """Record the run's total wall time"""
+        self.wall_time = time.perf_counter() - self.start
+    
+    def to_dict(self):
+        """
+        Build the structured run report
+        
+        Token counts are only recorded on the span that measured them, so
+        the totals can be summed over all spans without double counting.
+        
+        Returns:
+            dict: Totals, per-model, per-kind, per-agent and per-task
+                  breakdowns, and the individual spans
+        """
+        with self.lock:
+            spans = list(self.spans)
+        
+        wall_time = self.wall_time if self.wall_time is not None else time.perf_counter() - self.start
+        
+        totals = _empty_totals()
+        by_model = {}
+        by_kind = {}
+        by_agent = {}
+        by_task = {}
+        
+        for span in spans:
+            _accumulate(totals, span)
+            _accumulate(by_kind.setdefault(span.kind, _empty_totals()), span)
+            if span.model:
+                _accumulate(by_model.setdefault(span.model, _empty_totals()), span)
+            if span.attributes.get("agent"):
+                _accumulate(by_agent.setdefault(span.attributes["agent"], _empty_totals()), span)
+            if span.kind == "task":
+                _accumulate(by_task.setdefault(span.name, _empty_totals()), span)
+        
+        # Span wall times overlap, so the run's own wall time is the real total
+        totals["wall_time"] = round(wall_time, 4)
+        
+        return {
+            "name": self.name,
+            "started_at": self.started_at,
+            "wall_time": round(wall_time, 4),
+            "totals": totals,
+            "by_model": by_model,
+            "by_kind": by_kind,
+            "by_agent": by_agent,
+            "by_task": by_task,
+            "spans": [span.to_dict() for span in spans]
+        }
+
+def _empty_totals():
+    """Create an empty totals dict"""
+    return {
+        "calls": 0,
+        "wall_time": 0.0,
+        "queue_time": 0.0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "total_tokens": 0,
+        "retries": 0,
+        "cache_hits": 0,
+        "errors": 0
+    }
+
+def _accumulate(totals, span):
+    """Add a span's measurements to a totals dict"""
+    totals["calls"] += 1
+    totals["wall_time"] = round(totals["wall_time"] + (span.wall_time or 0.0), 4)
+    totals["queue_time"] = round(totals["queue_time"] + span.queue_time, 4)
+    totals["prompt_tokens"] += span.prompt_tokens
+    totals["completion_tokens"] += span.completion_tokens
+    totals["total_tokens"] += span.prompt_tokens + span.completion_tokens
+    totals["retries"] += span.retries
+    totals["cache_hits"] += span.cache_hits
+    if span.error:
+        totals["errors"] += 1
+
+@contextmanager
+def start_run(name):
+    """
+    Collect spans into a run report for the duration of the block
+    
+    If a run is already active in this context (e.g. the API job wraps
+    transcription and analysis), its report is reused.
+    
+    Args:
+        name: Name of the run
+    
+    Yields:
+        RunReport: Report collecting the run's spans
+    """
+    report = _current_report.get()
+    if report is not None:
+        yield report
+        return
+    
+    report = RunReport(name)
+    token = _current_report.set(report)
+    try:
+        yield report
+    finally:
+        report.finish()
+        _current_report.reset(token)
+
+def add_span_observer(observer):
+    """
+    Register an observer notified when any span starts or ends
+    
+    Args:
+        observer: Object with on_start(span) and on_end(span) methods
+    """
+    if observer not in _span_observers:
+        _span_observers.append(observer)
+
+def _notify(event, started):
+    """Call an observer method for a span, never letting observers break the caller"""
+    for observer in list(_span_observers):
+        try:
+            getattr(observer, event)(started)
+        except Exception as e:
+            print(f"Error in span observer: {str(e)}")
+
+def _start_span(kind, name, attributes, parent, report, active=False):
+    """Create a span and notify observers that it started"""
+    started = Span(kind, name, attributes, parent=parent)
+    started.report = report
+    started.active = active
+    _notify("on_start", started)
+    return started
+
+def open_span(kind, name, **attributes):
+    """
+    Start a span without making it the active span
+    
+    Used for operations whose start and end are observed in different
+    places, such as crew tasks measured through task callbacks.
+    
+    Args:
+        kind: Kind of operation, e.g. "openai" or "task"
+        name: Name of the operation
+        **attributes: Extra attributes recorded on the span
+        
+    Returns:
+        Span: Started span, to be passed to close_span
+    """
+    return _start_span(kind, name, attributes, _current_span.get(), _current_report.get())
+
+def close_span(started, error=None):
+    """
+    Finish a span and add it to the run report that was active when it started
+    
+    Args:
+        started: Span returned by open_span
+        error: Exception that ended the operation, if any
+    """
+    started.finish(error)
+    _notify("on_end", started)
+    
+    if started.report is not None:
+        started.report.add(started)
+
+@contextmanager
+def span(kind, name, **attributes):
+    """
+    Measure an operation
+    
+    Args:
+        kind: Kind of operation, e.g. "openai" or "task"
+        name: Name of the operation
+        **attributes: Extra attributes recorded on the span
+        
+    Yields:
+        Span: Span to record tokens, retries and cache hits on
+    """
+    current = _start_span(kind, name, attributes, _current_span.get(), _current_report.get(), active=True)
+    token = _current_span.set(current)
+    error = None
+    try:
+        yield current
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        _current_span.reset(token)
+        close_span(current, error)
+
+def instrumented(kind, name=None):
+    """
+    Decorator recording a span around every call of a function
+    
+    Args:
+        kind: Kind of operation, e.g. "mongodb"
+        name: Operation name (defaults to the function name)
+        
+    Returns:
+        function: Decorator
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(kind, name or func.__name__):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def current_span():
+    """Get the innermost active span, or None"""
+    return _current_span.get()
+
+def current_report():
+    """Get the active run report, or None"""
+    return _current_report.get()
+
+def record_queue_time(seconds):
+    """Record rate limiter wait time on the active span, if any"""
+    active = _current_span.get()
+    if active is not None and seconds:
+        active.record_queue_time(seconds)
+
+def record_cache_hit(count=1):
+    """Record a cache hit on the active span, if any"""
+    active = _current_span.get()
+    if active is not None:
+        active.record_cache_hit(count)
+
+def get_agent_token_usage(crewai_agent):
+    """
+    Get the cumulative token usage of a CrewAI agent
+    
+    Each run builds its own CrewAI agents, but one agent may still run
+    several tasks of a crew (and retries of a task), and its usage adds up
+    over all of them, so callers take the difference between two readings
+    to get the usage of one operation.
+    
+    Args:
+        crewai_agent: CrewAI Agent instance
+    
+    Returns:
+        tuple: (prompt_tokens, completion_tokens)
+    """
+    token_process = getattr(crewai_agent, "_token_process", None)
+    if token_process is None:
+        return 0, 0
+    
+    summary = token_process.get_summary()
+    return summary.prompt_tokens, summary.completion_tokens
+
+def record_agent_tokens(active, crewai_agent, tokens_before):
+    """
+    Record the tokens a CrewAI agent used since an earlier reading
+    
+    Args:
+        active: Span to record the tokens on
+        crewai_agent: CrewAI Agent instance
+        tokens_before: Reading from get_agent_token_usage taken before the operation
+        
+    Returns:
+        tuple: The new (prompt_tokens, completion_tokens) reading
+    """
+    tokens_after = get_agent_token_usage(crewai_agent)
+    model = getattr(getattr(crewai_agent, "llm", None), "model", None)
+    active.record_tokens(
+        tokens_after[0] - tokens_before[0],
+        tokens_after[1] - tokens_before[1],
+        model=model
+    )
+    return tokens_after
+
+class TaskTracker:
+    """
+    Records a span per task while a CrewAI crew runs
+    
+    CrewAI runs sequential tasks one after another and calls each task's
+    callback when it finishes, so a task's span runs from the previous
+    task's completion to its own, and its tokens are the growth in its
+    agent's token usage over that time (the crew's agents belong to this
+    run, but an agent can run several of its tasks). Tokens used outside
+    any task (e.g. by delegated agents) are recorded on the enclosing span.
+    """
+    
+    def __init__(self, tasks, agents):
+        """
+        Initialize the tracker
+        
+        Args:
+            tasks: CrewAI tasks in execution order
+            agents: CrewAI agents in the crew
+        """
+        self.tasks = list(tasks)
+        self.agents = {id(agent): agent for agent in agents}
+        for task in self.tasks:
+            if task.agent is not None:
+                self.agents[id(task.agent)] = task.agent
+        self.readings = {}
+        self.original_callbacks = []
+        self.enclosing_span = None
+        self.report = None
+        self.task_span = None
+    
+    def __enter__(self):
+        self.enclosing_span = _current_span.get()
+        self.report = _current_report.get()
+        self.readings = {key: get_agent_token_usage(agent) for key, agent in self.agents.items()}
+        self.original_callbacks = [task.callback for task in self.tasks]
+        
+        for index, task in enumerate(self.tasks):
+            task.callback = self._make_callback(index, task.callback)
+        
+        if self.tasks:
+            self._open_task_span(0)
+        return self
+    
+    def __exit__(self, exc_type, exc, traceback):
+        if self.task_span is not None:
+            self._close_task_span(self.tasks[self.task_span.attributes["index"]], exc)
+        
+        for task, callback in zip(self.tasks, self.original_callbacks):
+            task.callback = callback
+        
+        # Attribute anything the task spans didn't see to the enclosing span
+        if self.enclosing_span is not None:
+            for key, agent in self.agents.items():
+                self.readings[key] = record_agent_tokens(self.enclosing_span, agent, self.readings[key])
+        return False
+    
+    def _open_task_span(self, index):
+        """Start the span for the task at index"""
+        task = self.tasks[index]
+        self.task_span = _start_span(
+            "task",
+            task.name or f"task_{index + 1}",
+            {"agent": getattr(task.agent, "role", None), "index": index},
+            self.enclosing_span,
+            self.report
+        )
+    
+    def _close_task_span(self, task, error=None):
+        """Finish the current task span, attributing its agent's token growth"""
+        if task.agent is not None:
+            key = id(task.agent)
+            self.readings[key] = record_agent_tokens(self.task_span, task.agent, self.readings[key])
+        close_span(self.task_span, error)
+        self.task_span = None
+    
+    def _make_callback(self, index, original):
+        """Wrap a task callback to close this task's span and open the next one"""
+        def callback(output):
+            if self.task_span is not None:
+                self.task_span.set_attribute("output_chars", len(getattr(output, "raw", "") or ""))
+                self._close_task_span(self.tasks[index])
+            
+            if index + 1 < len(self.tasks):
+                self._open_task_span(index + 1)
+            
+            if original:
+                return original(output)
+        
+        return callback
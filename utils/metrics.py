@@ -0,0 +1,246 @@
+# utils/metrics.py
+"""
+Prometheus metrics for pipeline throughput, latency and error rates
+
+Metrics are opt-in: set METRICS_ENABLED=on and install prometheus_client.
+When enabled, a span observer turns instrumentation spans into latency and
+token metrics, and the metrics are served on a local /metrics endpoint
+(METRICS_PORT, bound to METRICS_HOST) and by the API server's /metrics route.
+
+When metrics are disabled no observer is registered and the record_*
+functions return immediately, so the pipeline pays nothing for them.
+"""
+import threading
+from utils.config import is_metrics_enabled, get_metrics_port, get_metrics_host
+from utils.instrumentation import add_span_observer, record_cache_hit
+
+# Latency buckets in seconds, from a fast cache hit to a long crew run
+STAGE_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+OPERATION_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+# Span kinds reported as database operations and as external API calls
+DATABASE_KINDS = ("mongodb", "qdrant")
+API_KINDS = ("openai", "tts", "assemblyai", "composio", "agent")
+
+_metrics = None
+_metrics_lock = threading.Lock()
+
+class PipelineMetrics:
+    """Prometheus collectors for the pipeline"""
+    
+    def __init__(self, registry):
+        """
+        Create the collectors
+        
+        Args:
+            registry: prometheus_client CollectorRegistry to register them in
+        """
+        from prometheus_client import Counter, Histogram
+        
+        self.registry = registry
+        self.analyses = Counter(
+            "meeting_analyses_total",
+            "Crew analyses by crew type and outcome (started, completed, failed)",
+            ["crew_type", "outcome"],
+            registry=registry
+        )
+        self.stage_latency = Histogram(
+            "meeting_stage_duration_seconds",
+            "Latency of pipeline stages, crews and crew tasks",
+            ["kind", "stage"],
+            buckets=STAGE_BUCKETS,
+            registry=registry
+        )
+        self.api_latency = Histogram(
+            "meeting_api_request_duration_seconds",
+            "Latency of external API calls",
+            ["service", "operation", "outcome"],
+            buckets=STAGE_BUCKETS,
+            registry=registry
+        )
+        self.database_latency = Histogram(
+            "meeting_database_operation_duration_seconds",
+            "Latency of MongoDB and Qdrant operations",
+            ["database", "operation", "outcome"],
+            buckets=OPERATION_BUCKETS,
+            registry=registry
+        )
+        self.llm_tokens = Counter(
+            "meeting_llm_tokens_total",
+            "LLM tokens used by model and direction (prompt, completion)",
+            ["model", "direction"],
+            registry=registry
+        )
+        self.queue_time = Counter(
+            "meeting_rate_limit_wait_seconds_total",
+            "Time spent waiting for client-side rate limit budget",
+            ["service"],
+            registry=registry
+        )
+        self.retries = Counter(
+            "meeting_retries_total",
+            "Retried attempts by span kind",
+            ["kind"],
+            registry=registry
+        )
+        self.cache_lookups = Counter(
+            "meeting_cache_lookups_total",
+            "Cache lookups by cache (transcripts, llm, embeddings, tts, ...) and result (hit, miss)",
+            ["cache", "result"],
+            registry=registry
+        )
+        self.compressed_tokens = Counter(
+            "meeting_prompt_compression_tokens_total",
+            "Estimated prompt input tokens before compression (original) and removed by it (saved), by task type",
+            ["task_type", "kind"],
+            registry=registry
+        )
+        self.emails = Counter(
+            "meeting_email_sends_total",
+            "Summary emails by outcome (success, error)",
+            ["outcome"],
+            registry=registry
+        )
+
+class MetricsObserver:
+    """Records latency, token, queue time and retry metrics from finished spans"""
+    
+    def __init__(self, metrics):
+        self.metrics = metrics
+    
+    def on_start(self, started):
+        """Nothing is recorded until a span ends"""
+    
+    def on_end(self, finished):
+        """Record a finished span"""
+        metrics = self.metrics
+        wall_time = finished.wall_time or 0.0
+        outcome = "error" if finished.error else "success"
+        
+        if finished.kind in DATABASE_KINDS:
+            metrics.database_latency.labels(finished.kind, finished.name, outcome).observe(wall_time)
+        elif finished.kind in API_KINDS:
+            operation = finished.attributes.get("operation", finished.name)
+            metrics.api_latency.labels(finished.kind, operation, outcome).observe(wall_time)
+        else:
+            metrics.stage_latency.labels(finished.kind, finished.name).observe(wall_time)
+        
+        if finished.prompt_tokens or finished.completion_tokens:
+            model = finished.model or "unknown"
+            metrics.llm_tokens.labels(model, "prompt").inc(finished.prompt_tokens)
+            metrics.llm_tokens.labels(model, "completion").inc(finished.completion_tokens)
+        
+        if finished.queue_time:
+            metrics.queue_time.labels(finished.kind).inc(finished.queue_time)
+        
+        if finished.retries:
+            metrics.retries.labels(finished.kind).inc(finished.retries)
+
+def setup_metrics():
+    """
+    Enable metrics if METRICS_ENABLED is set and prometheus_client is installed
+    
+    Safe to call more than once; only the first call sets up metrics and
+    starts the local HTTP endpoint.
+    
+    Returns:
+        bool: True if metrics are enabled
+    """
+    global _metrics
+    
+    if not is_metrics_enabled():
+        return False
+    
+    with _metrics_lock:
+        if _metrics is not None:
+            return True
+        
+        try:
+            from prometheus_client import CollectorRegistry, start_http_server
+        except ImportError:
+            print("prometheus_client is not installed, metrics are disabled")
+            return False
+        
+        metrics = PipelineMetrics(CollectorRegistry())
+        add_span_observer(MetricsObserver(metrics))
+        
+        port = get_metrics_port()
+        if port:
+            try:
+                start_http_server(port, addr=get_metrics_host(), registry=metrics.registry)
+                print(f"Metrics available at http://{get_metrics_host()}:{port}/metrics")
+            except OSError as e:
+                # Another process (e.g. a second Streamlit session) already serves the port
+                print(f"Could not start metrics endpoint on port {port}: {str(e)}")
+        
+        _metrics = metrics
+        return True
+
+def is_enabled():
+    """Check whether metrics have been set up"""
+    return _metrics is not None
+
+def render_metrics():
+    """
+    Render the metrics in the Prometheus text format
+    
+    Returns:
+        tuple: (body bytes, content type), or None if metrics are disabled
+    """
+    if _metrics is None:
+        return None
+    
+    from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
+    return generate_latest(_metrics.registry), CONTENT_TYPE_LATEST
+
+def record_analysis(crew_type, outcome):
+    """
+    Count an analysis started, completed or failed
+    
+    Args:
+        crew_type: Crew class name
+        outcome: "started", "completed" or "failed"
+    """
+    if _metrics is None:
+        return
+    _metrics.analyses.labels(crew_type, outcome).inc()
+
+def record_email(outcome):
+    """
+    Count a summary email send
+    
+    Args:
+        outcome: "success" or "error"
+    """
+    if _metrics is None:
+        return
+    _metrics.emails.labels(outcome).inc()
+
+def record_cache_lookup(cache, hit):
+    """
+    Count a cache lookup, and record hits on the active span
+    
+    Args:
+        cache: Cache name, e.g. "transcripts", "llm", "embeddings" or "tts"
+        hit: True if the lookup was served from the cache
+    """
+    if hit:
+        record_cache_hit()
+    
+    if _metrics is None:
+        return
+    _metrics.cache_lookups.labels(cache, "hit" if hit else "miss").inc()
+
+def record_prompt_compression(task_type, original_tokens, tokens_saved):
+    """
+    Count the input tokens of a compressed task prompt and the tokens compression removed
+    
+    Args:
+        task_type: Task type, or None
+        original_tokens: Estimated tokens of the input before compression
+        tokens_saved: Estimated tokens removed
+    """
+    if _metrics is None:
+        return
+    _metrics.compressed_tokens.labels(task_type or "unknown", "original").inc(original_tokens)
+    _metrics.compressed_tokens.labels(task_type or "unknown", "saved").inc(tokens_saved)
@@ -0,0 +1,263 @@
+# utils/prompt_compression.py
+"""
+Deterministic compression of transcripts before they go into prompts
+
+Raw transcripts are full of fillers ("um", "uh"), stutters and repeated
+words that cost prompt tokens without carrying meaning. compress_transcript
+removes them with fixed rules, so the same transcript always compresses to
+the same text and prompts stay cacheable. The rules are conservative: only
+lowercase fillers are removed (so "UM" or "Ah," opening a sentence stay),
+and a word said twice is only collapsed in a stutter ("I, I think", "I I I
+think"), since "bye bye" or "Bora Bora" mean what they say. Optionally it
+also shortens speaker labels (with a legend, and only when that saves
+tokens) and drops timestamps; both are off by default because they change
+what the model can quote back.
+
+Compression is opt-in (see get_prompt_compression_config) and only applies
+to the raw transcript, i.e. the input of RAW_TRANSCRIPT_TASK_TYPES; other
+tasks' inputs (refined transcripts, analyses, translations) are only
+compressed when the task asks for it.
+"""
+import re
+from utils.config import get_prompt_compression_config
+from utils.rate_limiter import estimate_tokens
+
+# Task types whose input is the raw transcript
+RAW_TRANSCRIPT_TASK_TYPES = ("transcript_refinement",)
+
+# Standalone lowercase fillers, with the commas that set them off or the stop ending their sentence
+FILLER_PATTERN = re.compile(r"(?:(,)[ \t]*)?\b(?:u+h+m*|u+m+|e+r+m+|a+h+|h+m+)\b(?![.'-]\w)(,|[.!?](?!\w))?[ \t]*(\w?)")
+
+# Filler phrases set off by commas, e.g. "the budget, you know, is tight"
+FILLER_PHRASE_PATTERN = re.compile(r",[ \t]*(?:you know|I mean)[ \t]*,", re.IGNORECASE)
+
+# Filler phrases opening a sentence, e.g. "You know, the budget is tight"
+LEADING_FILLER_PHRASE_PATTERN = re.compile(r"(?:^|(?<=[.!?:][ \t]))(?:you know|I mean),[ \t]*(\w?)", re.IGNORECASE | re.MULTILINE)
+
+# Partial-word stutters, e.g. "w-we" or "th-the"
+STUTTER_PATTERN = re.compile(r"\b(\w{1,2})-(?=\1\w)", re.IGNORECASE)
+
+# A word or phrase of up to three words said more than once in a row
+# (single words are only collapsed in a stutter, see collapse_repetitions)
+REPETITION_PATTERN = re.compile(r"\b(\w+(?:[ \t]+\w+){0,2})(?:(?:,|-)?[ \t]+\1\b)+", re.IGNORECASE)
+
+# Words that are grammatical when doubled ("I know that that works")
+KEEP_DOUBLED = ("that", "had")
+
+# Timestamps in brackets, or opening a line
+TIMESTAMP_PATTERN = re.compile(
+    r"[\[(]\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?[\])][ \t]*|^[ \t]*\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?[ \t]+",
+    re.MULTILINE
+)
+
+# A speaker label opening a line, e.g. "Alice:", "Speaker B:" or "Dr. Jane Smith:"
+SPEAKER_LABEL_PATTERN = re.compile(r"^([A-Z][\w.'-]*(?: [A-Z0-9][\w.'-]*){0,3}):[ \t]", re.MULTILINE)
+
+# Punctuation left dangling by removed words
+SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(r"[ \t]+([,.!?;:])")
+DOUBLE_COMMA_PATTERN = re.compile(r",(?:[ \t]*,)+")
+LEADING_COMMA_PATTERN = re.compile(r"(^|[.!?:][ \t]|\n)[ \t]*,[ \t]*", re.MULTILINE)
+COMMA_BEFORE_STOP_PATTERN = re.compile(r",([.!?])")
+MULTIPLE_SPACES_PATTERN = re.compile(r"[ \t]{2,}")
+
+def _at_sentence_start(text, position):
+    """Check whether a position in the text starts a sentence"""
+    before = text[:position].rstrip(" \t")
+    return not before or before.endswith(("\n", ".", "!", "?", ":"))
+
+def remove_disfluencies(text):
+    """
+    Remove fillers and stutters, capitalizing a sentence that started with a filler
+    
+    Args:
+        text: Transcript text
+    
+    Returns:
+        str: Text without disfluencies
+    """
+    def drop_filler(match):
+        leading_comma, trailing, following = match.groups()
+        at_sentence_start = _at_sentence_start(match.string, match.start())
+        
+        # A filler ending a sentence: "ok. hmm. so" drops the whole sentence,
+        # "so, hmm. ok" keeps the stop
+        if trailing and trailing != ",":
+            if at_sentence_start and not leading_comma:
+                return following
+            return trailing + (" " + following if following else "")
+        
+        if following and at_sentence_start:
+            following = following.upper()
+        
+        # "to, uh, revisit" becomes "to revisit" but "yes, um fine" keeps its comma
+        if leading_comma:
+            return (" " if trailing else ", ") + following
+        return following
+    
+    text = STUTTER_PATTERN.sub("", text)
+    text = FILLER_PHRASE_PATTERN.sub(",", text)
+    text = LEADING_FILLER_PHRASE_PATTERN.sub(lambda match: match.group(1).upper(), text)
+    return FILLER_PATTERN.sub(drop_filler, text)
+
+def collapse_repetitions(text):
+    """
+    Collapse words and short phrases repeated back to back ("I I I think", "we need, we need")
+    
+    A single word said twice is only a stutter when a comma or hyphen
+    separates the two ("I, I think", "the- the"); otherwise it is kept,
+    as in "bye bye" or "Bora Bora". Three or more in a row always collapse.
+    
+    Args:
+        text: Transcript text
+    
+    Returns:
+        str: Text with each repetition said once
+    """
+    def collapse(match):
+        unit = match.group(1)
+        if unit.lower() in KEEP_DOUBLED or not any(char.isalpha() for char in unit):
+            return match.group(0)
+        
+        repeats = match.group(0)[len(unit):]
+        if len(unit.split()) == 1 and not any(mark in repeats for mark in ",-"):
+            if len(re.findall(rf"\b{re.escape(unit)}\b", repeats, re.IGNORECASE)) < 2:
+                return match.group(0)
+        return unit
+    
+    return REPETITION_PATTERN.sub(collapse, text)
+
+def remove_timestamps(text):
+    """
+    Remove bracketed timestamps and timestamps opening a line
+    
+    Args:
+        text: Transcript text
+    
+    Returns:
+        str: Text without timestamps
+    """
+    return TIMESTAMP_PATTERN.sub("", text)
+
+def abbreviate_speaker_labels(text):
+    """
+    Replace recurring speaker labels with short codes, listed in a legend
+    
+    "Speaker B" becomes "B" and names become their initials, numbered when
+    two speakers share them. Labels are only changed when the codes and
+    the legend together are shorter than the labels they replace.
+    
+    Args:
+        text: Transcript text
+    
+    Returns:
+        str: Text with abbreviated speaker labels and a legend line first
+    """
+    counts = {}
+    for match in SPEAKER_LABEL_PATTERN.finditer(text):
+        counts[match.group(1)] = counts.get(match.group(1), 0) + 1
+    
+    # A label opening a single line is more likely a heading than a speaker
+    labels = [label for label, count in counts.items() if count > 1]
+    if not labels:
+        return text
+    
+    codes = {}
+    used = set()
+    for label in labels:
+        if label.startswith("Speaker "):
+            base = label[len("Speaker "):]
+        else:
+            base = "".join(word[0] for word in label.split()).upper()
+        
+        code = base
+        number = 2
+        while code in used or code in counts:
+            code = f"{base}{number}"
+            number += 1
+        codes[label] = code
+        used.add(code)
+    
+    legend = "Speakers: " + "; ".join(f"{code} = {label}" for label, code in codes.items()) + "\n"
+    saved = sum(counts[label] * (len(label) - len(code)) for label, code in codes.items())
+    if saved <= len(legend):
+        return text
+    
+    def replace(match):
+        code = codes.get(match.group(1))
+        return f"{code}: " if code else match.group(0)
+    
+    return legend + SPEAKER_LABEL_PATTERN.sub(replace, text)
+
+def tidy_whitespace(text):
+    """Fix the spacing and punctuation left behind by removed words"""
+    text = SPACE_BEFORE_PUNCTUATION_PATTERN.sub(r"\1", text)
+    text = DOUBLE_COMMA_PATTERN.sub(",", text)
+    text = LEADING_COMMA_PATTERN.sub(r"\1", text)
+    text = COMMA_BEFORE_STOP_PATTERN.sub(r"\1", text)
+    text = MULTIPLE_SPACES_PATTERN.sub(" ", text)
+    return "\n".join(line.rstrip() for line in text.split("\n"))
+
+def resolve_compression_options(task_type=None, compression=None):
+    """
+    Get the compression options for a task
+    
+    Args:
+        task_type: Task type, whose environment overrides apply
+        compression: Per-task setting: None for the configured options (raw
+                     transcript task types only), False to turn compression
+                     off, True to turn it on, or a dict overriding individual
+                     options
+    
+    Returns:
+        dict: Options for compress_transcript, or None if compression is off
+    """
+    if compression is False or (compression is None and task_type not in RAW_TRANSCRIPT_TASK_TYPES):
+        return None
+    
+    options = get_prompt_compression_config(task_type)
+    
+    if compression is True:
+        options["enabled"] = True
+    elif isinstance(compression, dict):
+        options.update(compression)
+        options.setdefault("enabled", True)
+    
+    if not options.pop("enabled"):
+        return None
+    return options
+
+def compress_transcript(text, disfluencies=True, repetitions=True, speaker_labels=False, timestamps=False):
+    """
+    Compress transcript text for a prompt
+    
+    Args:
+        text: Transcript text
+        disfluencies: Remove fillers and stutters
+        repetitions: Collapse repeated words and phrases
+        speaker_labels: Abbreviate recurring speaker labels
+        timestamps: Remove timestamps
+    
+    Returns:
+        tuple: (compressed text, stats dict with original_tokens,
+                compressed_tokens and tokens_saved)
+    """
+    compressed = text
+    
+    if timestamps:
+        compressed = remove_timestamps(compressed)
+    if disfluencies:
+        compressed = remove_disfluencies(compressed)
+    if repetitions:
+        compressed = collapse_repetitions(compressed)
+    compressed = tidy_whitespace(compressed)
+    if speaker_labels:
+        compressed = abbreviate_speaker_labels(compressed)
+    
+    original_tokens = estimate_tokens(text)
+    compressed_tokens = estimate_tokens(compressed)
+    
+    return compressed, {
+        "original_tokens": original_tokens,
+        "compressed_tokens": compressed_tokens,
+        "tokens_saved": original_tokens - compressed_tokens
+    }
@@ -0,0 +1,447 @@
+# utils/rate_limiter.py
+import asyncio
+import threading
+import time
+from contextlib import contextmanager, asynccontextmanager
+from email.utils import parsedate_to_datetime
+from utils.config import get_rate_limit_config
+from utils.instrumentation import record_queue_time
+
+# Completion tokens reserved for a chat request before the real usage is known
+DEFAULT_COMPLETION_TOKENS = 500
+
+class TokenBucket:
+    """
+    Thread-safe token bucket
+    
+    Callers reserve tokens and are told how long to wait before using them.
+    Reservations may take the bucket negative, which queues later callers
+    behind earlier ones instead of letting them race for refills.
+    """
+    
+    def __init__(self, capacity, refill_per_second):
+        """
+        Initialize the bucket
+        
+        Args:
+            capacity: Maximum number of tokens (burst size)
+            refill_per_second: Tokens added per second
+        """
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def _refill(self, now):
+        """Add the tokens accrued since the last update"""
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_per_second)
+        self.updated_at = now
+    
+    def reserve(self, amount):
+        """
+        Reserve tokens
+        
+        Args:
+            amount: Number of tokens to reserve (clamped to the bucket capacity)
+        
+        Returns:
+            float: Seconds to wait before the reservation may be used
+        """
+        amount = min(float(amount), self.capacity)
+        
+        with self.lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.tokens -= amount
+            
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.refill_per_second
+    
+    def adjust(self, amount):
+        """
+        Correct a previous reservation once the real usage is known
+        
+        Args:
+            amount: Tokens to charge (positive) or refund (negative)
+        """
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.capacity, self.tokens - amount)
+
+class AdaptiveConcurrency:
+    """
+    AIMD concurrency limit
+    
+    The number of requests allowed in flight grows by roughly one per
+    window of successful requests (additive increase) and is cut in half
+    on a rate limit response or when latency exceeds the target
+    (multiplicative decrease).
+    """
+    
+    def __init__(self, initial_limit=4, min_limit=1, max_limit=32, latency_target=None, decrease_factor=0.5):
+        """
+        Initialize the limiter
+        
+        Args:
+            initial_limit: Starting concurrency limit
+            min_limit: Lowest limit the controller may set
+            max_limit: Highest limit the controller may set
+            latency_target: Seconds above which a request counts as congestion
+            decrease_factor: Multiplier applied to the limit on congestion
+        """
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.condition = threading.Condition()
+        
+        # Futures of coroutines waiting for a slot, with their event loops
+        self.async_waiters = []
+    
+    def acquire(self):
+        """Block until a request slot is available"""
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+    
+    async def acquire_async(self):
+        """Wait until a request slot is available without blocking the event loop"""
+        while True:
+            with self.condition:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self.async_waiters.append((loop, waiter))
+            
+            await waiter
+    
+    def release(self, latency=None, congested=False):
+        """
+        Release a request slot and adjust the limit
+        
+        Args:
+            latency: Request latency in seconds
+            congested: True if the request was rate limited
+        """
+        with self.condition:
+            self.in_flight -= 1
+            
+            if self.latency_target and latency is not None and latency > self.latency_target:
+                congested = True
+            
+            if congested:
+                self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1.0 / max(self.limit, 1.0))
+            
+            self.condition.notify_all()
+            
+            # Wake waiting coroutines on their own loops; they recheck the limit
+            for loop, waiter in self.async_waiters:
+                loop.call_soon_threadsafe(_wake_waiter, waiter)
+            self.async_waiters = []
+
+def _wake_waiter(waiter):
+    """Resolve a slot waiter's future unless its coroutine was cancelled"""
+    if not waiter.done():
+        waiter.set_result(None)
+
+class RatePermit:
+    """Permission to make one request, returned by RateLimiter.acquire"""
+    
+    def __init__(self, limiter, estimated_tokens, waited):
+        self.limiter = limiter
+        self.estimated_tokens = estimated_tokens
+        self.waited = waited
+        self.rate_limited = False
+    
+    def record_rate_limited(self, retry_after=None):
+        """
+        Report that the request was rejected with a rate limit error
+        
+        Args:
+            retry_after: Seconds the server asked us to wait, if provided
+        """
+        self.rate_limited = True
+        self.limiter.pause(retry_after)
+    
+    def record_tokens(self, actual_tokens):
+        """
+        Report the tokens the request actually used
+        
+        Args:
+            actual_tokens: Prompt plus completion tokens reported by the API
+        """
+        if self.limiter.token_bucket and actual_tokens:
+            self.limiter.token_bucket.adjust(actual_tokens - self.estimated_tokens)
+
+class RateLimiter:
+    """
+    Client-side limiter for one API budget
+    
+    Combines a requests-per-minute bucket, a tokens-per-minute bucket and an
+    adaptive concurrency limit. A rate limit response pauses every caller
+    sharing the limiter until the server's Retry-After has elapsed.
+    """
+    
+    def __init__(self, name, requests_per_minute=None, tokens_per_minute=None,
+                 max_concurrency=16, latency_target=None):
+        """
+        Initialize the limiter
+        
+        Args:
+            name: Limiter name (used in log messages)
+            requests_per_minute: Request budget, or None for no request limit
+            tokens_per_minute: Token budget, or None for no token limit
+            max_concurrency: Upper bound for the adaptive concurrency limit
+            latency_target: Seconds above which latency counts as congestion
+        """
+        self.name = name
+        self.request_bucket = TokenBucket(requests_per_minute, requests_per_minute / 60.0) if requests_per_minute else None
+        self.token_bucket = TokenBucket(tokens_per_minute, tokens_per_minute / 60.0) if tokens_per_minute else None
+        self.concurrency = AdaptiveConcurrency(
+            initial_limit=max(1, max_concurrency // 4),
+            max_limit=max_concurrency,
+            latency_target=latency_target
+        )
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+    
+    def pause(self, retry_after=None):
+        """
+        Stop issuing requests for a while after a rate limit response
+        
+        Args:
+            retry_after: Seconds to wait (defaults to one second)
+        """
+        delay = retry_after if retry_after is not None else 1.0
+        
+        with self.lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + delay)
+        
+        print(f"Rate limited on {self.name}, pausing requests for {delay:.1f}s")
+    
+    def _blocked_for(self):
+        """Get the seconds left of a rate limit pause"""
+        with self.lock:
+            return self.blocked_until - time.monotonic()
+    
+    def _reserve_budget(self, estimated_tokens):
+        """Reserve budget for a request, returning the seconds to wait before making it"""
+        wait = 0.0
+        if self.request_bucket:
+            wait = max(wait, self.request_bucket.reserve(1))
+        if self.token_bucket and estimated_tokens:
+            wait = max(wait, self.token_bucket.reserve(estimated_tokens))
+        return wait
+    
+    def _wait_for_budget(self, estimated_tokens):
+        """Sleep until any rate limit pause is over and the budgets allow a request"""
+        blocked_for = self._blocked_for()
+        if blocked_for > 0:
+            time.sleep(blocked_for)
+        
+        wait = self._reserve_budget(estimated_tokens)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def _await_budget(self, estimated_tokens):
+        """Like _wait_for_budget, but sleeping without blocking the event loop"""
+        blocked_for = self._blocked_for()
+        if blocked_for > 0:
+            await asyncio.sleep(blocked_for)
+        
+        wait = self._reserve_budget(estimated_tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+    
+    @contextmanager
+    def acquire(self, estimated_tokens=0):
+        """
+        Wait for budget and a concurrency slot, then allow one request
+        
+        Args:
+            estimated_tokens: Expected prompt plus completion tokens
+        
+        Yields:
+            RatePermit: Permit used to report rate limits and real token usage
+        """
+        start = time.monotonic()
+        self.concurrency.acquire()
+        try:
+            self._wait_for_budget(estimated_tokens)
+        except BaseException:
+            self.concurrency.release()
+            raise
+        
+        permit = RatePermit(self, estimated_tokens, time.monotonic() - start)
+        record_queue_time(permit.waited)
+        request_start = time.monotonic()
+        try:
+            yield permit
+        finally:
+            self.concurrency.release(
+                latency=time.monotonic() - request_start,
+                congested=permit.rate_limited
+            )
+    
+    @asynccontextmanager
+    async def acquire_async(self, estimated_tokens=0):
+        """
+        Wait for budget and a concurrency slot without blocking the event loop, then allow one request
+        
+        Args:
+            estimated_tokens: Expected prompt plus completion tokens
+        
+        Yields:
+            RatePermit: Permit used to report rate limits and real token usage
+        """
+        start = time.monotonic()
+        await self.concurrency.acquire_async()
+        try:
+            await self._await_budget(estimated_tokens)
+        except BaseException:
+            self.concurrency.release()
+            raise
+        
+        permit = RatePermit(self, estimated_tokens, time.monotonic() - start)
+        record_queue_time(permit.waited)
+        request_start = time.monotonic()
+        try:
+            yield permit
+        finally:
+            self.concurrency.release(
+                latency=time.monotonic() - request_start,
+                congested=permit.rate_limited
+            )
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(name):
+    """
+    Get the shared rate limiter for an API budget
+    
+    Args:
+        name: Budget name, e.g. "openai_chat", "openai_embeddings" or "openai_tts"
+    
+    Returns:
+        RateLimiter: Shared limiter configured from the environment
+    """
+    limiter = _limiters.get(name)
+    
+    if limiter is None:
+        with _limiters_lock:
+            limiter = _limiters.get(name)
+            if limiter is None:
+                limiter = RateLimiter(name, **get_rate_limit_config(name))
+                _limiters[name] = limiter
+    
+    return limiter
+
+def estimate_tokens(text):
+    """
+    Roughly estimate the number of tokens in a text
+    
+    Args:
+        text: Text to estimate
+    
+    Returns:
+        int: Estimated token count (about four characters per token)
+    """
+    return len(str(text)) // 4 + 1
+
+def parse_retry_after(headers):
+    """
+    Parse the wait time from rate limit response headers
+    
+    Args:
+        headers: Response headers (mapping)
+    
+    Returns:
+        float: Seconds to wait, or None if the headers don't say
+    """
+    if not headers:
+        return None
+    
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return float(retry_after_ms) / 1000.0
+        except ValueError:
+            pass
+    
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    
+    try:
+        return float(retry_after)
+    except ValueError:
+        pass
+    
+    # Retry-After may also be an HTTP date
+    try:
+        retry_at = parsedate_to_datetime(retry_after)
+        return max(0.0, retry_at.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def is_request_too_large_error(error):
+    """
+    Check whether an exception rejects a request that is larger than the tokens-per-minute limit
+    
+    OpenAI reports these as 429 "Request too large" errors, but no amount of
+    waiting lets the request through.
+    
+    Args:
+        error: Exception raised by an API client
+    
+    Returns:
+        bool: True if the request is too large to ever be accepted
+    """
+    return "request too large" in str(error).lower()
+
+def is_rate_limit_error(error):
+    """
+    Check whether an exception is a rate limit (HTTP 429) error that waiting resolves
+    
+    Args:
+        error: Exception raised by an API client
+    
+    Returns:
+        bool: True if the error is a rate limit error
+    """
+    if is_request_too_large_error(error):
+        return False
+    
+    if getattr(error, "status_code", None) == 429:
+        return True
+    
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+    
+    return "RateLimit" in type(error).__name__
+
+def retry_after_from_error(error):
+    """
+    Get the Retry-After wait from an API client exception
+    
+    Args:
+        error: Exception raised by an API client
+    
+    Returns:
+        float: Seconds to wait, or None if unknown
+    """
+    response = getattr(error, "response", None)
+    return parse_retry_after(getattr(response, "headers", None))
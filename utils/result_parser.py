@@ -2,6 +2,81 @@
 import re
 import json
 
+# Patterns are compiled once at import. The lazy DOTALL patterns that need a
+# closing marker are only tried where that marker still occurs later in the
+# text (see _iter_matches_before), so parsing stays linear on long outputs.
+
+# Start of a numbered item with a bold title: "1. **"
+NUMBERED_ITEM_START = re.compile(r'\d+\.\s+\*\*')
+NUMBERED_ITEM_LINE_START = re.compile(r'^\d+\.\s+\*\*', re.MULTILINE)
+
+# "1. **Title**: Description" items
+NUMBERED_ITEM_PATTERN = re.compile(r'\d+\.\s+\*\*([^*:]+)\*\*:\s*(.*?)(?=\d+\.\s+\*\*|$)', re.DOTALL)
+
+# Comprehensive Set items with Context / Implementation Guidance / Expected Benefit
+COMPREHENSIVE_ITEM_PATTERN = re.compile(r'\d+\.\s+\*\*([^*]+)\*\*\s+- \*\*Context\*\*:(.*?)- \*\*Implementation Guidance\*\*:(.*?)- \*\*Expected Benefit\*\*:(.*?)(?=\d+\.\s+\*\*|$)', re.DOTALL)
+
+# Structured list items with Context / Action / Benefit, or any three labelled sub-bullets
+CONTEXT_ACTION_ITEM_PATTERN = re.compile(r'\d+\.\s+\*\*([^*]+)\*\*\s+- \*\*Context\*\*:(.*?)- \*\*Action(?:\s*Item)?\*\*:(.*?)- \*\*Benefit\*\*:(.*?)(?=\d+\.\s+\*\*|$)', re.DOTALL)
+LABELLED_ITEM_PATTERN = re.compile(r'\d+\.\s+\*\*([^*]+)\*\*\s+- \*\*([^:*]+)\*\*:(.*?)- \*\*([^:*]+)\*\*:(.*?)- \*\*([^:*]+)\*\*:(.*?)(?=\d+\.\s+\*\*|$)', re.DOTALL)
+BOLD_TITLE_ITEM_PATTERN = re.compile(r'\d+\.\s+\*\*([^*]+)\*\*')
+ACTION_LABEL = re.compile(r'- \*\*Action(?:\s*Item)?\*\*:')
+SUB_BULLET_LABEL = re.compile(r'- \*\*([^:*]+)\*\*:')
+
+# Verbose CrewAI logs: "# Agent: Role" ... "## Final Answer: ..."
+AGENT_OUTPUT_PATTERN = re.compile(r'#\s*Agent:\s*([^\n]+)(?:.+?)##\s*Final Answer:\s*([^\n](?:.+?))', re.DOTALL)
+FINAL_ANSWER_HEADER = re.compile(r'##\s*Final Answer:')
+FINAL_ANSWER_TAIL = re.compile(r'\s*([^\n](?:.+?))', re.DOTALL)
+TASK_COMPLETED_PATTERN = re.compile(r'TASK COMPLETED:([^[]+)\]:\s*(.+?)(?=\[|\Z)', re.DOTALL)
+
+# Unstructured action items
+NUMBERED_LINE_START = re.compile(r'^\d+\.')
+NUMBERED_LINE_PATTERN = re.compile(r'^\d+\.\s*(.+?)(?=^\d+\.|\Z)', re.MULTILINE | re.DOTALL)
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+BOLD_TEXT = re.compile(r'\*\*([^*]+)\*\*')
+BULLET_MARKERS = ('-', '*', '•', '1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.')
+
+# Additional fields from fact checking, research and translation crews
+FACT_CHECK_PATTERN = re.compile(r'fact check results?:(.*?)(?=\n\s*\n\s*[a-zA-Z]+ [a-zA-Z]+:|$)', re.DOTALL | re.IGNORECASE)
+VERIFICATION_PATTERN = re.compile(r'claim:(.*?)status:(.*?)(?=claim:|$)', re.DOTALL | re.IGNORECASE)
+CLAIM_LABEL = re.compile(r'claim:', re.IGNORECASE)
+STATUS_LABEL = re.compile(r'status:', re.IGNORECASE)
+RESEARCH_PATTERN = re.compile(r'research insights?:(.*?)(?=\n\s*\n\s*[a-zA-Z]+ [a-zA-Z]+:|$)', re.DOTALL | re.IGNORECASE)
+TRANSLATION_LABEL = re.compile(r'\w translation:', re.IGNORECASE)
+
+# Standard section headers, in the order they are looked for
+SECTION_HEADERS = [
+    ("summary", ["Executive Summary:", "Summary:", "# Summary", "## Summary"]),
+    ("key_topics", ["Key Topics:", "Topics:", "# Key Topics", "## Key Topics"]),
+    ("sentiment_analysis", ["Sentiment Analysis:", "# Sentiment Analysis", "## Sentiment Analysis"]),
+    ("action_items", ["Action Items:", "Recommendations:", "# Action Items", "## Action Items"])
+]
+
+# Analysis result field each task type fills (tasks are named after their type)
+TASK_RESULT_FIELDS = {
+    "summary": "summary",
+    "enhanced_summary": "summary",
+    "bullet_summary": "summary",
+    "tiered_summary": "summary",
+    "topic_extraction": "key_topics",
+    "research_topic_extraction": "key_topics",
+    "sentiment": "sentiment_analysis",
+    "speaker_sentiment": "sentiment_analysis",
+    "topic_sentiment": "sentiment_analysis",
+    "action_items": "action_items",
+    "enhanced_action_items": "action_items",
+    "categorized_action_items": "action_items",
+    "claim_extraction": "fact_check",
+    "claim_verification": "fact_check",
+    "comprehensive_fact_check": "fact_check",
+    "analysis_augmentation": "research",
+    "topic_research": "research",
+    "source_finding": "sources"
+}
+
+# Result fields that hold a list of items
+LIST_FIELDS = ("key_topics", "action_items", "sources")
+
 def parse_crew_result(raw_result):
     """
     Parse raw results from the crew into a structured format
@@ -23,6 +98,10 @@ def parse_crew_result(raw_result):
     print(f"Raw result first 100 chars: {raw_result[:100].replace(chr(10), ' ')}")
     print(f"Raw result length: {len(raw_result)}")
     
+    # Strip and lowercase the (possibly multi-MB) output once for every strategy
+    stripped_result = raw_result.strip()
+    lower_result = raw_result.lower()
+    
     # Initialize the structured result
     structured_result = {
         "summary": "",
@@ -51,7 +130,7 @@ def parse_crew_result(raw_result):
             return structured_result
     
     # Check if the content starts directly with numbered items (no intro)
-    if raw_result.strip().startswith("1. **") or re.match(r'^\d+\.\s+\*\*', raw_result.strip()):
+    if stripped_result.startswith("1. **") or NUMBERED_ITEM_START.match(stripped_result):
         print("Detected numbered items with bold titles format")
         
         # Extract the items
@@ -72,7 +151,7 @@ def parse_crew_result(raw_result):
     # Try other parsing approaches in sequence
     
     # 1. Try to parse prioritized list formats
-    if "Prioritized Action Items" in raw_result or "prioritized list" in raw_result.lower():
+    if "Prioritized Action Items" in raw_result or "prioritized list" in lower_result:
         print("Detected prioritized action items format")
         
         action_items = extract_action_items_from_structured_list(raw_result)
@@ -147,7 +226,7 @@ def parse_crew_result(raw_result):
                 structured_result["action_items"] = parsed_sections["action_items"]
     
     # 5. Add any additional fields that might be present in some crew types
-    additional_fields = extract_additional_fields(raw_result)
+    additional_fields = extract_additional_fields(raw_result, lower_text=lower_result)
     for field, content in additional_fields.items():
         if field not in structured_result:
             structured_result[field] = content
@@ -238,7 +317,7 @@ def split_intro_and_items(text):
         tuple: (intro_paragraph, items_section)
     """
     # Find the first numbered item pattern
-    match = re.search(r'^\d+\.\s+\*\*', text.strip(), re.MULTILINE)
+    match = NUMBERED_ITEM_LINE_START.search(text.strip())
     
     if match:
         intro = text[:match.start()].strip()
@@ -264,9 +343,7 @@ def extract_numbered_items_with_descriptions(text):
     items = []
     
     # Pattern for "1. **Title**: Description" format
-    pattern = r'\d+\.\s+\*\*([^*:]+)\*\*:\s*(.*?)(?=\d+\.\s+\*\*|$)'
-    
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = NUMBERED_ITEM_PATTERN.findall(text)
     
     for match in matches:
         title = match[0].strip()
@@ -298,10 +375,13 @@ def extract_comprehensive_items(text):
     """
     action_items = []
     
-    # Pattern for the comprehensive format
-    pattern = r'\d+\.\s+\*\*([^*]+)\*\*\s+- \*\*Context\*\*:(.*?)- \*\*Implementation Guidance\*\*:(.*?)- \*\*Expected Benefit\*\*:(.*?)(?=\d+\.\s+\*\*|$)'
+    # An item needs an Implementation Guidance label followed by an Expected Benefit label
+    benefit_pos = text.rfind("- **Expected Benefit**:")
+    guidance_pos = text.rfind("- **Implementation Guidance**:", 0, benefit_pos) if benefit_pos != -1 else -1
+    if guidance_pos == -1:
+        return action_items
     
-    matches = re.findall(pattern, text, re.DOTALL)
+    matches = [match.groups() for match in _iter_matches_before(COMPREHENSIVE_ITEM_PATTERN, text, guidance_pos)]
     
     for match in matches:
         title = match[0].strip()
@@ -332,9 +412,13 @@ def extract_action_items_from_structured_list(text):
     
     # Try different patterns for structured lists
     
-    # 1. Context/Action/Benefit format
-    pattern1 = r'\d+\.\s+\*\*([^*]+)\*\*\s+- \*\*Context\*\*:(.*?)- \*\*Action(?:\s*Item)?\*\*:(.*?)- \*\*Benefit\*\*:(.*?)(?=\d+\.\s+\*\*|$)'
-    matches1 = re.findall(pattern1, text, re.DOTALL)
+    # 1. Context/Action/Benefit format (an item needs an Action label followed by a Benefit label)
+    matches1 = []
+    benefit_pos = text.rfind("- **Benefit**:")
+    if benefit_pos != -1:
+        action_labels = [label.start() for label in ACTION_LABEL.finditer(text, 0, benefit_pos)]
+        if action_labels:
+            matches1 = [match.groups() for match in _iter_matches_before(CONTEXT_ACTION_ITEM_PATTERN, text, action_labels[-1])]
     
     if matches1:
         for match in matches1:
@@ -351,9 +435,11 @@ def extract_action_items_from_structured_list(text):
         
         return action_items
     
-    # 2. Generic section format
-    pattern2 = r'\d+\.\s+\*\*([^*]+)\*\*\s+- \*\*([^:*]+)\*\*:(.*?)- \*\*([^:*]+)\*\*:(.*?)- \*\*([^:*]+)\*\*:(.*?)(?=\d+\.\s+\*\*|$)'
-    matches2 = re.findall(pattern2, text, re.DOTALL)
+    # 2. Generic section format (an item needs two more labelled sub-bullets after its first)
+    matches2 = []
+    labels = [label.start() for label in SUB_BULLET_LABEL.finditer(text)]
+    if len(labels) >= 3:
+        matches2 = [match.groups() for match in _iter_matches_before(LABELLED_ITEM_PATTERN, text, labels[-2])]
     
     if matches2:
         for match in matches2:
@@ -363,8 +449,7 @@ def extract_action_items_from_structured_list(text):
         return action_items
     
     # 3. Simple numbered items with titles
-    pattern3 = r'\d+\.\s+\*\*([^*]+)\*\*'
-    matches3 = re.findall(pattern3, text)
+    matches3 = BOLD_TITLE_ITEM_PATTERN.findall(text)
     
     if matches3:
         for match in matches3:
@@ -417,9 +502,16 @@ def extract_agent_outputs(text):
     """
     outputs = {}
     
-    # First, try to find agent final answers
-    agent_pattern = re.compile(r'#\s*Agent:\s*([^\n]+)(?:.+?)##\s*Final Answer:\s*([^\n](?:.+?))', re.DOTALL)
-    matches = agent_pattern.finditer(text)
+    # First, try to find agent final answers. No match can end after the
+    # last final answer, so the search stops there instead of trying every
+    # later "# Agent:" header against the rest of the text.
+    final_answer_end = 0
+    for header in FINAL_ANSWER_HEADER.finditer(text):
+        tail = FINAL_ANSWER_TAIL.match(text, header.end())
+        if tail:
+            final_answer_end = tail.end()
+    
+    matches = AGENT_OUTPUT_PATTERN.finditer(text, 0, final_answer_end) if final_answer_end else []
     
     for match in matches:
         agent_name = match.group(1).strip()
@@ -429,8 +521,7 @@ def extract_agent_outputs(text):
     # If we didn't find any using the above pattern, try another approach
     if not outputs:
         # Try to find task completions
-        task_pattern = re.compile(r'TASK COMPLETED:([^[]+)\]:\s*(.+?)(?=\[|\Z)', re.DOTALL)
-        matches = task_pattern.finditer(text)
+        matches = _iter_task_completions(text)
         
         for match in matches:
             task_desc = match.group(1).strip()
@@ -460,21 +551,15 @@ def parse_sections_with_headers(text):
     """
     sections = {}
     
-    # List of headers to search for
-    headers = [
-        ("summary", ["Executive Summary:", "Summary:", "# Summary", "## Summary"]),
-        ("key_topics", ["Key Topics:", "Topics:", "# Key Topics", "## Key Topics"]),
-        ("sentiment_analysis", ["Sentiment Analysis:", "# Sentiment Analysis", "## Sentiment Analysis"]),
-        ("action_items", ["Action Items:", "Recommendations:", "# Action Items", "## Action Items"])
-    ]
+    headers = SECTION_HEADERS
     
     for section_key, header_patterns in headers:
         # Find the first matching header
         start_pos = -1
         matched_header = ""
         for header in header_patterns:
-            if header in text:
-                header_pos = text.find(header)
+            header_pos = text.find(header)
+            if header_pos != -1:
                 if start_pos == -1 or header_pos < start_pos:
                     start_pos = header_pos
                     matched_header = header
@@ -488,7 +573,8 @@ def parse_sections_with_headers(text):
             for end_key, end_patterns in headers:
                 if end_key != section_key:  # Don't look for the current section's headers
                     for end_header in end_patterns:
-                        end_pos = text.find(end_header, section_start)
+                        # Only a header starting before the current end can shorten the section
+                        end_pos = text.find(end_header, section_start, section_end + len(end_header) - 1)
                         if end_pos != -1 and end_pos < section_end:
                             section_end = end_pos
             
@@ -526,7 +612,7 @@ def extract_bullet_points(text):
             continue
         
         # Check if line starts with bullet point markers
-        if any(line.startswith(marker) for marker in ['-', '*', '•', '1.', '2.', '3.', '4.', '5.', '6.', '7.', '8.', '9.']):
+        if line.startswith(BULLET_MARKERS):
             # Remove the bullet marker
             if line.startswith(('-', '*', '•')):
                 clean_line = line[1:].strip()
@@ -536,7 +622,7 @@ def extract_bullet_points(text):
                 clean_line = line
                 
             # Remove markdown formatting
-            clean_line = re.sub(r'\*\*([^*]+)\*\*', r'\1', clean_line)
+            clean_line = BOLD_TEXT.sub(r'\1', clean_line)
             
             # Add to list if not empty
             if clean_line:
@@ -562,10 +648,9 @@ def extract_action_items_from_text(text):
     action_items = []
     
     # Check if the text starts with a numbered list
-    if re.match(r'^\d+\.', text.strip()):
+    if NUMBERED_LINE_START.match(text.strip()):
         # Extract numbered items
-        number_pattern = re.compile(r'^\d+\.\s*(.+?)(?=^\d+\.|\Z)', re.MULTILINE | re.DOTALL)
-        matches = number_pattern.finditer(text)
+        matches = NUMBERED_LINE_PATTERN.finditer(text)
         
         for match in matches:
             item = match.group(1).strip()
@@ -581,7 +666,7 @@ def extract_action_items_from_text(text):
         return bullet_points
     
     # If we still don't have items, try to extract from paragraphs
-    paragraphs = re.split(r'\n\s*\n', text)
+    paragraphs = PARAGRAPH_BREAK.split(text)
     for para in paragraphs:
         para = para.strip()
         if para:
@@ -589,73 +674,255 @@ def extract_action_items_from_text(text):
     
     return action_items
 
-def extract_additional_fields(text):
+def extract_additional_fields(text, lower_text=None):
     """
     Extract additional fields that might be present in some crew types
     
     Args:
         text: Raw result text
+        lower_text: text.lower(), if the caller already has it
         
     Returns:
         dict: Dictionary with additional fields
     """
     additional_fields = {}
     
+    if lower_text is None:
+        lower_text = text.lower()
+    
     # Check for fact check results
-    if "fact check" in text.lower():
-        fact_check_pattern = re.compile(r'fact check results?:(.*?)(?=\n\s*\n\s*[a-zA-Z]+ [a-zA-Z]+:|$)', re.DOTALL | re.IGNORECASE)
-        match = fact_check_pattern.search(text)
+    if "fact check" in lower_text:
+        match = FACT_CHECK_PATTERN.search(text)
         
         if match:
             fact_check_text = match.group(1).strip()
             
-            # Try to parse structured fact check results
-            try:
-                # Check if there are claims with verification status
-                verification_pattern = re.compile(r'claim:(.*?)status:(.*?)(?=claim:|$)', re.DOTALL | re.IGNORECASE)
-                verifications = verification_pattern.finditer(fact_check_text)
-                
-                results = []
-                for v in verifications:
-                    claim = v.group(1).strip()
-                    status = v.group(2).strip()
-                    results.append({"claim": claim, "status": status})
-                
-                if results:
-                    additional_fields["fact_check"] = {
-                        "results": results
-                    }
-                else:
-                    additional_fields["fact_check"] = fact_check_text
-            except Exception as e:
-                # Just store as text if parsing fails
-                print(f"Error parsing fact check results: {e}")
-                additional_fields["fact_check"] = fact_check_text
+            additional_fields["fact_check"] = parse_fact_check_results(fact_check_text)
     
     # Check for research insights
-    if "research" in text.lower():
-        research_pattern = re.compile(r'research insights?:(.*?)(?=\n\s*\n\s*[a-zA-Z]+ [a-zA-Z]+:|$)', re.DOTALL | re.IGNORECASE)
-        match = research_pattern.search(text)
+    if "research" in lower_text:
+        match = RESEARCH_PATTERN.search(text)
         
         if match:
             research_text = match.group(1).strip()
             additional_fields["research"] = research_text
     
     # Check for translations
-    if "translation" in text.lower():
-        translation_pattern = re.compile(r'(\w+) translation:(.*?)(?=\w+ translation:|$)', re.DOTALL | re.IGNORECASE)
-        translations = translation_pattern.finditer(text)
+    if "translation" in lower_text:
+        translations = _iter_translations(text)
         
         if translations:
             additional_fields["translations"] = {}
             
-            for t in translations:
-                language = t.group(1).lower()
-                content = t.group(2).strip()
-                additional_fields["translations"][language] = content
+            for language, content in translations:
+                additional_fields["translations"][language.lower()] = content.strip()
     
     return additional_fields
 
+def parse_fact_check_results(fact_check_text):
+    """
+    Parse fact check results into claims with their verification status
+    
+    Args:
+        fact_check_text: Fact check text with "Claim: ... Status: ..." entries
+        
+    Returns:
+        dict/str: {"results": [{"claim", "status"}, ...]}, or the text if no claims are found
+    """
+    # Try to parse structured fact check results
+    try:
+        # Check if there are claims with verification status
+        # (a claim needs a status after it, so claims after the last status are not tried)
+        status_labels = [label.start() for label in STATUS_LABEL.finditer(fact_check_text)]
+        verifications = _iter_matches_before(VERIFICATION_PATTERN, fact_check_text, status_labels[-1], CLAIM_LABEL) if status_labels else []
+        
+        results = []
+        for v in verifications:
+            claim = v.group(1).strip()
+            status = v.group(2).strip()
+            results.append({"claim": claim, "status": status})
+        
+        if results:
+            return {
+                "results": results
+            }
+    except Exception as e:
+        # Just store as text if parsing fails
+        print(f"Error parsing fact check results: {e}")
+    
+    return fact_check_text
+
+def merge_task_output(task_name, text, result):
+    """
+    Parse one task's output into the analysis result
+    
+    The task's output only has to provide the field its task type fills (see
+    TASK_RESULT_FIELDS), so none of the format detection parse_crew_result
+    needs for the final crew output applies. Sections with standard headers
+    in the output (e.g. a summary with its own "Key Topics") fill other
+    fields only where no task has yet.
+    
+    Args:
+        task_name: Name of the task (its task type unless renamed)
+        text: Raw output of the task
+        result: Analysis result dictionary to update
+        
+    Returns:
+        bool: True if the task's output filled a result field
+    """
+    field = TASK_RESULT_FIELDS.get(task_name)
+    text = (text or "").strip()
+    if field is None or not text:
+        return False
+    
+    sections = parse_sections_with_headers(text)
+    
+    if sections.get(field):
+        result[field] = sections[field]
+    elif field in LIST_FIELDS:
+        result[field] = extract_action_items_from_text(text)
+    elif field == "fact_check":
+        result[field] = parse_fact_check_results(text)
+    else:
+        result[field] = text
+    
+    for section_key, content in sections.items():
+        if content and not result.get(section_key):
+            result[section_key] = content
+    
+    return True
+
+def split_language_sections(text, languages):
+    """
+    Split a multilingual output into its per-language sections
+    
+    Args:
+        text: Output with a header line naming each language
+        languages: Languages to look for
+        
+    Returns:
+        dict: Lowercase language -> section text, for the languages found
+    """
+    headers = []
+    for language in languages:
+        match = re.search(rf'^[#*\s]*{re.escape(language)}\b[^\n]*$', text, re.IGNORECASE | re.MULTILINE)
+        if match:
+            headers.append((match.start(), match.end(), language.lower()))
+    
+    headers.sort()
+    sections = {}
+    for index, (_, content_start, language) in enumerate(headers):
+        content_end = headers[index + 1][0] if index + 1 < len(headers) else len(text)
+        content = text[content_start:content_end].strip()
+        if content:
+            sections[language] = content
+    
+    return sections
+
+def _iter_matches_before(pattern, text, cutoff, start_pattern=NUMBERED_ITEM_START):
+    """
+    Iterate over pattern's matches, given that none can start at or after cutoff
+    
+    Equivalent to pattern.finditer(text), but skips the attempts after the
+    last closing marker, each of which would scan to the end of the text
+    before failing (quadratic on outputs with many unfinished items).
+    
+    Args:
+        pattern: Compiled pattern; every match starts with a start_pattern match
+        text: Text to search
+        cutoff: Position no match can start at or after
+        start_pattern: Compiled pattern for where a match can start
+        
+    Returns:
+        generator: Match objects
+    """
+    pos = 0
+    while True:
+        start = start_pattern.search(text, pos)
+        if not start or start.start() >= cutoff:
+            return
+        
+        match = pattern.match(text, start.start())
+        if match:
+            yield match
+            pos = match.end()
+        else:
+            pos = start.start() + 1
+
+def _iter_task_completions(text):
+    """
+    Iterate over "TASK COMPLETED:...]: content" matches in linear time
+    
+    Equivalent to TASK_COMPLETED_PATTERN.finditer(text). A marker needs a
+    "]:" before the next "[", so when it has none, neither has any later
+    marker before that "[" and they are skipped together.
+    
+    Args:
+        text: Text to search
+        
+    Returns:
+        generator: Match objects
+    """
+    pos = 0
+    while True:
+        start = text.find("TASK COMPLETED:", pos)
+        if start == -1:
+            return
+        
+        bracket = text.find("[", start)
+        if bracket == -1:
+            bracket = len(text)
+        
+        if text.find("]:", start + len("TASK COMPLETED:") + 1, bracket) == -1:
+            pos = bracket
+            continue
+        
+        match = TASK_COMPLETED_PATTERN.match(text, start)
+        if match:
+            yield match
+            pos = match.end()
+        else:
+            pos = start + 1
+
+def _iter_translations(text):
+    """
+    Iterate over "<Language> translation: content" sections in linear time
+    
+    Equivalent to matching "(\\w+) translation:(.*?)" up to the next such
+    label or the end (DOTALL, IGNORECASE), which as a regex backtracks
+    through every position of a long word. Each section runs from its label
+    to the start of the word before the next label, or to the end.
+    
+    Args:
+        text: Text to search
+        
+    Returns:
+        generator: (language, content) tuples
+    """
+    # Positions of the space before each "translation:" that follows a word
+    labels = [label.start() + 1 for label in TRANSLATION_LABEL.finditer(text)]
+    end = len(text) - 1 if text.endswith("\n") else len(text)
+    pos = 0
+    
+    for index, label in enumerate(labels):
+        if label <= pos:
+            continue
+        
+        content_start = label + len(" translation:")
+        content_end = len(text) if content_start > end else end
+        if index + 1 < len(labels):
+            content_end = min(content_end, _word_start(text, labels[index + 1], content_start))
+        
+        yield text[_word_start(text, label, pos):label], text[content_start:content_end]
+        pos = content_end
+
+def _word_start(text, end, limit):
+    """Start of the run of word characters ending at end, but not before limit"""
+    start = end
+    while start > limit and (text[start - 1].isalnum() or text[start - 1] == "_"):
+        start -= 1
+    return start
+
 def ensure_complete_structure(structured_result):
     """
     Ensure all expected fields are present with meaningful default values if missing
@@ -0,0 +1,180 @@
+# utils/retry.py
+"""
+Bounded retries for LLM task execution
+
+A RetryPolicy classifies each error, retries only the transient ones (rate
+limits, timeouts, server errors) after an exponential backoff with full
+jitter, and stops at a maximum number of attempts or a deadline for the
+whole call. When it gives up it raises TaskExecutionError, so callers stop
+instead of passing an error message on as if it were task output.
+"""
+import asyncio
+import random
+import time
+from utils.config import get_retry_config
+from utils.rate_limiter import is_rate_limit_error, is_request_too_large_error, retry_after_from_error
+
+# Error categories
+RATE_LIMIT = "rate_limit"
+TIMEOUT = "timeout"
+SERVER = "server"
+BAD_REQUEST = "bad_request"
+UNKNOWN = "unknown"
+
+# Categories worth another attempt; a bad request fails the same way again
+RETRYABLE_CATEGORIES = (RATE_LIMIT, TIMEOUT, SERVER, UNKNOWN)
+
+class TaskExecutionError(Exception):
+    """A task failed after the retry policy gave up on it"""
+    
+    def __init__(self, message, task_name=None, agent_role=None, category=UNKNOWN, attempts=1):
+        """
+        Initialize the error
+        
+        Args:
+            message: Error message
+            task_name: Name of the task that failed
+            agent_role: Role of the agent that ran it
+            category: Category of the last error (see classify_error)
+            attempts: Number of attempts made
+        """
+        super().__init__(message)
+        self.task_name = task_name
+        self.agent_role = agent_role
+        self.category = category
+        self.attempts = attempts
+
+def _status_code(error):
+    """Get the HTTP status code an API client exception carries, if any"""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status if isinstance(status, int) else None
+
+def classify_error(error):
+    """
+    Classify an error raised while executing a task
+    
+    Args:
+        error: Exception
+    
+    Returns:
+        str: RATE_LIMIT, TIMEOUT, SERVER, BAD_REQUEST or UNKNOWN
+    """
+    # A request over the tokens-per-minute limit fails the same way every time
+    if is_request_too_large_error(error):
+        return BAD_REQUEST
+    if is_rate_limit_error(error):
+        return RATE_LIMIT
+    
+    name = type(error).__name__
+    if isinstance(error, (TimeoutError, asyncio.TimeoutError)) or "Timeout" in name:
+        return TIMEOUT
+    
+    status = _status_code(error)
+    if status is not None:
+        if status == 408:
+            return TIMEOUT
+        if status >= 500:
+            return SERVER
+        if 400 <= status < 500:
+            return BAD_REQUEST
+    
+    if any(marker in name for marker in ("ServiceUnavailable", "InternalServer", "APIConnection", "ConnectionError")):
+        return SERVER
+    if isinstance(error, (ValueError, TypeError)) or any(marker in name for marker in (
+            "BadRequest", "Authentication", "PermissionDenied", "NotFound", "ContextWindowExceeded", "UnprocessableEntity")):
+        return BAD_REQUEST
+    
+    return UNKNOWN
+
+class RetryPolicy:
+    """Decides whether and when to retry a failed call"""
+    
+    def __init__(self, max_attempts=3, base_delay=1.0, max_delay=30.0, deadline=300.0,
+                 retryable_categories=RETRYABLE_CATEGORIES):
+        """
+        Initialize the policy
+        
+        Args:
+            max_attempts: Attempts per call, including the first
+            base_delay: Backoff before the first retry, doubled for each later one
+            max_delay: Upper bound for a single backoff
+            deadline: Seconds the call may take over all its attempts, or None
+            retryable_categories: Error categories that are retried
+        """
+        self.max_attempts = max(1, max_attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self.retryable_categories = retryable_categories
+    
+    def backoff(self, attempt, retry_after=None):
+        """
+        Get the wait before the next attempt
+        
+        Full jitter (a random wait up to the exponential bound) keeps clients
+        that failed together from retrying together.
+        
+        Args:
+            attempt: Number of attempts made so far
+            retry_after: Seconds the server asked us to wait, if it did
+        
+        Returns:
+            float: Seconds to wait
+        """
+        bound = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        delay = random.uniform(0, bound)
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+        return delay
+    
+    def next_delay(self, error, attempt, started):
+        """
+        Decide whether to retry after a failed attempt
+        
+        Args:
+            error: Exception the attempt failed with
+            attempt: Number of attempts made so far
+            started: time.monotonic() when the first attempt started
+        
+        Returns:
+            float: Seconds to wait before retrying, or None to give up
+        """
+        if classify_error(error) not in self.retryable_categories or attempt >= self.max_attempts:
+            return None
+        
+        delay = self.backoff(attempt, retry_after_from_error(error))
+        if self.deadline is not None and time.monotonic() - started + delay >= self.deadline:
+            return None
+        
+        return delay
+    
+    def remaining(self, started):
+        """
+        Get the time left before the deadline
+        
+        Args:
+            started: time.monotonic() when the first attempt started
+        
+        Returns:
+            float: Seconds left, or None if there is no deadline
+        """
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - (time.monotonic() - started))
+
+def get_retry_policy(max_attempts=None):
+    """
+    Get the configured retry policy
+    
+    Args:
+        max_attempts: Optional override for the number of attempts
+    
+    Returns:
+        RetryPolicy: Policy
+    """
+    config = get_retry_config()
+    if max_attempts is not None:
+        config["max_attempts"] = max_attempts
+    return RetryPolicy(**config)
@@ -0,0 +1,170 @@
+# utils/singleflight.py
+"""
+Collapsing of concurrent identical requests
+
+Several users opening the same Meeting at the same moment make the same
+LLM, TTS and Wikipedia requests at the same time. A SingleFlight group
+lets the first caller for a request key make the call while later callers
+with the same key wait for it and receive its result (or its exception)
+instead of making the call again. Only calls in flight are shared; once a
+call returns, the next caller with its key makes a new one, so this
+complements caches rather than replacing them.
+
+Sync and async callers share the same in-flight calls. Set SINGLE_FLIGHT=off
+to make every call on its own.
+"""
+import asyncio
+import hashlib
+import json
+import threading
+from concurrent.futures import Future
+from utils.config import is_single_flight_enabled
+from utils.instrumentation import record_cache_hit
+
+class SingleFlight:
+    """In-flight calls of one kind, keyed by request key"""
+    
+    def __init__(self, name):
+        """
+        Initialize an empty group
+        
+        Args:
+            name: Group name, used in log messages
+        """
+        self.name = name
+        self.lock = threading.Lock()
+        self.calls = {}
+        self.shared_calls = 0
+    
+    def _join(self, key):
+        """
+        Get the in-flight call for a key, registering a new one if there is none
+        
+        Returns:
+            tuple: (Future of the call, True if the caller must make the call)
+        """
+        with self.lock:
+            future = self.calls.get(key)
+            if future is not None:
+                self.shared_calls += 1
+                return future, False
+            
+            future = self.calls[key] = Future()
+            return future, True
+    
+    def _finish(self, key, future, result=None, error=None):
+        """Publish the result of a call to its waiters and stop sharing it"""
+        with self.lock:
+            self.calls.pop(key, None)
+        
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    
+    def do(self, key, func):
+        """
+        Call a function, or wait for the identical call already in flight
+        
+        Args:
+            key: Request key, from request_key()
+            func: Function with no arguments that makes the call
+        
+        Returns:
+            The call's result
+        
+        Raises:
+            Exception: Whatever the call raised, in the caller and every waiter
+        """
+        if not is_single_flight_enabled():
+            return func()
+        
+        future, owner = self._join(key)
+        if not owner:
+            print(f"Waiting for an identical {self.name} call in flight")
+            record_cache_hit()
+            return future.result()
+        
+        try:
+            result = func()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        
+        self._finish(key, future, result=result)
+        return result
+    
+    async def ado(self, key, coro_func):
+        """
+        Await a coroutine, or wait for the identical call already in flight
+        
+        Args:
+            key: Request key, from request_key()
+            coro_func: Function with no arguments returning the coroutine that makes the call
+        
+        Returns:
+            The call's result
+        
+        Raises:
+            Exception: Whatever the call raised, in the caller and every waiter
+        """
+        if not is_single_flight_enabled():
+            return await coro_func()
+        
+        future, owner = self._join(key)
+        if not owner:
+            print(f"Waiting for an identical {self.name} call in flight")
+            record_cache_hit()
+            # Shielded so a cancelled waiter doesn't cancel the shared call
+            return await asyncio.shield(asyncio.wrap_future(future))
+        
+        try:
+            result = await coro_func()
+        except BaseException as e:
+            self._finish(key, future, error=e)
+            raise
+        
+        self._finish(key, future, result=result)
+        return result
+
+_groups = {}
+_groups_lock = threading.Lock()
+
+def get_single_flight(name):
+    """
+    Get the shared single-flight group for a kind of call
+    
+    Args:
+        name: Group name, e.g. "openai_chat", "openai_tts", "wikipedia" or "agent_task"
+    
+    Returns:
+        SingleFlight: Shared group
+    """
+    group = _groups.get(name)
+    
+    if group is None:
+        with _groups_lock:
+            group = _groups.get(name)
+            if group is None:
+                group = _groups[name] = SingleFlight(name)
+    
+    return group
+
+def request_key(*parts):
+    """
+    Derive a request key from everything the response depends on
+    
+    Args:
+        parts: Model names, prompts, parameters (dicts and lists are
+               serialized with sorted keys)
+    
+    Returns:
+        str: Key
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if not isinstance(part, str):
+            part = json.dumps(part, sort_keys=True, default=str)
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
@@ -0,0 +1,217 @@
+# utils/tokens.py
+"""
+Token counting and token budgets for prompt inputs
+
+Text is counted with the model's tiktoken encoding, loaded once per model
+and cached. When tiktoken or its encoding files aren't available (e.g.
+offline), counts fall back to the rough four-characters-per-token estimate
+the rate limiter uses.
+
+get_input_token_budget derives how much input a prompt can take from the
+model's context window. allocate_token_budget shares a token budget among
+several inputs: inputs that need less than their share get all they need,
+and what they leave is redistributed to the others in proportion to their
+priority.
+"""
+import threading
+from utils.rate_limiter import estimate_tokens, DEFAULT_COMPLETION_TOKENS
+
+# Characters per token assumed when no encoder is available
+CHARS_PER_TOKEN = 4
+
+# Encoding for models tiktoken doesn't know (e.g. non-OpenAI models)
+DEFAULT_ENCODING = "cl100k_base"
+
+# Input tokens of a prompt for a model whose context window is unknown
+# (about what the former 5000-character task input limit allowed)
+DEFAULT_INPUT_TOKENS = 1250
+
+_encoders = {}
+_encoders_lock = threading.Lock()
+
+def _load_encoder(model):
+    """Load the tiktoken encoding for a model, or None if it can't be loaded"""
+    try:
+        import tiktoken
+    except ImportError:
+        print("tiktoken is not installed, estimating token counts from text length")
+        return None
+    
+    try:
+        try:
+            return tiktoken.encoding_for_model(model.split("/")[-1]) if model else tiktoken.get_encoding(DEFAULT_ENCODING)
+        except KeyError:
+            return tiktoken.get_encoding(DEFAULT_ENCODING)
+    except Exception as e:
+        # Encoding files are downloaded on first use
+        print(f"Could not load the tiktoken encoding for {model or DEFAULT_ENCODING}, estimating token counts: {str(e)}")
+        return None
+
+def get_encoder(model=None):
+    """
+    Get the cached tiktoken encoder for a model
+    
+    Args:
+        model: Model name (provider prefixes such as "openai/" are ignored)
+    
+    Returns:
+        Encoding: tiktoken encoder, or None if counts are estimated
+    """
+    if model in _encoders:
+        return _encoders[model]
+    
+    with _encoders_lock:
+        if model not in _encoders:
+            _encoders[model] = _load_encoder(model)
+        return _encoders[model]
+
+def count_tokens(text, model=None):
+    """
+    Count the tokens of a text
+    
+    Args:
+        text: Text to count
+        model: Model whose encoding to use
+    
+    Returns:
+        int: Token count
+    """
+    text = str(text)
+    encoder = get_encoder(model)
+    if encoder is None:
+        return estimate_tokens(text)
+    return len(encoder.encode(text, disallowed_special=()))
+
+def truncate_to_tokens(text, max_tokens, model=None):
+    """
+    Truncate a text to a number of tokens
+    
+    Args:
+        text: Text to truncate
+        max_tokens: Maximum tokens to keep
+        model: Model whose encoding to use
+    
+    Returns:
+        str: The text, or its longest prefix within max_tokens
+    """
+    text = str(text)
+    max_tokens = max(0, int(max_tokens))
+    encoder = get_encoder(model)
+    if encoder is None:
+        return text[:max_tokens * CHARS_PER_TOKEN]
+    
+    tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+def allocate_token_budget(token_counts, budget, priorities=None):
+    """
+    Share a token budget among inputs by priority and actual length
+    
+    Each round offers every remaining input a share of the remaining budget
+    proportional to its priority. Inputs needing no more than their share
+    get their full length and leave the rest of their share to the others;
+    once no input fits in its share, the remaining inputs split the budget
+    left by priority.
+    
+    Args:
+        token_counts: Dict of input key -> tokens the input needs
+        budget: Tokens available for all inputs
+        priorities: Optional dict of input key -> priority weight (default 1)
+    
+    Returns:
+        dict: Input key -> tokens allocated
+    """
+    priorities = priorities or {}
+    allocations = {}
+    remaining = dict(token_counts)
+    budget = max(0, budget)
+    
+    while remaining:
+        total_weight = sum(max(priorities.get(key, 1), 0.001) for key in remaining)
+        fitting = {
+            key: needed for key, needed in remaining.items()
+            if needed <= budget * max(priorities.get(key, 1), 0.001) / total_weight
+        }
+        
+        if not fitting:
+            for key in remaining:
+                allocations[key] = int(budget * max(priorities.get(key, 1), 0.001) / total_weight)
+            break
+        
+        for key, needed in fitting.items():
+            allocations[key] = needed
+            budget -= needed
+            del remaining[key]
+    
+    return allocations
+
+def get_context_window(model):
+    """
+    Get the maximum input tokens of a model
+    
+    Args:
+        model: Model name
+    
+    Returns:
+        int: Maximum input tokens, or None if unknown
+    """
+    if not model:
+        return None
+    
+    try:
+        import litellm
+        return litellm.get_model_info(model).get("max_input_tokens")
+    except Exception:
+        return None
+
+def get_max_output_tokens(model):
+    """
+    Get the maximum completion tokens of a model
+    
+    Args:
+        model: Model name
+    
+    Returns:
+        int: Maximum output tokens, or None if unknown
+    """
+    if not model:
+        return None
+    
+    try:
+        import litellm
+        return litellm.get_model_info(model).get("max_output_tokens")
+    except Exception:
+        return None
+
+def get_input_token_budget(model, prompt="", completion_tokens=DEFAULT_COMPLETION_TOKENS, max_tokens=None, max_request_tokens=None):
+    """
+    Get the tokens of input data a prompt for a model can take
+    
+    Args:
+        model: Model name
+        prompt: Instructions the input data is added to
+        completion_tokens: Tokens kept free for the answer
+        max_tokens: Optional cap on the budget
+        max_request_tokens: Optional cap on a whole request, instructions and
+                            answer included (e.g. a tokens-per-minute budget,
+                            which a larger request could never fit in)
+    
+    Returns:
+        int: What the model's context window (and max_request_tokens) leaves
+             after the instructions and the answer, at most max_tokens
+             (DEFAULT_INPUT_TOKENS in place of the context window if it is unknown)
+    """
+    overhead = count_tokens(prompt, model) + completion_tokens
+    context_window = get_context_window(model)
+    
+    limits = [max_tokens]
+    if context_window:
+        limits.append(context_window - overhead)
+    elif max_tokens is None:
+        limits.append(DEFAULT_INPUT_TOKENS)
+    if max_request_tokens:
+        limits.append(max_request_tokens - overhead)
+    
+    return max(1, min(limit for limit in limits if limit is not None))
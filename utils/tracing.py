@@ -0,0 +1,233 @@
+# utils/tracing.py
+"""
+OpenTelemetry tracing for the analysis pipeline
+
+Every span recorded through utils.instrumentation (transcription, crew
+tasks, OpenAI, TTS, storage and email calls, pipeline stages) is mirrored as
+an OpenTelemetry span, parented to the span that enclosed it. Active spans
+are also attached to the OpenTelemetry context, so spans created by other
+OpenTelemetry instrumentation nest under them.
+
+Enable with TRACING_EXPORTER:
+    console  print spans to stdout
+    file     append spans as OTLP JSON lines to TRACING_FILE (works offline)
+    otlp     send spans to an OTLP/HTTP collector (OTEL_EXPORTER_OTLP_ENDPOINT)
+"""
+import base64
+import json
+import os
+import threading
+from utils.config import get_tracing_exporter, get_tracing_file_path
+from utils.instrumentation import add_span_observer
+
+_tracing_lock = threading.Lock()
+_tracing_observer = None
+
+class OTLPFileSpanExporter:
+    """Span exporter that appends OTLP JSON lines to a local file"""
+    
+    def __init__(self, file_path):
+        """
+        Initialize the exporter
+        
+        Args:
+            file_path: Path of the JSON lines file
+        """
+        self.file_path = file_path
+        self.lock = threading.Lock()
+        
+        directory = os.path.dirname(file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def export(self, spans):
+        """
+        Write a batch of spans as one OTLP ExportTraceServiceRequest line
+        
+        Args:
+            spans: Finished OpenTelemetry SDK spans
+        
+        Returns:
+            SpanExportResult: Export outcome
+        """
+        from google.protobuf.json_format import MessageToDict
+        from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
+        from opentelemetry.sdk.trace.export import SpanExportResult
+        
+        try:
+            line = json.dumps(_hex_ids(MessageToDict(encode_spans(spans))))
+            with self.lock, open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            return SpanExportResult.SUCCESS
+        except Exception as e:
+            print(f"Error exporting spans to {self.file_path}: {str(e)}")
+            return SpanExportResult.FAILURE
+    
+    def shutdown(self):
+        """Nothing to release; each export opens and closes the file"""
+    
+    def force_flush(self, timeout_millis=30000):
+        """Spans are written as soon as they are exported"""
+        return True
+
+def _hex_ids(value):
+    """Re-encode trace and span IDs from protobuf's base64 to the hex OTLP JSON uses"""
+    if isinstance(value, list):
+        return [_hex_ids(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    
+    converted = {}
+    for key, item in value.items():
+        if key in ("traceId", "spanId", "parentSpanId") and isinstance(item, str):
+            converted[key] = base64.b64decode(item).hex()
+        else:
+            converted[key] = _hex_ids(item)
+    return converted
+
+class TracingObserver:
+    """Mirrors instrumentation spans as OpenTelemetry spans"""
+    
+    def __init__(self, tracer):
+        """
+        Initialize the observer
+        
+        Args:
+            tracer: OpenTelemetry tracer
+        """
+        self.tracer = tracer
+    
+    def on_start(self, started):
+        """Start an OpenTelemetry span under the parent span's OpenTelemetry span"""
+        from opentelemetry import context, trace
+        
+        parent_span = getattr(started.parent, "otel_span", None)
+        parent_context = trace.set_span_in_context(parent_span) if parent_span is not None else None
+        
+        attributes = {"pipeline.kind": started.kind}
+        attributes.update(_span_attributes(started.attributes))
+        
+        started.otel_span = self.tracer.start_span(
+            f"{started.kind} {started.name}",
+            context=parent_context,
+            attributes=attributes
+        )
+        
+        # Spans used as context managers become the current OpenTelemetry span
+        if started.active:
+            started.otel_token = context.attach(trace.set_span_in_context(started.otel_span))
+    
+    def on_end(self, finished):
+        """Record the span's measurements and end the OpenTelemetry span"""
+        from opentelemetry import context
+        from opentelemetry.trace import Status, StatusCode
+        
+        otel_span = getattr(finished, "otel_span", None)
+        if otel_span is None:
+            return
+        
+        otel_span.set_attributes(_span_attributes(finished.attributes))
+        otel_span.set_attributes({
+            "pipeline.wall_time_ms": round((finished.wall_time or 0.0) * 1000, 2),
+            "pipeline.queue_time_ms": round(finished.queue_time * 1000, 2),
+            "pipeline.retries": finished.retries,
+            "pipeline.cache_hits": finished.cache_hits
+        })
+        
+        if finished.model:
+            otel_span.set_attribute("gen_ai.request.model", finished.model)
+        if finished.prompt_tokens or finished.completion_tokens:
+            otel_span.set_attribute("gen_ai.usage.input_tokens", finished.prompt_tokens)
+            otel_span.set_attribute("gen_ai.usage.output_tokens", finished.completion_tokens)
+        
+        if finished.error:
+            otel_span.set_status(Status(StatusCode.ERROR, finished.error))
+        
+        otel_span.end()
+        
+        token = getattr(finished, "otel_token", None)
+        if token is not None:
+            context.detach(token)
+
+def _span_attributes(attributes):
+    """Convert span attributes to OpenTelemetry attribute values, skipping None and stringifying other types"""
+    converted = {}
+    
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if isinstance(value, (str, bool, int, float)):
+            converted[f"pipeline.{key}"] = value
+        elif isinstance(value, (list, tuple)) and all(isinstance(item, str) for item in value):
+            converted[f"pipeline.{key}"] = list(value)
+        else:
+            converted[f"pipeline.{key}"] = str(value)
+    
+    return converted
+
+def _create_exporter(exporter_name):
+    """
+    Create the span exporter for a TRACING_EXPORTER value
+    
+    Args:
+        exporter_name: "console", "file" or "otlp"
+    
+    Returns:
+        tuple: (exporter, "simple" or "batch" span processor type)
+    """
+    if exporter_name == "console":
+        from opentelemetry.sdk.trace.export import ConsoleSpanExporter
+        return ConsoleSpanExporter(), "simple"
+    
+    if exporter_name == "file":
+        return OTLPFileSpanExporter(get_tracing_file_path()), "batch"
+    
+    if exporter_name == "otlp":
+        from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(), "batch"
+    
+    raise ValueError(f"Unknown tracing exporter: {exporter_name}")
+
+def setup_tracing(service_name="meeting-analyzer"):
+    """
+    Set up OpenTelemetry tracing if TRACING_EXPORTER is configured
+    
+    Safe to call more than once; only the first call configures tracing.
+    
+    Args:
+        service_name: Service name reported on every span
+    
+    Returns:
+        bool: True if tracing is enabled
+    """
+    global _tracing_observer
+    
+    exporter_name = get_tracing_exporter()
+    if not exporter_name:
+        return False
+    
+    with _tracing_lock:
+        if _tracing_observer is not None:
+            return True
+        
+        try:
+            from opentelemetry import trace
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import TracerProvider
+            from opentelemetry.sdk.trace.export import BatchSpanProcessor, SimpleSpanProcessor
+            
+            exporter, processor_type = _create_exporter(exporter_name)
+            processor = SimpleSpanProcessor(exporter) if processor_type == "simple" else BatchSpanProcessor(exporter)
+            
+            provider = TracerProvider(resource=Resource.create({"service.name": service_name}))
+            provider.add_span_processor(processor)
+            trace.set_tracer_provider(provider)
+            
+            _tracing_observer = TracingObserver(trace.get_tracer("meeting-analyzer.pipeline"))
+            add_span_observer(_tracing_observer)
+            
+            print(f"OpenTelemetry tracing enabled with {exporter_name} exporter")
+            return True
+        except Exception as e:
+            print(f"Error setting up tracing: {str(e)}")
+            return False
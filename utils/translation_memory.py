@@ -0,0 +1,217 @@
+# utils/translation_memory.py
+"""
+Segment-level translation memory
+
+Text to translate is split into segments (lines, and sentences within a
+line). Each segment's translation is remembered under its normalized text,
+the source and target languages and the model, so boilerplate that recurs
+across Meetings (standing agenda items, recurring action items) is only
+translated once. The translator sends only the segments the memory doesn't
+have to the LLM.
+
+The memory is kept in local JSON files (TRANSLATION_MEMORY=local, the
+default, under TRANSLATION_MEMORY_DIR) or in MongoDB
+(TRANSLATION_MEMORY=mongodb).
+"""
+import hashlib
+import json
+import os
+import re
+import threading
+from datetime import datetime
+from utils.config import get_translation_memory_type, get_translation_memory_dir
+
+# A line's list marker and surrounding whitespace are kept out of its segments
+LINE_PATTERN = re.compile(r'^(\s*(?:[-*•]\s+|\d+[.)]\s+)?)(.*?)(\s*)$', re.DOTALL)
+SENTENCE_END_PATTERN = re.compile(r'(?<=[.!?])\s+')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+# Limits on the segments sent to the LLM in one request
+MAX_BATCH_CHARS = 3000
+MAX_BATCH_SEGMENTS = 40
+
+_memories = {}
+_memories_lock = threading.Lock()
+
+class LocalTranslationMemory:
+    """Translation memory in JSON files, one per file name prefix of the entry keys"""
+    
+    def __init__(self, directory):
+        """
+        Initialize the memory
+        
+        Args:
+            directory: Directory for the memory files
+        """
+        self.directory = directory
+        self.lock = threading.Lock()
+        self.shards = {}
+    
+    def _shard(self, key):
+        """Get the entries of the file a key belongs in, loading it if needed"""
+        shard_id = key[:2]
+        if shard_id not in self.shards:
+            path = os.path.join(self.directory, f"{shard_id}.json")
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8") as f:
+                    self.shards[shard_id] = json.load(f)
+            else:
+                self.shards[shard_id] = {}
+        return self.shards[shard_id]
+    
+    def get_many(self, keys):
+        """Get the translations for the keys found"""
+        with self.lock:
+            translations = {}
+            for key in keys:
+                entry = self._shard(key).get(key)
+                if entry is not None:
+                    translations[key] = entry["translation"]
+            return translations
+    
+    def put_many(self, entries):
+        """Store entries, replacing existing ones with the same key"""
+        with self.lock:
+            changed_shards = set()
+            for entry in entries:
+                self._shard(entry["_id"])[entry["_id"]] = {k: v for k, v in entry.items() if k != "_id"}
+                changed_shards.add(entry["_id"][:2])
+            
+            if changed_shards and not os.path.exists(self.directory):
+                os.makedirs(self.directory, exist_ok=True)
+            
+            # Write to a temporary file first so a crash never leaves a truncated file
+            for shard_id in changed_shards:
+                path = os.path.join(self.directory, f"{shard_id}.json")
+                temp_path = f"{path}.tmp"
+                with open(temp_path, "w", encoding="utf-8") as f:
+                    json.dump(self.shards[shard_id], f, ensure_ascii=False)
+                os.replace(temp_path, path)
+
+class MongoTranslationMemory:
+    """Translation memory in MongoDB, one document per entry"""
+    
+    def get_many(self, keys):
+        """Get the translations for the keys found"""
+        from database.mongodb import get_translation_memory_entries
+        return get_translation_memory_entries(keys)
+    
+    def put_many(self, entries):
+        """Store entries, replacing existing ones with the same key"""
+        from database.mongodb import store_translation_memory_entries
+        store_translation_memory_entries(entries)
+
+def get_translation_memory():
+    """
+    Get the configured translation memory
+    
+    Returns:
+        LocalTranslationMemory/MongoTranslationMemory: Memory, or None if it is off
+    """
+    memory_type = get_translation_memory_type()
+    if memory_type is None:
+        return None
+    
+    with _memories_lock:
+        if memory_type not in _memories:
+            if memory_type == "local":
+                _memories[memory_type] = LocalTranslationMemory(get_translation_memory_dir())
+            elif memory_type == "mongodb":
+                _memories[memory_type] = MongoTranslationMemory()
+            else:
+                raise ValueError(f"Unknown translation memory: {memory_type}")
+        return _memories[memory_type]
+
+def normalize_segment(segment):
+    """Normalize a segment for lookup (whitespace only; case and punctuation affect translations)"""
+    return WHITESPACE_PATTERN.sub(" ", segment).strip()
+
+def split_segments(text):
+    """
+    Split text into translatable segments and the layout between them
+    
+    Args:
+        text: Text to translate
+    
+    Returns:
+        list: (segment, layout) pairs, where segment is None for layout-only pieces
+              (line breaks, list markers); joining every segment and layout gives back the text
+    """
+    pieces = []
+    
+    for line in text.splitlines(keepends=True):
+        prefix, content, suffix = LINE_PATTERN.match(line).groups()
+        if prefix:
+            pieces.append((None, prefix))
+        
+        start = 0
+        for match in SENTENCE_END_PATTERN.finditer(content):
+            pieces.append((content[start:match.start()], None))
+            pieces.append((None, match.group()))
+            start = match.end()
+        if start < len(content):
+            pieces.append((content[start:], None))
+        
+        if suffix:
+            pieces.append((None, suffix))
+    
+    return pieces
+
+def memory_key(segment, source_language, target_language, model):
+    """
+    Get the memory key of a segment
+    
+    Args:
+        segment: Normalized segment
+        source_language: Source language ("auto" if unknown)
+        target_language: Target language
+        model: Model that translates the segment
+    
+    Returns:
+        str: Entry key
+    """
+    digest = hashlib.sha256()
+    for part in (source_language.lower(), target_language.lower(), model, segment):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+def memory_entry(key, segment, translation, source_language, target_language, model):
+    """Build the stored entry for a translated segment"""
+    return {
+        "_id": key,
+        "segment": segment,
+        "translation": translation,
+        "source_language": source_language.lower(),
+        "target_language": target_language.lower(),
+        "model": model,
+        "updated_at": datetime.now().isoformat()
+    }
+
+def batch_segments(segments, max_chars=MAX_BATCH_CHARS, max_segments=MAX_BATCH_SEGMENTS):
+    """
+    Group segments into batches for translation requests
+    
+    Args:
+        segments: Segments to translate
+        max_chars: Maximum characters per batch (a longer segment gets a batch of its own)
+        max_segments: Maximum segments per batch
+    
+    Returns:
+        list: Lists of segments
+    """
+    batches = []
+    batch = []
+    size = 0
+    
+    for segment in segments:
+        if batch and (size + len(segment) > max_chars or len(batch) >= max_segments):
+            batches.append(batch)
+            batch, size = [], 0
+        batch.append(segment)
+        size += len(segment)
+    
+    if batch:
+        batches.append(batch)
+    
+    return batches